@@ -13,9 +13,11 @@ BigQuery 클라이언트 모듈
     # 적재 (upsert - 중복시 업데이트)
     upsert_df(df, "products", key_columns=["product_code"])
 """
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 from google.oauth2 import service_account
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -23,6 +25,9 @@ from typing import List, Optional
 KEY_PATH = Path(__file__).parent / "daiso-analysis-4d05c813a295.json"
 DEFAULT_DATASET = "daiso"
 
+# load job 1회당 최대 행 수 (큰 DataFrame은 나눠서 적재)
+LOAD_CHUNK_ROWS = 10_000
+
 # 테이블별 Primary Key 매핑
 TABLE_KEYS = {
     "brands": ["brand_id"],
@@ -39,8 +44,9 @@ TABLE_KEYS = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_client() -> bigquery.Client:
-    """BigQuery 클라이언트 반환"""
+    """BigQuery 클라이언트 반환 (프로세스 내 1회 생성 후 재사용)"""
     credentials = service_account.Credentials.from_service_account_file(str(KEY_PATH))
     return bigquery.Client(credentials=credentials, project=credentials.project_id)
 
@@ -81,6 +87,52 @@ def get_table_count(table: str, dataset: str = DEFAULT_DATASET) -> int:
     return int(query_to_df(sql)['cnt'].iloc[0])
 
 
+def _load_df_chunked(client: bigquery.Client, df: pd.DataFrame, table_id: str, write_disposition: str,
+                     schema: Optional[list] = None) -> None:
+    """DataFrame을 LOAD_CHUNK_ROWS 단위 load job으로 적재 (첫 청크만 write_disposition 적용, 이후 APPEND)"""
+    for start in range(0, max(len(df), 1), LOAD_CHUNK_ROWS):
+        job_config = bigquery.LoadJobConfig(
+            write_disposition=(
+                write_disposition if start == 0
+                else bigquery.WriteDisposition.WRITE_APPEND
+            ),
+            source_format=bigquery.SourceFormat.PARQUET,
+        )
+        if schema is not None:
+            job_config.schema = schema
+        job = client.load_table_from_dataframe(
+            df.iloc[start:start + LOAD_CHUNK_ROWS], table_id, job_config=job_config
+        )
+        job.result()
+
+
+def _replace_table_chunked(client: bigquery.Client, df: pd.DataFrame, dataset: str, table: str) -> None:
+    """
+    여러 청크로 나눠야 하는 전체 교체 적재
+
+    임시 테이블에 모든 청크를 적재한 뒤 copy job 한 번으로 교체
+    (중간 청크가 실패해도 원본 테이블은 비거나 일부만 적재된 상태로 남지 않음)
+    """
+    table_id = f"{client.project}.{dataset}.{table}"
+    temp_table = f"{client.project}.{dataset}._temp_replace_{table}"
+
+    # 임시 테이블도 원본 스키마로 적재 (copy 시 원본 스키마가 바뀌지 않도록)
+    try:
+        schema = client.get_table(table_id).schema
+    except NotFound:
+        schema = None
+
+    try:
+        _load_df_chunked(client, df, temp_table, bigquery.WriteDisposition.WRITE_TRUNCATE, schema=schema)
+        job = client.copy_table(
+            temp_table, table_id,
+            job_config=bigquery.CopyJobConfig(write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE),
+        )
+        job.result()
+    finally:
+        client.delete_table(temp_table, not_found_ok=True)
+
+
 def insert_df(
     df: pd.DataFrame,
     table: str,
@@ -102,16 +154,17 @@ def insert_df(
     client = get_client()
     table_id = f"{client.project}.{dataset}.{table}"
 
-    job_config = bigquery.LoadJobConfig(
-        write_disposition=(
-            bigquery.WriteDisposition.WRITE_TRUNCATE
-            if if_exists == "replace"
-            else bigquery.WriteDisposition.WRITE_APPEND
-        )
-    )
+    # 전체 교체는 원자적으로: 한 번의 load job으로 끝나지 않으면 임시 테이블을 거쳐 교체
+    if if_exists == "replace" and len(df) > LOAD_CHUNK_ROWS:
+        _replace_table_chunked(client, df, dataset, table)
+        return len(df)
 
-    job = client.load_table_from_dataframe(df, table_id, job_config=job_config)
-    job.result()
+    write_disposition = (
+        bigquery.WriteDisposition.WRITE_TRUNCATE
+        if if_exists == "replace"
+        else bigquery.WriteDisposition.WRITE_APPEND
+    )
+    _load_df_chunked(client, df, table_id, write_disposition)
 
     return len(df)
 
@@ -148,11 +201,7 @@ def upsert_df(
 
     # 임시 테이블에 데이터 적재
     temp_table = f"{project}.{dataset}._temp_{table}"
-    job_config = bigquery.LoadJobConfig(
-        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
-    )
-    job = client.load_table_from_dataframe(df, temp_table, job_config=job_config)
-    job.result()
+    _load_df_chunked(client, df, temp_table, bigquery.WriteDisposition.WRITE_TRUNCATE)
 
     # MERGE 쿼리 생성
     target_table = f"`{project}.{dataset}.{table}`"
@@ -1,7 +1,7 @@
 """
 크롤러 데이터 → BigQuery ETL 모듈
 
-크롤러에서 수집한 CSV 데이터를 BigQuery ERD 스키마에 맞게 변환하고 적재합니다.
+크롤러에서 수집한 CSV(또는 Parquet) 데이터를 BigQuery ERD 스키마에 맞게 변환하고 적재합니다.
 
 사용법:
     from etl_loader import CrawlerETL
@@ -34,6 +34,13 @@ except ImportError:
     )
 
 
+def _read_source(path: str) -> pd.DataFrame:
+    """크롤러 출력 파일 로드 (.parquet이면 Parquet, 아니면 CSV)"""
+    if str(path).endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
 class CrawlerETL:
     """크롤러 데이터 → BigQuery 변환 및 적재"""
 
@@ -99,14 +106,11 @@ class CrawlerETL:
 
         # 새 brand_id 할당
         max_id = max(brands_map.values()) if brands_map else 0
-        new_data = []
-        for i, name in enumerate(new_brands, start=1):
-            new_id = max_id + i
-            new_data.append({"brand_id": new_id, "name": name})
-            brands_map[name] = new_id
-
-        # BigQuery에 삽입
-        df_new = pd.DataFrame(new_data)
+        new_ids = range(max_id + 1, max_id + 1 + len(new_brands))
+        brands_map.update(zip(new_brands, new_ids))
+
+        # BigQuery에 삽입 (행 dict 없이 컬럼 단위로 구성)
+        df_new = pd.DataFrame({"brand_id": new_ids, "name": new_brands})
         insert_df(df_new, "brands", self.dataset)
         print(f"새 브랜드 {len(new_brands)}개 등록: {new_brands}")
 
@@ -124,18 +128,15 @@ class CrawlerETL:
             return users_map
 
         max_id = self.get_max_user_id()
-        new_data = []
-        for i, masked in enumerate(new_users, start=1):
-            new_id = max_id + i
-            new_data.append({
-                "user_id": new_id,
-                "user_masked": masked,
-                "activity_level": None,
-                "rating_tendency": None
-            })
-            users_map[masked] = new_id
-
-        df_new = pd.DataFrame(new_data)
+        new_ids = range(max_id + 1, max_id + 1 + len(new_users))
+        users_map.update(zip(new_users, new_ids))
+
+        df_new = pd.DataFrame({
+            "user_id": new_ids,
+            "user_masked": new_users,
+            "activity_level": None,
+            "rating_tendency": None
+        })
         insert_df(df_new, "users", self.dataset)
         print(f"새 사용자 {len(new_users)}명 등록")
 
@@ -153,18 +154,15 @@ class CrawlerETL:
             return ing_map
 
         max_id = max(ing_map.values()) if ing_map else 0
-        new_data = []
-        for i, name in enumerate(new_ings, start=1):
-            new_id = max_id + i
-            new_data.append({
-                "ingredient_id": new_id,
-                "name": name,
-                "ewg_grade": None,
-                "is_caution": None
-            })
-            ing_map[name] = new_id
-
-        df_new = pd.DataFrame(new_data)
+        new_ids = range(max_id + 1, max_id + 1 + len(new_ings))
+        ing_map.update(zip(new_ings, new_ids))
+
+        df_new = pd.DataFrame({
+            "ingredient_id": new_ids,
+            "name": new_ings,
+            "ewg_grade": None,
+            "is_caution": None
+        })
         insert_df(df_new, "ingredients_master", self.dataset)
         print(f"새 성분 {len(new_ings)}개 등록")
 
@@ -190,7 +188,7 @@ class CrawlerETL:
         Returns:
             (products 적재 수, metrics 적재 수, attributes 적재 수)
         """
-        df = pd.read_csv(csv_path)
+        df = _read_source(csv_path)
         print(f"제품 CSV 로드: {len(df)}행")
 
         # 브랜드 등록 및 매핑
@@ -254,7 +252,7 @@ class CrawlerETL:
         Returns:
             (reviews 적재 수, review_analysis 적재 수)
         """
-        df = pd.read_csv(csv_path)
+        df = _read_source(csv_path)
         print(f"리뷰 CSV 로드: {len(df)}행")
 
         # 사용자 등록 및 매핑
@@ -314,7 +312,7 @@ class CrawlerETL:
         Returns:
             (product_ingredients 적재 수, attributes 업데이트 수)
         """
-        df = pd.read_csv(csv_path)
+        df = _read_source(csv_path)
         print(f"성분 CSV 로드: {len(df)}행")
 
         # product_id → product_code 이름 통일
@@ -20,9 +20,16 @@ CRAWLING_CONFIG = {
     # 헤드리스 모드 (False = 브라우저 창 보임)
     'headless': True,
 
+    # 병렬 크롤링 워커 수 (워커마다 브라우저 1개)
+    'max_workers': 4,
+
     # 데이터 저장 경로
     'data_dir': 'data',
     'log_dir': 'logs',
+
+    # 제품 상세 크롤링 결과 캐시 (재실행 시 같은 URL은 페이지 로드 없이 재사용)
+    'cache_dir': 'cache',
+    'crawl_cache_ttl_days': 7,
 }
 
 # 다이소몰 설정
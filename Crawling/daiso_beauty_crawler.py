@@ -8,19 +8,27 @@
 import os
 import sys
 import time
+import argparse
 import re
+import csv
+import json
+import base64
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
-import pandas as pd
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import count, repeat
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from config import DAISO_BEAUTY_CATEGORIES
+from config import DAISO_BEAUTY_CATEGORIES, CRAWLING_CONFIG
+from modules.driver_setup import DriverPool
 from modules.ocr_utils_split import extract_text_from_image_url_split, extract_text_bottom_up_3920
 from modules.halal_vegan_checker import check_halal_vegan_status
 from modules.ingredient_parser import (
@@ -30,7 +38,7 @@ from modules.ingredient_parser import (
     extract_product_section,
     INGREDIENT_KEYWORDS
 )
-from utils import setup_logger, get_date_string
+from utils import setup_logger, get_date_string, extract_rating, extract_review_count, scroll_page, csv_to_parquet
 
 # BigQuery 모듈 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -40,13 +48,269 @@ try:
 except ImportError:
     BIGQUERY_AVAILABLE = False
 
+# 선택 모듈: google-re2 (선형 시간 DFA 엔진, 없으면 표준 re 사용)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # 로거 설정
 logger = setup_logger('daiso_beauty_crawler', 'daiso_beauty_crawler.log')
 
 # 기본 설정
 BASE_URL = "https://www.daisomall.co.kr"
 MAX_SCROLLS = 10
-user_id_map = defaultdict(lambda: f"user_{len(user_id_map)+1:04d}")
+# 리뷰 작성자 id (같은 날 CSV에 이어쓰는 경우 _restore_user_ids로 기존 매핑과 다음 번호를 복원)
+_user_id_seq = count(1)
+user_id_map = defaultdict(lambda: f"user_{next(_user_id_seq):04d}")
+_user_id_lock = threading.Lock()
+
+# chromedriver 경로 캐시 (ChromeDriverManager 버전 확인은 프로세스당 1회)
+_DRIVER_PATH = None
+
+# 제품 상세 크롤링 결과 캐시 (SQLite, main()에서 열고 워커 스레드가 공유)
+_CRAWL_CACHE = None
+_crawl_cache_lock = threading.Lock()
+
+# CSV 컬럼 (스트리밍 저장용)
+PRODUCT_FIELDS = [
+    "product_code", "category_home", "category_1", "category_2", "brand", "name",
+    "price", "country", "likes", "shares", "url", "can_할랄인증", "can_비건", "certifications",
+]
+REVIEW_FIELDS = ["product_code", "date", "user_masked", "user", "rating", "text", "image_count"]
+INGREDIENT_FIELDS = ["product_id", "name", "ingredient", "can_halal", "can_vegan", "not_halal"]
+# 제품 행 기본값 템플릿 (제품마다 dict 리터럴을 새로 만들지 않고 복사 후 변하는 값만 갱신)
+PRODUCT_TEMPLATE = {
+    **dict.fromkeys(PRODUCT_FIELDS, ""),
+    "likes": 0,
+    "shares": 0,
+    "can_할랄인증": "Unknown",
+    "can_비건": "Unknown",
+}
+CSV_BUFFER_SIZE = 1 << 20
+# 파일명에 쓸 수 없는 문자 치환 테이블 ('/', ':' → '_', 공백 제거)
+FILENAME_TRANS = str.maketrans({'/': '_', ':': '_', ' ': None})
+PDNO_PATTERN = re.compile(r"pdNo=([A-Z0-9]+)")
+PDNO_DIGITS_PATTERN = re.compile(r"pdNo=(\d+)")
+PAGE_CODE_PATTERN = re.compile(r"품번\s*(\d+)")
+
+# 에디터 영역 이미지 (picture 태그 안의 img와 직접 img 태그 모두)
+EDITOR_IMG_SELECTOR = "div.editor-content picture img, div.editor-content > img"
+# alt는 성분 관련 키워드(arguments[1])가 있는 것만 반환하고 나머지는 ''로 비움 (배너/썸네일 alt 전송 생략)
+# 키워드 검사는 원문과 줄바꿈 평탄화본 모두에 대해 수행 (_parse_alt_text의 긴 ALT 검사와 동일)
+EDITOR_IMAGES_JS = """
+const keywords = arguments[1];
+return Array.from(document.querySelectorAll(arguments[0]), img => {
+    const alt = img.alt || '';
+    const flat = alt.split('\\n').join(' ').split('  ').join(' ');
+    const relevant = keywords.some(k => alt.includes(k) || flat.includes(k));
+    return [relevant ? alt : '', img.src || ''];
+});
+"""
+
+# 카테고리 제품 카드 링크 (href, 없으면 outerHTML) 한 번에 추출
+PRODUCT_LINKS_JS = "return Array.from(document.getElementsByClassName('prod-thumb__link'), a => [a.href || '', a.href ? '' : a.outerHTML]);"
+
+# 리뷰 카드 필드 한 번에 추출 (필수 요소가 없는 카드는 null)
+REVIEW_CARDS_JS = """
+return Array.from(document.getElementsByClassName('review-detail'), r => {
+    const date = r.querySelector('.cw-bar-list');
+    const user = r.querySelector('.con-writer-id');
+    const rating = r.querySelector('.hiddenText');
+    const text = r.querySelector('.review-desc .cont');
+    if (!date || !user || !rating || !text) return null;
+    return [date.innerText, user.innerText, rating.textContent, text.innerText,
+            r.querySelectorAll('.swiper-wrapper img').length];
+});
+"""
+
+# 리뷰 다음 페이지 버튼 상태 확인 + 클릭을 한 번에 처리 (클릭했으면 true, 마지막 페이지면 false)
+NEXT_REVIEW_PAGE_JS = """
+const btn = document.querySelector('.btn-next');
+if (!btn || btn.disabled || (btn.className || '').includes('disabled')
+        || (btn.getAttribute('style') || '').includes('pointer-events: none')) return false;
+btn.click();
+return true;
+"""
+
+# 제품 상세 기본 정보 텍스트 한 번에 추출 (요소가 없으면 null)
+BASIC_INFO_JS = """
+const text = sel => { const el = document.querySelector(sel); return el ? el.innerText.trim() : null; };
+const firstText = sels => { for (const sel of sels) { const t = text(sel); if (t) return t; } return null; };
+const country = document.evaluate("//th[contains(text(),'제조국')]/following-sibling::td",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+return {
+    brand: text('a.brand-area div.brand-area__detail div.detail-title'),
+    title: text('h1.product-title'),
+    name: firstText(['h1.product-title', '.info-area h1', '.product-info-wrap h1']),
+    option: text('.product-option-text, .option-text, .selected-option'),
+    price: text('.prod-price--detail .price-value .value') ?? text('.inner-box .price-value .value'),
+    code: text('.code-text'),
+    country: country ? country.innerText.trim() : null,
+    counts: Array.from(document.getElementsByClassName('btn__count'), el => el.innerText),
+};
+"""
+
+# 성분 헤더 키워드 (이것이 있으면 ALT를 신뢰)
+ALT_HEADER_KEYWORDS = ['전성분', '성분:', '모든성분', '화장품법', 'INGREDIENTS', 'Ingredients', '성분 :', '[성분명]', '성분명', '[전성분]']
+
+# 대표 성분명 (헤더 없이도 성분 섹션 감지용 - OCR과 동일)
+COMMON_INGREDIENTS_ALT = [
+    '정제수', '글리세린', '부틸렌글라이콜', '프로판다이올', '나이아신아마이드',
+    '히알루론산', '판테놀', '알란토인', '토코페롤', '카보머', '페녹시에탄올',
+    '향료', '시트릭애씨드', '다이메티콘', '스쿠알란', '세틸알코올',
+    '글리세레스', '헥산다이올', '소듐하이알루로네이트', '알지닌', '세린',
+]
+
+# 키워드 리터럴 이스케이프용 (re/re2 공통 문법의 메타문자만 이스케이프 - re.escape는 공백도 이스케이프해 re2가 거부)
+_REGEX_META_PATTERN = re.compile(r'([\\.^$|?*+()\[\]{}])')
+
+
+def _compile_keyword_pattern(keywords):
+    """
+    키워드 리터럴 alternation 컴파일
+
+    google-re2가 설치되어 있으면 DFA 엔진으로 컴파일해 긴 ALT 텍스트도 키워드 수와 무관하게 한 번에 스캔
+    (표준 re는 위치마다 대안을 하나씩 시도), 없거나 컴파일 실패 시 표준 re 사용
+    """
+    pattern = '|'.join(_REGEX_META_PATTERN.sub(r'\\\1', kw) for kw in dict.fromkeys(keywords))
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception as e:
+            logger.debug(f"re2 컴파일 실패 (re 사용): {str(e)}")
+    return re.compile(pattern)
+
+
+# ALT 사전 필터 키워드 (브라우저에서 이 중 하나라도 포함된 alt만 가져옴)
+ALT_MARKER_KEYWORDS = list(dict.fromkeys(ALT_HEADER_KEYWORDS + INGREDIENT_KEYWORDS + COMMON_INGREDIENTS_ALT))
+
+# ALT 헤더/성분 키워드 포함 여부를 각각 한 번의 검색으로 검사 (키워드별 `in` 반복 대신)
+ALT_HEADER_PATTERN = _compile_keyword_pattern(ALT_HEADER_KEYWORDS)
+ALT_INGREDIENT_PATTERN = _compile_keyword_pattern(INGREDIENT_KEYWORDS)
+
+# 성분 출처 태그(ALT_3, OCR_0_2, OCR_BU_1 등) → 비트 위치
+_SOURCE_INDEX = {}
+# 출처 종류별 비트마스크 (태그에 'ALT'/'OCR' 포함 여부 기준)
+_SOURCE_KIND_MASKS = {'ALT': 0, 'OCR': 0}
+_source_lock = threading.Lock()
+
+
+def _source_bit(tag: str) -> int:
+    """출처 태그에 대응하는 비트 반환 (처음 보는 태그는 새 비트 할당)"""
+    idx = _SOURCE_INDEX.get(tag)
+    if idx is None:
+        with _source_lock:
+            idx = _SOURCE_INDEX.get(tag)
+            if idx is None:
+                idx = _SOURCE_INDEX[tag] = len(_SOURCE_INDEX)
+                for kind in _SOURCE_KIND_MASKS:
+                    if kind in tag:
+                        _SOURCE_KIND_MASKS[kind] |= 1 << idx
+    return 1 << idx
+
+
+def _collect_image_bytes(driver, urls: list) -> dict:
+    """
+    페이지 렌더링 중 브라우저가 이미 받은 이미지 바이트를 CDP로 회수
+
+    performance 로그의 Network.responseReceived 이벤트에서 대상 URL의 requestId를 찾아
+    Network.getResponseBody로 본문을 가져온다. 실패한 URL은 OCR 단계에서 직접 다운로드.
+
+    Returns:
+        {url: bytes}
+    """
+    targets = set(u for u in urls if u)
+    if not targets:
+        return {}
+
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        logger.debug(f"performance 로그 조회 실패: {str(e)}")
+        return {}
+
+    request_ids = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        if message.get('method') != 'Network.responseReceived':
+            continue
+        params = message.get('params', {})
+        response = params.get('response', {})
+        url = response.get('url')
+        if url in targets and response.get('mimeType', '').startswith('image/'):
+            request_ids[url] = params.get('requestId')
+
+    image_cache = {}
+    for url, request_id in request_ids.items():
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            data = body.get('body', '')
+            image_cache[url] = base64.b64decode(data) if body.get('base64Encoded') else data.encode('latin-1')
+        except Exception as e:
+            logger.debug(f"이미지 바디 회수 실패 (직접 다운로드): {url} - {str(e)}")
+
+    if image_cache:
+        logger.debug(f"브라우저 캐시 이미지 재사용: {len(image_cache)}/{len(targets)}개")
+    return image_cache
+
+
+@lru_cache(maxsize=4096)
+def _extract_alt_section(section: str, source: str) -> tuple:
+    """
+    ALT 섹션 성분 파싱 (같은 브랜드/라인은 성분 이미지 ALT를 공유하므로 캐시)
+
+    결과 dict는 여러 제품이 공유하므로 호출 측에서 읽기만 해야 함
+    """
+    return tuple(extract_from_text(section, source=source))
+
+
+def _parse_alt_text(idx: int, alt_text: str, product_name: str) -> tuple:
+    """
+    ALT 텍스트 하나에서 성분 후보 추출 (드라이버 호출 없는 순수 파싱)
+
+    Returns:
+        (헤더 키워드 여부, extract_from_text 결과 튜플)
+    """
+    # 긴 ALT 텍스트 처리 (100자 이상)
+    if alt_text and len(alt_text) > 100:
+        # 줄바꿈 제거 후 키워드 검색
+        alt_text_flat = alt_text.replace('\n', ' ').replace('  ', ' ')
+        logger.debug(f"ALT_{idx} 길이: {len(alt_text)}, 첫 100자: {alt_text_flat[:100]}...")
+
+        # 헤더 키워드 확인
+        has_header = bool(ALT_HEADER_PATTERN.search(alt_text_flat))
+        if has_header:
+            logger.debug(f"ALT_{idx}에서 헤더 키워드 발견")
+
+        # 대표 성분명 개수 확인 (헤더 없어도 성분 섹션 감지)
+        common_ing_count = sum(1 for ing in COMMON_INGREDIENTS_ALT if ing in alt_text_flat)
+
+        # 헤더가 있거나, 대표 성분명이 3개 이상이면 성분 섹션으로 판단
+        if has_header or ALT_INGREDIENT_PATTERN.search(alt_text_flat) or common_ing_count >= 3:
+            if common_ing_count >= 3 and not has_header:
+                logger.info(f"ALT_{idx}에서 대표 성분명 {common_ing_count}개 감지 (헤더 없음) → 성분 추출 시도")
+
+            # 멀티 제품/옵션 텍스트에서 해당 제품 섹션만 추출
+            alt_text_section = extract_product_section(alt_text_flat, product_name)
+            return has_header, _extract_alt_section(alt_text_section, f"ALT_{idx}")
+        return has_header, ()
+
+    # 짧은 ALT 텍스트 처리 (100자 이하) - 빈 ALT는 바로 건너뜀
+    if not alt_text:
+        return False, ()
+
+    # 헤더 키워드 확인 (전성분, 성분: 등)
+    has_header = bool(ALT_HEADER_PATTERN.search(alt_text))
+
+    if ALT_INGREDIENT_PATTERN.search(alt_text):
+        # 멀티 제품/옵션 텍스트에서 해당 제품 섹션만 추출
+        alt_text_section = extract_product_section(alt_text, product_name)
+        return has_header, _extract_alt_section(alt_text_section, f"ALT_{idx}")
+    return has_header, ()
 
 
 def extract_ingredients_multi_source(driver, product_code: str, product_name: str) -> list:
@@ -56,86 +320,44 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
     Returns:
         list of dicts with: product_id, name, ingredient, can_halal, can_vegan, not_halal
     """
-    all_ingredients = {}  # {성분명: {confidence, sources[], reason}}
+    all_ingredients = {}  # {성분명: {confidence, source_mask, source_count, reason}}
+
+    # 에디터 이미지의 (alt, src)를 한 번의 JS 호출로 수집 (이미지마다 get_attribute 왕복 방지)
+    try:
+        images = driver.execute_script(EDITOR_IMAGES_JS, EDITOR_IMG_SELECTOR, ALT_MARKER_KEYWORDS) or []
+    except Exception as e:
+        logger.debug(f"에디터 이미지 수집 실패: {str(e)}")
+        images = []
 
     # 소스 1: Picture alt 속성
-    # 성분 헤더 키워드 (이것이 있으면 ALT를 신뢰)
-    HEADER_KEYWORDS = ['전성분', '성분:', '모든성분', '화장품법', 'INGREDIENTS', 'Ingredients', '성분 :', '[성분명]', '성분명', '[전성분]']
     alt_has_header = False  # ALT에 "전성분" 같은 헤더가 있는지
 
-    # 대표 성분명 (헤더 없이도 성분 섹션 감지용 - OCR과 동일)
-    COMMON_INGREDIENTS_ALT = [
-        '정제수', '글리세린', '부틸렌글라이콜', '프로판다이올', '나이아신아마이드',
-        '히알루론산', '판테놀', '알란토인', '토코페롤', '카보머', '페녹시에탄올',
-        '향료', '시트릭애씨드', '다이메티콘', '스쿠알란', '세틸알코올',
-        '글리세레스', '헥산다이올', '소듐하이알루로네이트', '알지닌', '세린',
-    ]
-
     try:
-        # picture 태그 안의 img와 직접 img 태그 모두 찾기
-        pictures = driver.find_elements(By.CSS_SELECTOR, "div.editor-content picture img, div.editor-content > img")
-
-        for idx, img in enumerate(pictures):
-            alt_text = img.get_attribute("alt") or ""
-
-            # 긴 ALT 텍스트 처리 (100자 이상)
-            if alt_text and len(alt_text) > 100:
-                # 줄바꿈 제거 후 키워드 검색
-                alt_text_flat = alt_text.replace('\n', ' ').replace('  ', ' ')
-                logger.debug(f"ALT_{idx} 길이: {len(alt_text)}, 첫 100자: {alt_text_flat[:100]}...")
-
-                # 헤더 키워드 확인
-                has_header = any(kw in alt_text_flat for kw in HEADER_KEYWORDS)
-                if has_header:
-                    alt_has_header = True
-                    logger.debug(f"ALT_{idx}에서 헤더 키워드 발견")
-
-                # 대표 성분명 개수 확인 (헤더 없어도 성분 섹션 감지)
-                common_ing_count = sum(1 for ing in COMMON_INGREDIENTS_ALT if ing in alt_text_flat)
-
-                # 헤더가 있거나, 대표 성분명이 3개 이상이면 성분 섹션으로 판단
-                if has_header or any(kw in alt_text_flat for kw in INGREDIENT_KEYWORDS) or common_ing_count >= 3:
-                    if common_ing_count >= 3 and not has_header:
-                        logger.info(f"ALT_{idx}에서 대표 성분명 {common_ing_count}개 감지 (헤더 없음) → 성분 추출 시도")
-
-                    # 멀티 제품/옵션 텍스트에서 해당 제품 섹션만 추출
-                    alt_text_section = extract_product_section(alt_text_flat, product_name)
-                    alt_ingredients = extract_from_text(alt_text_section, source=f"ALT_{idx}")
-
-                    for ing in alt_ingredients:
-                        name = normalize_ingredient_name(ing['ingredient'])
-                        is_valid, conf, reason = is_valid_ingredient(name)
-
-                        if is_valid and conf >= 0.5:
-                            if name not in all_ingredients:
-                                all_ingredients[name] = {'confidence': conf, 'sources': [ing['source']], 'reason': reason}
-                            else:
-                                all_ingredients[name]['sources'].append(ing['source'])
-                                all_ingredients[name]['confidence'] = min(1.0, all_ingredients[name]['confidence'] + 0.1)
-                continue
-
-            # 짧은 ALT 텍스트 처리 (100자 이하)
-            # 헤더 키워드 확인 (전성분, 성분: 등)
-            if any(kw in alt_text for kw in HEADER_KEYWORDS):
+        # 사전 필터: 키워드 없는 alt는 브라우저에서 이미 비워져 옴 → 남은 alt가 없으면 ALT 분석 생략
+        alts = [alt for alt, _ in images]
+        if not any(alts):
+            logger.debug("ALT에 성분 키워드 없음 → ALT 분석 생략")
+            alts = []
+
+        # ALT별 파싱은 서로 독립적인 순수 Python 작업 → 먼저 모두 파싱한 뒤 순서대로 병합
+        for has_header, alt_ingredients in map(_parse_alt_text, range(len(alts)), alts, repeat(product_name)):
+            if has_header:
                 alt_has_header = True
 
-            if any(kw in alt_text for kw in INGREDIENT_KEYWORDS):
-                # 멀티 제품/옵션 텍스트에서 해당 제품 섹션만 추출
-                alt_text_section = extract_product_section(alt_text, product_name)
-                alt_ingredients = extract_from_text(alt_text_section, source=f"ALT_{idx}")
+            for ing in alt_ingredients:
+                name = normalize_ingredient_name(ing['ingredient'])
+                is_valid, conf, reason = is_valid_ingredient(name)
 
-                for ing in alt_ingredients:
-                    name = normalize_ingredient_name(ing['ingredient'])
-                    is_valid, conf, reason = is_valid_ingredient(name)
+                if is_valid and conf >= 0.5:
+                    if name not in all_ingredients:
+                        all_ingredients[name] = {'confidence': conf, 'source_mask': _source_bit(ing['source']), 'source_count': 1, 'reason': reason}
+                    else:
+                        all_ingredients[name]['source_mask'] |= _source_bit(ing['source'])
+                        all_ingredients[name]['source_count'] += 1
+                        all_ingredients[name]['confidence'] = min(1.0, all_ingredients[name]['confidence'] + 0.1)
 
-                    if is_valid and conf >= 0.5:
-                        if name not in all_ingredients:
-                            all_ingredients[name] = {'confidence': conf, 'sources': [ing['source']], 'reason': reason}
-                        else:
-                            all_ingredients[name]['sources'].append(ing['source'])
-                            all_ingredients[name]['confidence'] = min(1.0, all_ingredients[name]['confidence'] + 0.1)
-
-        alt_count = len([k for k in all_ingredients if any('ALT' in s for s in all_ingredients[k]['sources'])])
+        alt_mask = _SOURCE_KIND_MASKS['ALT']
+        alt_count = sum(1 for info in all_ingredients.values() if info['source_mask'] & alt_mask)
         logger.info(f"ALT에서 성분 발견: 총 {alt_count}개 (헤더 키워드: {'있음' if alt_has_header else '없음'})")
 
     except Exception as e:
@@ -159,14 +381,16 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
             # ALT에서 추출된 성분 목록 (검증용)
             alt_ingredients_set = set(all_ingredients.keys()) if ocr_mode == "검증" else set()
 
-            # picture 태그 안의 img와 직접 img 태그 모두 찾기
-            pictures = driver.find_elements(By.CSS_SELECTOR, "div.editor-content picture img, div.editor-content > img")
+            # 앞서 수집한 에디터 이미지 src 재사용
+            image_srcs = [src for _, src in images]
+            # OCR 대상(마지막 2개) 이미지는 브라우저가 이미 받은 바이트 재사용
+            image_cache = _collect_image_bytes(driver, image_srcs[-2:])
             ocr_only_count = 0
             verified_count = 0
 
             # 이미지 유형 판별: 긴 이미지 1장 vs 작은 이미지 여러장
             # picture 태그가 2개 이상이면 멀티 이미지로 판단
-            is_multi_image = len(pictures) >= 2
+            is_multi_image = len(image_srcs) >= 2
 
             # 대표 성분명 키워드 (헤더 없이 성분명만 있는 경우 감지용)
             COMMON_INGREDIENTS = [
@@ -179,17 +403,15 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
 
             if is_multi_image:
                 # 멀티 이미지 케이스: 마지막 2개 이미지에서 전성분 찾기 (기존 로직 유지)
-                logger.info(f"멀티 이미지 감지: {len(pictures)}개 이미지 → 마지막 2개에서 전성분 탐색")
-                target_images = list(pictures[-2:])
+                logger.info(f"멀티 이미지 감지: {len(image_srcs)}개 이미지 → 마지막 2개에서 전성분 탐색")
+                target_images = list(image_srcs[-2:])
                 target_images.reverse()  # 마지막 이미지 먼저
                 num_sections = 1  # 작은 이미지는 분할 불필요
 
-                for idx, img in enumerate(target_images):
-                    src = img.get_attribute("src")
-
+                for idx, src in enumerate(target_images):
                     if src:
                         logger.info(f"OCR 분석 중 ({ocr_mode} 모드): 이미지 {idx + 1}/{len(target_images)}")
-                        sections = extract_text_from_image_url_split(src, num_sections=num_sections)
+                        sections = extract_text_from_image_url_split(src, num_sections=num_sections, image_bytes=image_cache.get(src))
 
                         # 전체 텍스트에서 성분 키워드 존재 여부 확인
                         all_section_text = ' '.join([s.get('text', '') for s in sections or []])
@@ -218,10 +440,11 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
 
                                     if is_valid and conf >= 0.5:
                                         if name not in all_ingredients:
-                                            all_ingredients[name] = {'confidence': conf, 'sources': [ing['source']], 'reason': reason}
+                                            all_ingredients[name] = {'confidence': conf, 'source_mask': _source_bit(ing['source']), 'source_count': 1, 'reason': reason}
                                             ocr_only_count += 1
                                         else:
-                                            all_ingredients[name]['sources'].append(ing['source'])
+                                            all_ingredients[name]['source_mask'] |= _source_bit(ing['source'])
+                                            all_ingredients[name]['source_count'] += 1
                                             all_ingredients[name]['confidence'] = min(1.0, all_ingredients[name]['confidence'] + 0.15)
                                             verified_count += 1
 
@@ -229,50 +452,50 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
 
             else:
                 # 싱글 이미지 케이스 (긴 이미지): Bottom-Up 3920px OCR
-                logger.info(f"싱글/대형 이미지 감지: {len(pictures)}개 이미지 → Bottom-Up 3920px OCR 적용")
+                logger.info(f"싱글/대형 이미지 감지: {len(image_srcs)}개 이미지 → Bottom-Up 3920px OCR 적용")
 
                 # 마지막 이미지 사용 (주로 긴 이미지가 하나)
-                last_img = pictures[-1] if pictures else None
-                if last_img:
-                    src = last_img.get_attribute("src")
-                    if src:
-                        logger.info(f"OCR 분석 중 ({ocr_mode} 모드): Bottom-Up 3920px")
-                        sections = extract_text_bottom_up_3920(src)
-
-                        # 전체 텍스트에서 성분 키워드 존재 여부 확인
-                        all_section_text = ' '.join([s.get('text', '') for s in sections or []])
-
-                        has_header = any(kw in all_section_text for kw in INGREDIENT_KEYWORDS)
-                        common_ing_count = sum(1 for ing in COMMON_INGREDIENTS if ing in all_section_text)
-                        has_ingredient_section = has_header or common_ing_count >= 3
-
-                        if has_ingredient_section:
-                            logger.info(f"Bottom-Up OCR에서 전성분 키워드 발견!")
-                            found_ingredients_in_ocr = True
-
-                            for section_idx, section in enumerate(sections or []):
-                                text = section.get('text', '')
-                                text_section = extract_product_section(text, product_name)
-                                ocr_ingredients = extract_from_text(text_section, source=f"OCR_BU_{section_idx}", force_mode=True)
-
-                                for ing in ocr_ingredients:
-                                    name = normalize_ingredient_name(ing['ingredient'])
-                                    is_valid, conf, reason = is_valid_ingredient(name)
-                                    conf *= 0.9
-
-                                    if is_valid and conf >= 0.5:
-                                        if name not in all_ingredients:
-                                            all_ingredients[name] = {'confidence': conf, 'sources': [ing['source']], 'reason': reason}
-                                            ocr_only_count += 1
-                                        else:
-                                            all_ingredients[name]['sources'].append(ing['source'])
-                                            all_ingredients[name]['confidence'] = min(1.0, all_ingredients[name]['confidence'] + 0.15)
-                                            verified_count += 1
+                src = image_srcs[-1] if image_srcs else None
+                if src:
+                    logger.info(f"OCR 분석 중 ({ocr_mode} 모드): Bottom-Up 3920px")
+                    sections = extract_text_bottom_up_3920(src, image_bytes=image_cache.get(src))
+
+                    # 전체 텍스트에서 성분 키워드 존재 여부 확인
+                    all_section_text = ' '.join([s.get('text', '') for s in sections or []])
+
+                    has_header = any(kw in all_section_text for kw in INGREDIENT_KEYWORDS)
+                    common_ing_count = sum(1 for ing in COMMON_INGREDIENTS if ing in all_section_text)
+                    has_ingredient_section = has_header or common_ing_count >= 3
+
+                    if has_ingredient_section:
+                        logger.info(f"Bottom-Up OCR에서 전성분 키워드 발견!")
+                        found_ingredients_in_ocr = True
+
+                        for section_idx, section in enumerate(sections or []):
+                            text = section.get('text', '')
+                            text_section = extract_product_section(text, product_name)
+                            ocr_ingredients = extract_from_text(text_section, source=f"OCR_BU_{section_idx}", force_mode=True)
+
+                            for ing in ocr_ingredients:
+                                name = normalize_ingredient_name(ing['ingredient'])
+                                is_valid, conf, reason = is_valid_ingredient(name)
+                                conf *= 0.9
+
+                                if is_valid and conf >= 0.5:
+                                    if name not in all_ingredients:
+                                        all_ingredients[name] = {'confidence': conf, 'source_mask': _source_bit(ing['source']), 'source_count': 1, 'reason': reason}
+                                        ocr_only_count += 1
+                                    else:
+                                        all_ingredients[name]['source_mask'] |= _source_bit(ing['source'])
+                                        all_ingredients[name]['source_count'] += 1
+                                        all_ingredients[name]['confidence'] = min(1.0, all_ingredients[name]['confidence'] + 0.15)
+                                        verified_count += 1
 
             if ocr_mode == "검증":
                 logger.info(f"OCR 교차 검증: {verified_count}개 성분 확인, OCR에서만 발견: {ocr_only_count}개")
             else:
-                logger.info(f"OCR에서 추가 성분: 총 {len([k for k in all_ingredients if any('OCR' in s for s in all_ingredients[k]['sources'])])}개")
+                ocr_mask = _SOURCE_KIND_MASKS['OCR']
+                logger.info(f"OCR에서 추가 성분: 총 {sum(1 for info in all_ingredients.values() if info['source_mask'] & ocr_mask)}개")
 
         except Exception as e:
             logger.error(f"OCR 실패: {str(e)}")
@@ -282,7 +505,7 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
 
     for name, info in all_ingredients.items():
         # 여러 소스에서 발견된 성분 우선
-        multi_source_bonus = len(info['sources']) * 0.05
+        multi_source_bonus = info['source_count'] * 0.05
         final_conf = min(1.0, info['confidence'] + multi_source_bonus)
 
         # 신뢰도 50% 이상만 포함
@@ -308,11 +531,14 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
     logger.info(f"최종 성분: {len(final_ingredients)}개")
 
     # 할랄/비건 통계 (Unknown도 의심으로 카운트)
-    vegan_count = len([x for x in final_ingredients if x['can_vegan'] == 'Yes'])
-    vegan_unknown = len([x for x in final_ingredients if x['can_vegan'] == 'Unknown'])
-    non_vegan_count = len([x for x in final_ingredients if x['can_vegan'] == 'No'])
-    halal_questionable = len([x for x in final_ingredients if x['can_halal'] in ('Questionable', 'Unknown')])
-    haram_count = len([x for x in final_ingredients if x['can_halal'] == 'No'])
+    # 판정값별 개수를 한 번의 순회로 집계 (판정마다 리스트를 다시 만들지 않음)
+    vegan_counts = Counter(x['can_vegan'] for x in final_ingredients)
+    halal_counts = Counter(x['can_halal'] for x in final_ingredients)
+    vegan_count = vegan_counts['Yes']
+    vegan_unknown = vegan_counts['Unknown']
+    non_vegan_count = vegan_counts['No']
+    halal_questionable = halal_counts['Questionable'] + halal_counts['Unknown']
+    haram_count = halal_counts['No']
 
     logger.info(f"할랄/비건 분석:")
     logger.info(f"  - 비건 적합: {vegan_count}개 | 확인필요: {vegan_unknown}개 | 부적합: {non_vegan_count}개")
@@ -321,6 +547,55 @@ def extract_ingredients_multi_source(driver, product_code: str, product_name: st
     return final_ingredients
 
 
+def get_driver_path() -> str:
+    """
+    chromedriver 경로 반환 (CHROMEDRIVER 환경변수 우선, 없으면 최초 1회만 설치/확인)
+
+    webdriver_manager가 없으면 None을 반환하고 Selenium Manager(4.6+)가 경로를 찾음
+    """
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        _DRIVER_PATH = os.environ.get('CHROMEDRIVER')
+        if not _DRIVER_PATH:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _DRIVER_PATH = ChromeDriverManager().install()
+            except ImportError:
+                _DRIVER_PATH = ''
+    return _DRIVER_PATH or None
+
+
+def create_chrome_driver(driver_path: str = None, load_images: bool = True, headless: bool = None):
+    """
+    크롤링용 Chrome 드라이버 생성
+
+    Args:
+        driver_path: chromedriver 경로 (None이면 get_driver_path())
+        load_images: False면 이미지 로딩 차단 (성분 OCR을 하지 않을 때만 사용)
+        headless: 헤드리스 모드 여부 (None일 경우 config 사용)
+    """
+    if headless is None:
+        headless = CRAWLING_CONFIG['headless']
+
+    options = webdriver.ChromeOptions()
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    if headless:
+        # 창 렌더링/GPU 합성 생략 (스크롤 높이 계산을 위해 창 크기는 일반 모드와 동일하게 지정)
+        options.add_argument('--headless=new')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+    if load_images:
+        # OCR 단계에서 이미지 바이트를 재사용할 수 있도록 Network 이벤트를 performance 로그로 수집
+        # (이미지를 받지 않는 실행에서는 쓰이지 않고 chromedriver에 이벤트만 쌓이므로 켜지 않음)
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    else:
+        # 이미지 다운로드/디코딩 생략 (img 요소와 src/alt 속성은 DOM에 그대로 남음)
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        options.add_argument('--blink-settings=imagesEnabled=false')
+    return webdriver.Chrome(service=Service(driver_path or get_driver_path()), options=options)
+
+
 def get_category_url(middle_code, small_code):
     """카테고리 URL 생성"""
     return f"{BASE_URL}/ds/exhCtgr/C208/CTGR_00014/{middle_code}/{small_code}"
@@ -335,22 +610,18 @@ def get_all_product_links(driver, category_url, category_name):
         EC.presence_of_element_located((By.CLASS_NAME, "product-list"))
     )
 
-    # 페이지 스크롤
-    for _ in range(MAX_SCROLLS):
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
+    # 페이지 스크롤 (높이 변화가 없으면 조기 종료)
+    scroll_page(driver, scroll_pause=2, max_scrolls=MAX_SCROLLS)
 
-    # 제품 링크 수집
-    items = driver.find_elements(By.CLASS_NAME, "prod-thumb__link")
+    # 제품 링크 수집 (카드별 get_attribute 대신 한 번의 스크립트 호출)
+    items = driver.execute_script(PRODUCT_LINKS_JS) or []
     links = []
 
-    for item in items:
-        href = item.get_attribute("href")
+    for href, html in items:
         if href and "pdNo=" in href:
             links.append(href)
         else:
-            html = item.get_attribute("outerHTML")
-            match = re.search(r"pdNo=(\d+)", html)
+            match = PDNO_DIGITS_PATTERN.search(html or href)
             if match:
                 pdno = match.group(1)
                 full_url = f"{BASE_URL}/pd/pdr/SCR_PDR_0001?pdNo={pdno}&recmYn=N"
@@ -361,16 +632,11 @@ def get_all_product_links(driver, category_url, category_name):
     return dedup
 
 
-def extract_brand(driver, category_2=""):
-    """브랜드 추출"""
+def extract_brand(brand_text, product_title, category_2=""):
+    """브랜드 추출 (브랜드 영역 텍스트, h1 제품명 텍스트는 BASIC_INFO_JS 결과)"""
     # 1. 브랜드 영역에서 추출 시도 (최우선)
-    try:
-        title_elem = driver.find_element(By.CSS_SELECTOR, "a.brand-area div.brand-area__detail div.detail-title")
-        brand_text = title_elem.text.strip()
-        if brand_text:
-            return brand_text
-    except:
-        pass
+    if brand_text:
+        return brand_text
 
     # 2. 브랜드 영역이 없는 경우
     # 2-1. 화장품이 아닌 카테고리는 "다이소"로 설정
@@ -378,17 +644,9 @@ def extract_brand(driver, category_2=""):
     if category_2 in non_cosmetic_categories:
         return "다이소"
 
-    # 2-2. 일반 제품은 제품명에서 첫 단어 추출
-    try:
-        product_title_elem = driver.find_element(By.CSS_SELECTOR, "h1.product-title")
-        product_title = product_title_elem.text.strip()
-        if product_title:
-            # 첫 번째 띄어쓰기 전까지
-            first_word = product_title.split()[0] if product_title.split() else ""
-            if first_word:
-                return first_word
-    except:
-        pass
+    # 2-2. 일반 제품은 제품명에서 첫 단어 추출 (첫 번째 띄어쓰기 전까지)
+    if product_title and product_title.split():
+        return product_title.split()[0]
 
     return ""
 
@@ -444,7 +702,7 @@ def _extract_basic_info(driver, product: dict, url_pdno: str, category_2: str) -
     """
     # 리다이렉트 체크
     current_url = driver.current_url
-    current_pdno_match = re.search(r"pdNo=([A-Z0-9]+)", current_url)
+    current_pdno_match = PDNO_PATTERN.search(current_url)
 
     if current_pdno_match:
         current_pdno = current_pdno_match.group(1)
@@ -455,71 +713,48 @@ def _extract_basic_info(driver, product: dict, url_pdno: str, category_2: str) -
     else:
         logger.warning(f"현재 URL에서 pdNo 추출 불가: {current_url}")
 
+    # 기본 정보 텍스트를 한 번의 스크립트 호출로 수집
+    try:
+        info = driver.execute_script(BASIC_INFO_JS) or {}
+    except Exception as e:
+        logger.warning(f"기본 정보 추출 실패: {str(e)}")
+        info = {}
+
     # 브랜드
-    product["brand"] = extract_brand(driver, category_2)
+    product["brand"] = extract_brand(info.get("brand"), info.get("title"), category_2)
 
     # 제품명 추출
-    name_selectors = ["h1.product-title", ".info-area h1", ".product-info-wrap h1"]
-    for selector in name_selectors:
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, selector)
-            product["name"] = element.text.strip()
-            if product["name"]:
-                logger.info(f"제품명 추출 성공: {product['name'][:50]}")
-                break
-        except:
-            continue
+    if info.get("name"):
+        product["name"] = info["name"]
+        logger.info(f"제품명 추출 성공: {product['name'][:50]}")
 
     # 옵션 정보 추가
-    if product["name"]:
-        try:
-            option_element = driver.find_element(By.CSS_SELECTOR, ".product-option-text, .option-text, .selected-option")
-            option_text = option_element.text.strip()
-            if option_text and option_text not in product["name"]:
-                product["name"] = f"{product['name']} ({option_text})"
-        except:
-            pass
+    option_text = info.get("option")
+    if product["name"] and option_text and option_text not in product["name"]:
+        product["name"] = f"{product['name']} ({option_text})"
 
     # 가격 추출
-    try:
-        price_element = driver.find_element(By.CSS_SELECTOR, ".prod-price--detail .price-value .value")
-        product["price"] = price_element.text.strip().replace(",", "")
-    except:
-        try:
-            price_element = driver.find_element(By.CSS_SELECTOR, ".inner-box .price-value .value")
-            product["price"] = price_element.text.strip().replace(",", "")
-        except:
-            pass
+    if info.get("price") is not None:
+        product["price"] = info["price"].replace(",", "")
 
     # 페이지 품번 확인 및 검증
-    try:
-        code_text = driver.find_element(By.CLASS_NAME, "code-text").text
-        match = re.search(r"품번\s*(\d+)", code_text)
-        if match:
-            page_product_code = match.group(1)
-            if page_product_code != url_pdno:
-                logger.warning(f"품번 불일치! URL: {url_pdno}, 페이지: {page_product_code}")
-                product["product_code"] = page_product_code
-                url_pdno = page_product_code
-    except:
-        pass
+    match = PAGE_CODE_PATTERN.search(info.get("code") or "")
+    if match:
+        page_product_code = match.group(1)
+        if page_product_code != url_pdno:
+            logger.warning(f"품번 불일치! URL: {url_pdno}, 페이지: {page_product_code}")
+            product["product_code"] = page_product_code
+            url_pdno = page_product_code
 
     # 제조국
-    try:
-        product["country"] = driver.find_element(
-            By.XPATH, "//th[contains(text(),'제조국')]/following-sibling::td"
-        ).text.strip()
-    except:
-        pass
+    if info.get("country") is not None:
+        product["country"] = info["country"]
 
     # 좋아요/공유
-    try:
-        counts = driver.find_elements(By.CLASS_NAME, "btn__count")
-        if len(counts) >= 2:
-            product["likes"] = parse_count(counts[0].text)
-            product["shares"] = parse_count(counts[1].text)
-    except:
-        pass
+    counts = info.get("counts") or []
+    if len(counts) >= 2:
+        product["likes"] = extract_review_count(counts[0])
+        product["shares"] = extract_review_count(counts[1])
 
     return url_pdno
 
@@ -530,18 +765,19 @@ def _extract_reviews(driver, product_code: str) -> list:
 
     for page in range(1, 999):
         time.sleep(1)
-        review_elements = driver.find_elements(By.CLASS_NAME, "review-detail")
-        logger.debug(f"{page}페이지 리뷰 수: {len(review_elements)}")
+        # 페이지의 리뷰 카드 전체를 한 번의 스크립트 호출로 추출
+        review_cards = driver.execute_script(REVIEW_CARDS_JS) or []
+        logger.debug(f"{page}페이지 리뷰 수: {len(review_cards)}")
 
-        for r in review_elements:
+        for card in review_cards:
             try:
-                date = r.find_element(By.CLASS_NAME, "cw-bar-list").text.split()[0]
-                user_raw = r.find_element(By.CLASS_NAME, "con-writer-id").text.strip()
-                rating_raw = r.find_element(By.CLASS_NAME, "hiddenText").text.strip()
-                text = r.find_element(By.CSS_SELECTOR, ".review-desc .cont").text.strip()
-                image_count = len(r.find_elements(By.CSS_SELECTOR, ".swiper-wrapper img"))
-                rating = extract_rating(rating_raw)
-                user_id = user_id_map[user_raw]
+                date_raw, user_raw, rating_raw, text, image_count = card
+                date = date_raw.split()[0]
+                user_raw = user_raw.strip()
+                text = text.strip()
+                rating = extract_rating(rating_raw.strip())
+                with _user_id_lock:
+                    user_id = user_id_map[user_raw]
 
                 reviews.append({
                     "product_code": product_code,
@@ -555,16 +791,10 @@ def _extract_reviews(driver, product_code: str) -> list:
             except:
                 continue
 
-        # 다음 페이지
+        # 다음 페이지 (버튼 탐색/상태 확인/클릭을 한 번의 스크립트 호출로)
         try:
-            next_btn = driver.find_element(By.CLASS_NAME, "btn-next")
-            next_class = next_btn.get_attribute("class") or ""
-            next_style = next_btn.get_attribute("style") or ""
-
-            if ("disabled" in next_class) or (not next_btn.is_enabled()) or ("pointer-events: none" in next_style):
+            if not driver.execute_script(NEXT_REVIEW_PAGE_JS):
                 break
-
-            driver.execute_script("arguments[0].click();", next_btn)
             time.sleep(1)
         except:
             break
@@ -614,27 +844,27 @@ def _extract_ingredients_and_certifications(driver, product: dict) -> list:
 
 def _determine_halal_vegan_status(product: dict, ingredients: list):
     """할랄/비건 인증 가능 여부 판정"""
+    # 판정값별 개수를 한 번씩만 순회해서 집계
+    vegan_counts = Counter(ing.get('can_vegan') for ing in ingredients)
+    halal_counts = Counter(ing.get('can_halal') for ing in ingredients)
+
     # 비건 판정
-    non_vegan = [ing for ing in ingredients if ing.get('can_vegan') == 'No']
-    if non_vegan:
+    if vegan_counts['No']:
         product['can_비건'] = 'No'
-        logger.info(f"비건 부적합: {len(non_vegan)}개 동물성 성분")
-    elif any(ing.get('can_vegan') == 'Unknown' for ing in ingredients):
+        logger.info(f"비건 부적합: {vegan_counts['No']}개 동물성 성분")
+    elif vegan_counts['Unknown']:
         product['can_비건'] = 'Unknown'
     else:
         product['can_비건'] = 'Yes'
 
     # 할랄 판정
-    haram = [ing for ing in ingredients if ing.get('can_halal') == 'No']
-    questionable = [ing for ing in ingredients if ing.get('can_halal') == 'Questionable']
-
-    if haram:
+    if halal_counts['No']:
         product['can_할랄인증'] = 'No'
-        logger.info(f"할랄 부적합: {len(haram)}개 부적합 성분")
-    elif questionable:
+        logger.info(f"할랄 부적합: {halal_counts['No']}개 부적합 성분")
+    elif halal_counts['Questionable']:
         product['can_할랄인증'] = 'Questionable'
-        logger.info(f"할랄 원료확인 필요: {len(questionable)}개 의심 성분")
-    elif any(ing.get('can_halal') == 'Unknown' for ing in ingredients):
+        logger.info(f"할랄 원료확인 필요: {halal_counts['Questionable']}개 의심 성분")
+    elif halal_counts['Unknown']:
         product['can_할랄인증'] = 'Unknown'
     else:
         product['can_할랄인증'] = 'Yes'
@@ -643,7 +873,7 @@ def _determine_halal_vegan_status(product: dict, ingredients: list):
 def crawl_product_detail(driver, url, category_home, category_1, category_2, crawl_reviews=True, crawl_ingredients=True):
     """제품 상세 정보 크롤링 (리팩토링됨)"""
     # URL에서 pdNo 추출
-    url_pdno_match = re.search(r"pdNo=([A-Z0-9]+)", url)
+    url_pdno_match = PDNO_PATTERN.search(url)
     if not url_pdno_match:
         logger.error(f"URL에서 pdNo 추출 실패: {url}")
         return None, [], []
@@ -651,23 +881,15 @@ def crawl_product_detail(driver, url, category_home, category_1, category_2, cra
     url_pdno = url_pdno_match.group(1)
     logger.info(f"제품 크롤링 시작 - pdNo: {url_pdno}")
 
-    # 제품 정보 초기화
-    product = {
-        "product_code": url_pdno,
-        "category_home": category_home,
-        "category_1": category_1,
-        "category_2": category_2,
-        "brand": "",
-        "name": "",
-        "price": "",
-        "country": "",
-        "likes": 0,
-        "shares": 0,
-        "url": url,
-        "can_할랄인증": "Unknown",
-        "can_비건": "Unknown",
-        "certifications": "",
-    }
+    # 제품 정보 초기화 (기본값 템플릿 복사)
+    product = dict(PRODUCT_TEMPLATE)
+    product.update(
+        product_code=url_pdno,
+        category_home=category_home,
+        category_1=category_1,
+        category_2=category_2,
+        url=url,
+    )
 
     # 1. 페이지 로드
     driver.get(url)
@@ -710,8 +932,117 @@ def crawl_product_detail(driver, url, category_home, category_1, category_2, cra
     return product, reviews, ingredients
 
 
-def select_categories():
-    """중분류/소분류 선택"""
+def _open_crawl_cache(path: str):
+    """크롤링 결과 캐시 DB 열기 (WAL 모드, 워커 스레드 공유)"""
+    global _CRAWL_CACHE
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    # 카테고리도 키에 포함 (category_1/2 컬럼과 브랜드 판정이 카테고리에 따라 달라짐)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS product_cache ('
+        'url TEXT, category_1 TEXT, category_2 TEXT, reviews INTEGER, ingredients INTEGER, json TEXT, ts INTEGER, '
+        'PRIMARY KEY (url, category_1, category_2, reviews, ingredients))'
+    )
+    _CRAWL_CACHE = conn
+
+
+def _close_crawl_cache():
+    """크롤링 결과 캐시 DB 닫기"""
+    global _CRAWL_CACHE
+    if _CRAWL_CACHE is not None:
+        _CRAWL_CACHE.close()
+        _CRAWL_CACHE = None
+
+
+def _get_cached_product(url: str, category_1: str, category_2: str, crawl_reviews: bool, crawl_ingredients: bool):
+    """
+    캐시된 제품 크롤링 결과 조회 (카테고리/수집 대상 조합이 같고 TTL 이내인 것만)
+
+    리뷰 작성자 id(user)는 실행마다 새로 매기므로 user_masked를 이번 실행의 user_id_map으로 다시 매핑
+
+    Returns:
+        (product, reviews, ingredients) 또는 None
+    """
+    if _CRAWL_CACHE is None:
+        return None
+    with _crawl_cache_lock:
+        row = _CRAWL_CACHE.execute(
+            'SELECT json, ts FROM product_cache '
+            'WHERE url = ? AND category_1 = ? AND category_2 = ? AND reviews = ? AND ingredients = ?',
+            (url, category_1, category_2, int(crawl_reviews), int(crawl_ingredients))
+        ).fetchone()
+    if not row or time.time() - row[1] > CRAWLING_CONFIG['crawl_cache_ttl_days'] * 86400:
+        return None
+    product, reviews, ingredients = json.loads(row[0])
+    with _user_id_lock:
+        for review in reviews:
+            review['user'] = user_id_map[review['user_masked']]
+    return product, reviews, ingredients
+
+
+def _put_cached_product(url: str, category_1: str, category_2: str, crawl_reviews: bool, crawl_ingredients: bool,
+                        result: tuple):
+    """
+    제품 크롤링 결과 캐시 저장
+
+    성분 수집 대상인데 성분이 비어 있으면 (추출 실패 포함) 저장하지 않음
+    리뷰는 실행별 user id를 빼고 user_masked만 저장
+    """
+    if _CRAWL_CACHE is None:
+        return
+    product, reviews, ingredients = result
+    if crawl_ingredients and not ingredients:
+        return
+    reviews = [{k: v for k, v in review.items() if k != 'user'} for review in reviews]
+    with _crawl_cache_lock:
+        _CRAWL_CACHE.execute(
+            'INSERT OR REPLACE INTO product_cache VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (url, category_1, category_2, int(crawl_reviews), int(crawl_ingredients),
+             json.dumps((product, reviews, ingredients), ensure_ascii=False, default=str), int(time.time()))
+        )
+        _CRAWL_CACHE.commit()
+
+
+def _crawl_with_pool(driver_pool, seen_codes, seen_lock, link, category_1, category_2, crawl_reviews, crawl_ingredients):
+    """드라이버 풀에서 브라우저를 빌려 제품 1개 크롤링 (워커 스레드용)"""
+    # 크롤링 도중 다른 링크(리다이렉트/품번 불일치)로 이미 수집된 pdNo면 페이지 로드 없이 스킵
+    pdno_match = PDNO_PATTERN.search(link)
+    if pdno_match:
+        with seen_lock:
+            if pdno_match.group(1) in seen_codes:
+                logger.info(f"이미 수집된 제품 - 스킵: pdNo={pdno_match.group(1)}")
+                return None, [], []
+
+    # 이전 실행(다른 날짜 파일 포함)에서 크롤링한 URL이면 브라우저 없이 캐시 결과 사용
+    cached = _get_cached_product(link, category_1, category_2, crawl_reviews, crawl_ingredients)
+    if cached is not None:
+        logger.info(f"캐시된 제품 결과 사용: {link}")
+        return cached
+
+    # 크롤링 후 별도 지연 없이 반납 (_wait_for_page_load의 고정 대기가 워커별 요청 간격 역할)
+    with driver_pool.acquire() as driver:
+        result = crawl_product_detail(
+            driver, link,
+            category_home="뷰티/위생",
+            category_1=category_1,
+            category_2=category_2,
+            crawl_reviews=crawl_reviews,
+            crawl_ingredients=crawl_ingredients
+        )
+    if result[0]:
+        _put_cached_product(link, category_1, category_2, crawl_reviews, crawl_ingredients, result)
+    return result
+
+
+def select_categories(middle_choice: str = None, small_choice: str = None):
+    """
+    중분류/소분류 선택
+
+    Args:
+        middle_choice: 중분류 번호 (None이면 입력 받음, "0"은 전체)
+        small_choice: 소분류 번호, 쉼표 구분 (None이면 입력 받음, "0"은 전체)
+    """
     print("\n" + "="*60)
     print("다이소 뷰티/위생 카테고리 크롤러")
     print("="*60)
@@ -723,7 +1054,8 @@ def select_categories():
         print(f"{idx}. {cat}")
     print("0. 전체")
 
-    choice = input("\n선택 (번호 입력): ").strip()
+    choice = middle_choice if middle_choice is not None else input("\n선택 (번호 입력): ")
+    choice = choice.strip()
 
     if choice == "0":
         selected_middle = middle_categories
@@ -746,7 +1078,8 @@ def select_categories():
             print(f"{idx}. {name}")
         print("0. 전체")
 
-        choice = input("\n선택 (번호 입력, 여러 개는 쉼표로 구분): ").strip()
+        choice = small_choice if small_choice is not None else input("\n선택 (번호 입력, 여러 개는 쉼표로 구분): ")
+        choice = choice.strip()
 
         if choice == "0":
             for code, name in small_list:
@@ -764,8 +1097,13 @@ def select_categories():
     return selected_categories
 
 
-def select_crawl_targets():
-    """크롤링 대상 선택"""
+def select_crawl_targets(choice: str = None):
+    """
+    크롤링 대상 선택
+
+    Args:
+        choice: 대상 번호 1~5 (None이면 입력 받음)
+    """
     print("\n[크롤링 대상 선택]")
     print("1. 제품 정보만")
     print("2. 제품 정보 + 리뷰")
@@ -773,7 +1111,9 @@ def select_crawl_targets():
     print("4. 제품 코드 + 리뷰만")
     print("5. 전체 (제품 정보 + 리뷰 + 성분)")
 
-    choice = input("\n선택 (번호 입력): ").strip()
+    if choice is None:
+        choice = input("\n선택 (번호 입력): ")
+    choice = choice.strip()
 
     # (제품정보저장, 리뷰수집, 성분수집, 최소제품정보모드)
     targets = {
@@ -787,15 +1127,111 @@ def select_crawl_targets():
     return targets.get(choice, (True, False, False, False))
 
 
-def main():
+def _open_csv_writer(path: str, fieldnames: list):
+    """
+    CSV 파일을 이어쓰기 모드로 열고 DictWriter 반환 (새 파일이면 헤더 기록)
+
+    Returns:
+        (file, csv.DictWriter)
+    """
+    is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+    f = open(path, 'a', newline='', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE)
+    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+    if is_new:
+        writer.writeheader()
+    return f, writer
+
+
+def _load_crawled_codes(path: str, column: str) -> set:
+    """중단된 이전 실행의 CSV에서 이미 수집한 제품 코드 로드 (재시작용)"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return {row[column] for row in csv.DictReader(f) if row.get(column)}
+
+
+def _restore_user_ids(path: str):
+    """
+    이어쓰는 리뷰 CSV의 user_masked → user 매핑을 user_id_map에 복원
+
+    같은 작성자는 이전 실행과 같은 id를, 새 작성자는 기존 최대 번호 다음 id를 받도록 함
+    """
+    global _user_id_seq
+    if not os.path.exists(path):
+        return
+    max_num = 0
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            masked, user = row.get('user_masked'), row.get('user')
+            if not masked or not user:
+                continue
+            user_id_map.setdefault(masked, user)
+            num = user.rpartition('_')[2]
+            if num.isdigit():
+                max_num = max(max_num, int(num))
+    _user_id_seq = count(max_num + 1)
+
+
+def _csv_size(path: str) -> int:
+    """이어쓰기 전 CSV 크기 (이번 실행에서 추가한 행의 시작 위치)"""
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def _write_run_delta(path: str, start_offset: int, run_tag: str) -> str:
+    """
+    이번 실행에서 이어쓴 행만 담은 CSV 생성 (헤더 + start_offset 이후 바이트)
+
+    이전 실행분까지 다시 적재하지 않도록 BigQuery/Parquet 변환은 이 파일로 수행
+
+    Returns:
+        이번 실행분 CSV 경로 (파일 전체가 이번 실행분이면 원본 경로)
+    """
+    if start_offset == 0:
+        return path
+    delta_path = f"{os.path.splitext(path)[0]}_run{run_tag}.csv"
+    with open(path, 'rb') as src, open(delta_path, 'wb') as dst:
+        dst.write(src.readline())  # BOM + 헤더
+        src.seek(start_offset)
+        while True:
+            chunk = src.read(CSV_BUFFER_SIZE)
+            if not chunk:
+                break
+            dst.write(chunk)
+    return delta_path
+
+
+def parse_args(argv=None):
+    """
+    명령행 인자 파싱 (지정하지 않은 항목은 기존처럼 대화형으로 입력 받음)
+
+    예: python daiso_beauty_crawler.py --middle 1 --small 0 --target 5 --workers 4 --yes --bigquery n
+    """
+    parser = argparse.ArgumentParser(description='다이소 뷰티/위생 카테고리 크롤러')
+    parser.add_argument('--middle', type=str, default=None, help='중분류 번호 (0: 전체)')
+    parser.add_argument('--small', type=str, default=None, help='소분류 번호, 쉼표로 구분 (0: 전체, --middle 지정 시 기본값 0)')
+    parser.add_argument('--target', type=str, default=None, choices=['1', '2', '3', '4', '5'],
+                        help='크롤링 대상 (1: 제품 정보, 2: +리뷰, 3: 제품 코드+성분, 4: 제품 코드+리뷰, 5: 전체)')
+    parser.add_argument('--workers', type=int, default=None, help='병렬 워커(브라우저) 수 (기본: config max_workers)')
+    parser.add_argument('-y', '--yes', action='store_true', help='시작 확인 생략')
+    parser.add_argument('--bigquery', type=str, default=None, choices=['y', 'n'], help='BigQuery 적재 여부 (미지정 시 입력 받음)')
+    parser.add_argument('--no-cache', action='store_true', help='제품 크롤링 결과 캐시 사용 안 함 (항상 새로 크롤링)')
+    args = parser.parse_args(argv)
+    if args.middle is not None and args.small is None:
+        args.small = "0"
+    return args
+
+
+def main(argv=None):
     """메인 함수"""
+    args = parse_args(argv)
+
     # 카테고리 선택
-    categories = select_categories()
+    categories = select_categories(args.middle, args.small)
     if not categories:
         return
 
     # 크롤링 대상 선택
-    crawl_products, crawl_reviews, crawl_ingredients, minimal_mode = select_crawl_targets()
+    crawl_products, crawl_reviews, crawl_ingredients, minimal_mode = select_crawl_targets(args.target)
 
     print(f"\n{'='*60}")
     print(f"선택된 카테고리: {len(categories)}개")
@@ -810,51 +1246,132 @@ def main():
         print(f"크롤링 대상: 제품={crawl_products}, 리뷰={crawl_reviews}, 성분={crawl_ingredients}")
     print(f"{'='*60}")
 
-    confirm = input("\n시작하시겠습니까? (y/n): ").strip().lower()
+    confirm = 'y' if args.yes else input("\n시작하시겠습니까? (y/n): ").strip().lower()
     if confirm != 'y':
         print("취소되었습니다.")
         return
 
-    # 크롤링 시작
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    # CSV 저장 경로 - 하나의 파일로 통합
+    date_str = get_date_string()
+
+    # 카테고리 기반 파일명 생성
+    # categories: [(middle, middle_code, small_code, small_name), ...]
+    if categories:
+        # 중분류/소분류 추출 (순서 유지 중복 제거, 한 번 순회)
+        middle_names, small_names = {}, {}
+        for middle, _, _, small in categories:
+            middle_names[middle] = small_names[small] = None
 
-    all_products = []
-    all_reviews = []
-    all_ingredients = []
+        # 파일명용 문자열 생성 (특수문자 제거)
+        middle_str = '_'.join(middle_names)
+        small_str = '_'.join(small_names)
 
-    # 중복 방지용: 이미 크롤링한 product_code 추적
+        # 파일명에 사용할 수 없는 문자 제거/치환
+        category_suffix = f"{middle_str}_{small_str}".translate(FILENAME_TRANS)
+    else:
+        category_suffix = "all"
+
+    # data 디렉토리 생성
+    os.makedirs('data', exist_ok=True)
+
+    product_file = f'data/products_{category_suffix}_{date_str}.csv'
+    review_file = f'data/reviews_{category_suffix}_{date_str}.csv'
+    ingredient_file = f'data/ingredients_{category_suffix}_{date_str}.csv'
+
+    # 중복 방지용: 이미 크롤링한 product_code 추적 (중단된 이전 실행 포함)
     seen_product_codes = set()
+    if not minimal_mode:
+        seen_product_codes |= _load_crawled_codes(product_file, "product_code")
+    if crawl_reviews:
+        seen_product_codes |= _load_crawled_codes(review_file, "product_code")
+    if crawl_ingredients:
+        seen_product_codes |= _load_crawled_codes(ingredient_file, "product_id")
+    if seen_product_codes:
+        logger.info(f"이전 실행에서 수집된 제품 {len(seen_product_codes)}개 - 스킵")
+    seen_lock = threading.Lock()
 
-    try:
-        for middle, middle_code, small_code, small_name in categories:
-            logger.info(f"{'='*60}")
-            logger.info(f"카테고리: {middle} > {small_name}")
-            logger.info(f"{'='*60}")
+    # 이어쓰는 리뷰 파일의 작성자 id 복원 (다른 작성자가 같은 user id를 받지 않도록)
+    if crawl_reviews:
+        _restore_user_ids(review_file)
+
+    # 이번 실행분 시작 위치 (적재 시 이전 실행에서 이미 적재한 행 제외)
+    run_tag = time.strftime('%H%M%S')
+    start_offsets = {path: _csv_size(path) for path in (product_file, review_file, ingredient_file)}
+
+    # 제품 단위로 바로 디스크에 기록 (중단 시에도 수집분 보존)
+    open_files = []
+    product_writer = review_writer = ingredient_writer = None
+    if not minimal_mode:
+        product_f, product_writer = _open_csv_writer(product_file, PRODUCT_FIELDS)
+        open_files.append(product_f)
+    if crawl_reviews:
+        review_f, review_writer = _open_csv_writer(review_file, REVIEW_FIELDS)
+        open_files.append(review_f)
+    if crawl_ingredients:
+        ing_f, ingredient_writer = _open_csv_writer(ingredient_file, INGREDIENT_FIELDS)
+        open_files.append(ing_f)
 
-            # 카테고리 URL
-            category_url = get_category_url(middle_code, small_code)
+    product_count = 0
+    review_count = 0
+    ingredient_count = 0
 
-            # 제품 링크 수집
-            links = get_all_product_links(driver, category_url, small_name)
+    # 크롤링 시작
+    # 드라이버 풀 (워커마다 브라우저 1개, chromedriver 경로는 한 번만 확인)
+    max_workers = max(1, args.workers or CRAWLING_CONFIG['max_workers'])
+    driver_pool = None
+
+    try:
+        # 드라이버 경로 확인 실패 시에도 finally에서 열린 CSV 파일을 닫도록 try 안에서 수행
+        if not args.no_cache:
+            _open_crawl_cache(os.path.join(CRAWLING_CONFIG['cache_dir'], 'crawl_cache.db'))
+        driver_pool = DriverPool(
+            size=max_workers, factory=create_chrome_driver, reset=False,
+            driver_path=get_driver_path(), load_images=crawl_ingredients
+        )
 
-            # 각 제품 크롤링
-            for idx, link in enumerate(links, 1):
+        # 1. 카테고리별 제품 링크 수집
+        tasks = []
+        with driver_pool.acquire() as link_driver:
+            for middle, middle_code, small_code, small_name in categories:
+                logger.info(f"카테고리: {middle} > {small_name}")
+
+                # 카테고리 URL
+                category_url = get_category_url(middle_code, small_code)
+
+                # 제품 링크 수집
+                links = get_all_product_links(link_driver, category_url, small_name)
+                tasks.extend((link, middle, small_name) for link in links)
+
+        # 크롤링 전 중복 제거: 여러 카테고리에 중복 노출된 pdNo, 이전 실행에서 수집된 제품 제외
+        unique_tasks = {}
+        for task in tasks:
+            pdno_match = PDNO_PATTERN.search(task[0])
+            pdno = pdno_match.group(1) if pdno_match else task[0]
+            if pdno not in seen_product_codes:
+                unique_tasks.setdefault(pdno, task)
+        if len(unique_tasks) < len(tasks):
+            logger.info(f"중복/수집 완료 링크 {len(tasks) - len(unique_tasks)}개 제외")
+        tasks = list(unique_tasks.values())
+
+        # 2. 각 제품 병렬 크롤링 (결과 기록/중복 체크는 메인 스레드에서만 수행)
+        logger.info(f"총 {len(tasks)}개 제품 크롤링 시작 (워커 {max_workers}개)")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _crawl_with_pool, driver_pool, seen_product_codes, seen_lock, link, middle, small_name,
+                    crawl_reviews, crawl_ingredients
+                ): link
+                for link, middle, small_name in tasks
+            }
+
+            for idx, future in enumerate(as_completed(futures), 1):
+                link = futures[future]
                 try:
                     # URL에서 pdNo 미리 추출 (로깅용)
-                    pdno_match = re.search(r"pdNo=([A-Z0-9]+)", link)
+                    pdno_match = PDNO_PATTERN.search(link)
                     pdno_preview = pdno_match.group(1) if pdno_match else "알수없음"
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"[{idx}/{len(links)}] 제품 크롤링 - pdNo: {pdno_preview}")
-                    logger.info(f"{'='*60}")
-
-                    product, reviews, ingredients = crawl_product_detail(
-                        driver, link,
-                        category_home="뷰티/위생",
-                        category_1=middle,
-                        category_2=small_name,
-                        crawl_reviews=crawl_reviews,
-                        crawl_ingredients=crawl_ingredients
-                    )
+
+                    product, reviews, ingredients = future.result()
 
                     if product:
                         # 중복 체크
@@ -864,97 +1381,86 @@ def main():
                             continue
 
                         # 새로운 제품이면 추가
-                        seen_product_codes.add(product["product_code"])
+                        with seen_lock:
+                            seen_product_codes.add(product["product_code"])
 
                         # minimal_mode일 때는 제품 정보 저장 안 함
-                        if not minimal_mode:
-                            all_products.append(product)
-                        all_reviews.extend(reviews)
-                        all_ingredients.extend(ingredients)
-
-                        if minimal_mode:
-                            if crawl_reviews and not crawl_ingredients:
-                                logger.info(f"제품 코드 + 리뷰 크롤링 완료: [{product['name'][:40]}] | 리뷰: {len(reviews)}개")
-                            elif crawl_ingredients and not crawl_reviews:
-                                logger.info(f"제품 코드 + 성분 크롤링 완료: [{product['name'][:40]}] | 성분: {len(ingredients)}개")
-                            else:
-                                logger.info(f"제품 코드 크롤링 완료: [{product['name'][:40]}] | 리뷰: {len(reviews)}개 | 성분: {len(ingredients)}개")
-                        else:
-                            logger.info(f"제품 정보 + 리뷰 + 성분 크롤링 완료: [{product['name'][:40]}] | 리뷰: {len(reviews)}개 | 성분: {len(ingredients)}개")
-
-                    time.sleep(1)
+                        if product_writer:
+                            product_writer.writerow(product)
+                            product_count += 1
+                        if review_writer:
+                            review_writer.writerows(reviews)
+                            review_count += len(reviews)
+                        if ingredient_writer:
+                            ingredient_writer.writerows(ingredients)
+                            ingredient_count += len(ingredients)
+                        for f in open_files:
+                            f.flush()
+
+                        # 진행 로그 (수집 대상에 맞는 항목만 한 줄로)
+                        parts = [f"[{product['name'][:40]}]"]
+                        if crawl_reviews:
+                            parts.append(f"리뷰: {len(reviews)}개")
+                        if crawl_ingredients:
+                            parts.append(f"성분: {len(ingredients)}개")
+                        label = "제품 코드" if minimal_mode else "제품 정보"
+                        logger.info(f"[{idx}/{len(tasks)}] {label} 크롤링 완료 (pdNo: {pdno_preview}): " + " | ".join(parts))
 
                 except Exception as e:
                     logger.error(f"크롤링 실패: {link}")
                     logger.error(str(e))
                     continue
 
-        # CSV 저장 - 하나의 파일로 통합
-        date_str = get_date_string()
-
-        # 카테고리 기반 파일명 생성
-        # categories: [(middle, middle_code, small_code, small_name), ...]
-        if categories:
-            # 중분류 추출 (중복 제거)
-            middle_names = list(dict.fromkeys([cat[0] for cat in categories]))
-            # 소분류 추출 (중복 제거)
-            small_names = list(dict.fromkeys([cat[3] for cat in categories]))
-
-            # 파일명용 문자열 생성 (특수문자 제거)
-            middle_str = '_'.join(middle_names)
-            small_str = '_'.join(small_names)
-
-            # 파일명에 사용할 수 없는 문자 제거/치환
-            category_suffix = f"{middle_str}_{small_str}".replace('/', '_').replace(':', '_').replace(' ', '')
-        else:
-            category_suffix = "all"
-
-        # data 디렉토리 생성
-        os.makedirs('data', exist_ok=True)
+        for f in open_files:
+            f.close()
+        open_files = []
 
         # 제품 정보 저장 (하나의 파일)
-        if all_products and not minimal_mode:
-            df_products = pd.DataFrame(all_products)
-            product_file = f'data/products_{category_suffix}_{date_str}.csv'
-            df_products.to_csv(product_file, index=False, encoding='utf-8-sig')
-            logger.info(f"제품 정보 저장 완료: {product_file} ({len(df_products)}개)")
-            print(f"\n제품 정보: {product_file} ({len(df_products)}개)")
+        if product_count:
+            logger.info(f"제품 정보 저장 완료: {product_file} ({product_count}개)")
+            print(f"\n제품 정보: {product_file} ({product_count}개)")
 
         # 리뷰 저장 (하나의 파일)
-        if all_reviews:
-            df_reviews = pd.DataFrame(all_reviews)
-            review_file = f'data/reviews_{category_suffix}_{date_str}.csv'
-            df_reviews.to_csv(review_file, index=False, encoding='utf-8-sig')
-            logger.info(f"리뷰 저장 완료: {review_file} ({len(df_reviews)}개)")
-            print(f"리뷰: {review_file} ({len(df_reviews)}개)")
+        if review_count:
+            logger.info(f"리뷰 저장 완료: {review_file} ({review_count}개)")
+            print(f"리뷰: {review_file} ({review_count}개)")
 
         # 성분 저장 (하나의 파일)
-        if all_ingredients:
-            df_ingredients = pd.DataFrame(all_ingredients)
-            ingredient_file = f'data/ingredients_{category_suffix}_{date_str}.csv'
-            df_ingredients.to_csv(ingredient_file, index=False, encoding='utf-8-sig')
-            logger.info(f"성분 저장 완료: {ingredient_file} ({len(df_ingredients)}개)")
-            print(f"성분: {ingredient_file} ({len(df_ingredients)}개)")
+        if ingredient_count:
+            logger.info(f"성분 저장 완료: {ingredient_file} ({ingredient_count}개)")
+            print(f"성분: {ingredient_file} ({ingredient_count}개)")
+
+        # 이번 실행분만 적재 대상으로 (같은 날 이어쓴 파일이면 이번 실행에서 추가한 행만 분리)
+        # Parquet 사본 저장 (pyarrow가 있으면 BigQuery 적재 시 CSV 대신 사용)
+        load_sources = {}
+        for path, row_count in ((product_file, product_count), (review_file, review_count), (ingredient_file, ingredient_count)):
+            if row_count:
+                run_path = _write_run_delta(path, start_offsets[path], run_tag)
+                if run_path != path:
+                    logger.info(f"이번 실행분 저장: {run_path} ({row_count}개)")
+                load_sources[path] = csv_to_parquet(run_path) or run_path
+                if load_sources[path] != run_path:
+                    logger.info(f"Parquet 저장 완료: {load_sources[path]}")
 
         # BigQuery 적재
         if BIGQUERY_AVAILABLE:
             print(f"\n{'='*60}")
-            bq_confirm = input("BigQuery에 적재하시겠습니까? (y/n): ").strip().lower()
+            bq_confirm = args.bigquery or input("BigQuery에 적재하시겠습니까? (y/n): ").strip().lower()
             if bq_confirm == 'y':
                 try:
                     print("\nBigQuery 적재 시작...")
                     etl = CrawlerETL()
 
-                    if all_products and not minimal_mode:
-                        etl.load_products(product_file)
+                    if product_count:
+                        etl.load_products(load_sources[product_file])
                         logger.info(f"BigQuery 제품 적재 완료")
 
-                    if all_reviews:
-                        etl.load_reviews(review_file)
+                    if review_count:
+                        etl.load_reviews(load_sources[review_file])
                         logger.info(f"BigQuery 리뷰 적재 완료")
 
-                    if all_ingredients:
-                        etl.load_ingredients(ingredient_file)
+                    if ingredient_count:
+                        etl.load_ingredients(load_sources[ingredient_file])
                         logger.info(f"BigQuery 성분 적재 완료")
 
                     print("BigQuery 적재 완료!")
@@ -972,7 +1478,11 @@ def main():
         logger.error(traceback.format_exc())
 
     finally:
-        driver.quit()
+        for f in open_files:
+            f.close()
+        _close_crawl_cache()
+        if driver_pool is not None:
+            driver_pool.close()
         logger.info("브라우저 종료 완료")
 
 
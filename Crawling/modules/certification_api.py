@@ -7,10 +7,45 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# 캐시 파일 zstd 압축 레벨
+CACHE_ZSTD_LEVEL = 3
+
+# 인증 제품명 색인용 n-gram 길이
+CERT_NGRAM_SIZE = 3
+
+# 인증 종류 판별 키워드 (소문자)
+HALAL_KEYWORDS = ('halal', '할랄')
+VEGAN_KEYWORDS = ('vegan', '비건', 'vegetarian')
+
+
+def _cert_has_keyword(cert: Dict, keywords: tuple) -> bool:
+    """인증 항목의 문자열 필드에 키워드가 있는지 확인 (dict 전체를 str()로 변환하지 않음)"""
+    for value in cert.values():
+        if isinstance(value, str):
+            value = value.lower()
+            if any(keyword in value for keyword in keywords):
+                return True
+    return False
+
 
 class CertificationAPIClient:
     """농식품 해외인증 API 클라이언트"""
@@ -25,30 +60,60 @@ class CertificationAPIClient:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_file = self.cache_dir / "certification_cache.json"
+        # zstandard가 있으면 압축 캐시 사용 (기존 .json 캐시는 처음 로드할 때만 읽음)
+        self.compressed_cache_file = self.cache_dir / "certification_cache.json.zst"
 
         # API 엔드포인트 (실제 URL은 API 문서 확인 후 수정 필요)
         self.base_url = "https://api.odcloud.kr/api/15102890/v1/uddi:b7f89484-470a-46de-a824-a6bf14f088eb"
 
+        # HTTP 세션 (페이지 조회마다 TCP/TLS 연결을 새로 맺지 않도록 커넥션 재사용)
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # 캐시 로드
         self.cache = self._load_cache()
 
         # 캐시 유효 기간 (일)
         self.cache_ttl_days = 30
 
+        # 인증 종류별 제품명 색인 (인증 목록이 바뀌면 다시 생성)
+        self._cert_index = {}
+
     def _load_cache(self) -> dict:
-        """캐시 파일 로드"""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
+        """캐시 파일 로드 (압축 캐시 우선)"""
+        try:
+            if ZSTD_AVAILABLE and self.compressed_cache_file.exists():
+                data = zstandard.ZstdDecompressor().decompress(self.compressed_cache_file.read_bytes())
+            elif self.cache_file.exists():
+                data = self.cache_file.read_bytes()
+            else:
                 return {}
-        return {}
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except:
+            return {}
 
     def _save_cache(self):
-        """캐시 파일 저장"""
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        """캐시 파일 저장 (들여쓰기 없이 임시 파일에 쓴 뒤 교체 - 중단돼도 기존 캐시 보존)"""
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.cache, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(self.cache, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        cache_file = self.cache_file
+        if ZSTD_AVAILABLE:
+            data = zstandard.ZstdCompressor(level=CACHE_ZSTD_LEVEL).compress(data)
+            cache_file = self.compressed_cache_file
+
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
 
     def _is_cache_valid(self, cache_entry: dict) -> bool:
         """캐시 유효성 확인"""
@@ -90,7 +155,7 @@ class CertificationAPIClient:
                 'returnType': 'json'
             }
 
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -135,10 +200,7 @@ class CertificationAPIClient:
 
         if all_certs:
             # 할랄 인증만 필터링
-            halal_certs = [
-                cert for cert in all_certs
-                if any(keyword in str(cert).lower() for keyword in ['halal', '할랄'])
-            ]
+            halal_certs = [cert for cert in all_certs if _cert_has_keyword(cert, HALAL_KEYWORDS)]
 
             # 캐시 저장
             self.cache[cache_key] = {
@@ -168,10 +230,7 @@ class CertificationAPIClient:
 
         if all_certs:
             # 비건 인증만 필터링
-            vegan_certs = [
-                cert for cert in all_certs
-                if any(keyword in str(cert).lower() for keyword in ['vegan', '비건', 'vegetarian'])
-            ]
+            vegan_certs = [cert for cert in all_certs if _cert_has_keyword(cert, VEGAN_KEYWORDS)]
 
             # 캐시 저장
             self.cache[cache_key] = {
@@ -185,6 +244,75 @@ class CertificationAPIClient:
 
         return None
 
+    def _build_cert_index(self, certs: List[Dict]) -> dict:
+        """
+        인증 목록 제품명 색인 생성 (소문자 변환과 n-gram 분해는 목록당 한 번만)
+
+        Returns:
+            dict: {
+                'certs': 원본 목록,
+                'names': 소문자 제품명 리스트 (문자열이 아니면 None),
+                'grams': n-gram → 해당 n-gram을 포함하는 인증 위치 집합,
+                'prefix': 첫 n-gram → 인증 위치 리스트,
+                'short': n-gram보다 짧은 제품명의 인증 위치 리스트
+            }
+        """
+        n = CERT_NGRAM_SIZE
+        names = []
+        grams = defaultdict(set)
+        prefix = defaultdict(list)
+        short = []
+
+        for i, cert in enumerate(certs):
+            # 실제 필드명은 API 응답 구조에 맞게 수정 필요
+            name = cert.get('product_name', cert.get('name', ''))
+            name = name.lower() if isinstance(name, str) else None
+            names.append(name)
+            if name is None:
+                continue
+            if len(name) < n:
+                short.append(i)
+                continue
+            prefix[name[:n]].append(i)
+            for j in range(len(name) - n + 1):
+                grams[name[j:j + n]].add(i)
+
+        return {'certs': certs, 'names': names, 'grams': grams, 'prefix': prefix, 'short': short}
+
+    def _find_cert_match(self, certs: List[Dict], certification_type: str, product_name: str) -> Optional[Dict]:
+        """
+        제품명과 부분 문자열 관계인 첫 번째 인증 반환 (색인으로 후보만 검사)
+
+        - 인증 제품명이 제품명을 포함: 제품명의 모든 n-gram을 가진 인증만 후보
+        - 제품명이 인증 제품명을 포함: 인증 제품명의 첫 n-gram이 제품명에 있어야 후보
+        """
+        index = self._cert_index.get(certification_type)
+        if index is None or index['certs'] is not certs:
+            index = self._build_cert_index(certs)
+            self._cert_index[certification_type] = index
+
+        n = CERT_NGRAM_SIZE
+        names = index['names']
+        query = product_name.lower()
+
+        if len(query) >= n:
+            query_grams = {query[j:j + n] for j in range(len(query) - n + 1)}
+            postings = sorted((index['grams'].get(g, ()) for g in query_grams), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            for g in query_grams:
+                candidates.update(index['prefix'].get(g, ()))
+        else:
+            # 짧은 제품명은 n-gram이 없으므로 전체 확인
+            candidates = set(range(len(names)))
+        candidates.update(index['short'])
+
+        # 원래 목록 순서상 첫 번째 일치 항목 반환
+        for i in sorted(candidates):
+            name = names[i]
+            if name is not None and (query in name or name in query):
+                return certs[i]
+        return None
+
     def check_product_certification(self, product_name: str, certification_type: str = 'halal') -> Dict:
         """
         제품의 인증 여부 확인 (제품명 기반 매칭)
@@ -211,17 +339,13 @@ class CertificationAPIClient:
             return {'is_certified': False, 'certification_info': None, 'source': 'api'}
 
         # 제품명으로 매칭 시도 (간단한 부분 문자열 매칭)
-        for cert in certs:
-            # 실제 필드명은 API 응답 구조에 맞게 수정 필요
-            cert_product_name = cert.get('product_name', cert.get('name', ''))
-
-            if product_name.lower() in cert_product_name.lower() or \
-               cert_product_name.lower() in product_name.lower():
-                return {
-                    'is_certified': True,
-                    'certification_info': cert,
-                    'source': 'cache' if 'halal_certifications' in self.cache else 'api'
-                }
+        cert = self._find_cert_match(certs, certification_type, product_name)
+        if cert is not None:
+            return {
+                'is_certified': True,
+                'certification_info': cert,
+                'source': 'cache' if 'halal_certifications' in self.cache else 'api'
+            }
 
         return {'is_certified': False, 'certification_info': None, 'source': 'api'}
 
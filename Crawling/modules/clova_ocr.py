@@ -5,33 +5,175 @@ Naver Clova OCR API 연동 모듈
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
+import hashlib
+import sqlite3
 import uuid
 import time
+import random
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from typing import Optional, Dict, List
-from io import BytesIO
 from dotenv import load_dotenv
+from config import CRAWLING_CONFIG
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # .env 파일 로드
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 여러 이미지 URL 동시 OCR 시 기본 동시 요청 수 (환경변수 CLOVA_OCR_CONCURRENCY로 변경)
+DEFAULT_OCR_CONCURRENCY = int(os.getenv('CLOVA_OCR_CONCURRENCY', '8'))
+
+# 초당 최대 요청 수 (환경변수 CLOVA_OCR_RPS, 0 이하면 제한 없음)
+DEFAULT_OCR_RPS = float(os.getenv('CLOVA_OCR_RPS', '5'))
+
+# 재시도 설정 (429/5xx 또는 한도 초과 응답 시 지수 백오프)
+RETRY_STATUS_CODES = (429, 500, 502, 503)
+RATE_LIMIT_MARKERS = ('rate limit', 'quota')
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 10.0
+
+
+def _sniff_image_format(image_bytes: bytes, default: str = 'jpeg') -> str:
+    """이미지 바이트의 시그니처로 Clova 포맷 문자열 판별"""
+    if image_bytes[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'png'
+    if image_bytes[:3] == b'\xff\xd8\xff':
+        return 'jpeg'
+    return default
+
+
+def _json_dumps(obj) -> bytes:
+    """요청 JSON 직렬화 (orjson이 있으면 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """응답 JSON 파싱 (orjson이 있으면 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class RateLimiter:
+    """요청 간 최소 간격을 보장하는 스레드 안전 속도 제한기"""
+
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps if rps > 0 else 0.0
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """다음 요청 가능 시각까지 대기 (대기 슬롯은 락 안에서 예약, 대기는 락 밖에서)"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class OCRCache:
+    """
+    OCR 결과 영구 캐시 (SQLite, WAL 모드)
+
+    키: 이미지 바이트는 BLAKE2b 해시, URL 요청은 URL 자체
+    자주 쓰는 키는 프로세스 내 LRU(memory_size개)에서 바로 반환
+    """
+
+    def __init__(self, path: str, memory_size: int = 1024):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS ocr (key TEXT PRIMARY KEY, text TEXT, ts INTEGER)')
+        self._memory = OrderedDict()
+        self._memory_size = memory_size
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def bytes_key(image_bytes: bytes) -> str:
+        """이미지 내용 기반 키"""
+        return 'blake2b:' + hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+    @staticmethod
+    def url_key(image_url: str) -> str:
+        """이미지 URL 기반 키"""
+        return 'url:' + image_url
+
+    def _remember(self, key: str, text: str):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 텍스트 조회 (없으면 None)"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            row = self._conn.execute('SELECT text FROM ocr WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, key: str, text: str):
+        """텍스트 저장"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO ocr VALUES (?, ?, ?)', (key, text, int(time.time()))
+            )
+            self._conn.commit()
+            self._remember(key, text)
+
 
 class ClovaOCR:
     """Naver Clova OCR 클라이언트"""
 
-    def __init__(self, api_url: str = None, secret_key: str = None):
+    def __init__(self, api_url: str = None, secret_key: str = None, cache_path: Optional[str] = ''):
         """
         Args:
             api_url: Clova OCR API URL (환경변수 CLOVA_OCR_URL 또는 직접 지정)
             secret_key: Clova OCR Secret Key (환경변수 CLOVA_OCR_SECRET 또는 직접 지정)
+            cache_path: OCR 결과 캐시 DB 경로 ('' 이면 config cache_dir/ocr_cache.db, None이면 캐시 사용 안 함)
         """
         self.api_url = api_url or os.getenv('CLOVA_OCR_URL')
         self.secret_key = secret_key or os.getenv('CLOVA_OCR_SECRET')
 
+        # HTTP 세션 (호출마다 TCP/TLS 연결을 새로 맺지 않도록 커넥션 재사용, 워커 스레드 공유)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_OCR_CONCURRENCY,
+            pool_maxsize=DEFAULT_OCR_CONCURRENCY
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # 클라이언트 단위 속도 제한 (워커 스레드가 몰려도 초당 요청 수 유지)
+        self.rate_limiter = RateLimiter(DEFAULT_OCR_RPS)
+
+        # 결과 캐시 (재크롤링 시 같은 이미지는 유료 API 재호출 없이 반환)
+        if cache_path == '':
+            cache_path = os.path.join(CRAWLING_CONFIG['cache_dir'], 'ocr_cache.db')
+        self.cache = OCRCache(cache_path) if cache_path else None
+
         if not self.api_url or not self.secret_key:
             logger.warning("Clova OCR API 키가 설정되지 않았습니다. 환경변수를 확인하세요.")
             logger.warning("CLOVA_OCR_URL, CLOVA_OCR_SECRET")
@@ -40,6 +182,51 @@ class ClovaOCR:
         """API 사용 가능 여부 확인"""
         return bool(self.api_url and self.secret_key)
 
+    def _post(self, **kwargs) -> requests.Response:
+        """
+        속도 제한 + 지수 백오프 재시도를 적용한 API 호출
+
+        429/5xx, 한도 초과 문구가 포함된 응답, 연결 오류/타임아웃은 최대 MAX_ATTEMPTS회까지 재시도하고
+        마지막 응답을 그대로 반환 (연결 오류는 마지막 시도에서 예외 전파)
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            self.rate_limiter.acquire()
+            last_attempt = attempt == MAX_ATTEMPTS - 1
+            try:
+                response = self.session.post(self.api_url, timeout=30, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt:
+                    raise
+                reason = type(e).__name__
+            else:
+                if response.status_code == 200 or last_attempt:
+                    return response
+                if response.status_code not in RETRY_STATUS_CODES:
+                    body = response.text.lower()
+                    if not any(marker in body for marker in RATE_LIMIT_MARKERS):
+                        return response
+                reason = f"HTTP {response.status_code}"
+
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+            logger.warning(f"Clova OCR 재시도 ({attempt + 1}/{MAX_ATTEMPTS - 1}, {reason}) - {delay:.1f}초 대기")
+            time.sleep(delay)
+
+    @staticmethod
+    def _build_url_request(image_url: str) -> Dict:
+        """이미지 URL 방식 요청 JSON 생성"""
+        return {
+            'images': [
+                {
+                    'format': 'jpg',  # jpg, png 등
+                    'name': 'ingredient_image',
+                    'url': image_url
+                }
+            ],
+            'requestId': str(uuid.uuid4()),
+            'version': 'V2',
+            'timestamp': int(round(time.time() * 1000))
+        }
+
     def extract_text_from_url(self, image_url: str) -> Optional[str]:
         """
         이미지 URL에서 텍스트 추출
@@ -54,20 +241,16 @@ class ClovaOCR:
             logger.warning("Clova OCR을 사용할 수 없습니다")
             return None
 
+        cache_key = OCRCache.url_key(image_url)
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Clova OCR 캐시 사용: {image_url[:80]}...")
+                return cached
+
         try:
             # 요청 JSON 생성
-            request_json = {
-                'images': [
-                    {
-                        'format': 'jpg',  # jpg, png 등
-                        'name': 'ingredient_image',
-                        'url': image_url
-                    }
-                ],
-                'requestId': str(uuid.uuid4()),
-                'version': 'V2',
-                'timestamp': int(round(time.time() * 1000))
-            }
+            request_json = self._build_url_request(image_url)
 
             headers = {
                 'X-OCR-SECRET': self.secret_key,
@@ -76,17 +259,14 @@ class ClovaOCR:
 
             # API 호출
             logger.info(f"Clova OCR 호출: {image_url[:80]}...")
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=request_json,
-                timeout=30
-            )
+            response = self._post(headers=headers, data=_json_dumps(request_json))
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 text = self._parse_response(result)
                 logger.info(f"Clova OCR 성공: {len(text)}자 추출")
+                if self.cache and text:
+                    self.cache.put(cache_key, text)
                 return text
             else:
                 logger.error(f"Clova OCR 실패: {response.status_code}")
@@ -97,7 +277,25 @@ class ClovaOCR:
             logger.error(f"Clova OCR 오류: {str(e)}")
             return None
 
-    def extract_text_from_bytes(self, image_bytes: bytes, image_format: str = 'png') -> Optional[str]:
+    def extract_text_from_urls(self, image_urls: List[str], concurrency: int = None) -> List[Optional[str]]:
+        """
+        여러 이미지 URL에서 텍스트 동시 추출 (요청 대기 시간을 겹쳐 배치 전체 시간 단축)
+
+        Args:
+            image_urls: 이미지 URL 리스트
+            concurrency: 동시 요청 수 (None이면 DEFAULT_OCR_CONCURRENCY)
+
+        Returns:
+            입력 순서대로 추출된 텍스트 리스트 (실패한 항목은 None)
+        """
+        if not image_urls:
+            return []
+
+        workers = max(1, min(concurrency or DEFAULT_OCR_CONCURRENCY, len(image_urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_text_from_url, image_urls))
+
+    def extract_text_from_bytes(self, image_bytes: bytes, image_format: str = 'jpeg') -> Optional[str]:
         """
         이미지 바이트에서 텍스트 추출
 
@@ -112,6 +310,13 @@ class ClovaOCR:
             logger.warning("Clova OCR을 사용할 수 없습니다")
             return None
 
+        cache_key = OCRCache.bytes_key(image_bytes)
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Clova OCR 캐시 사용 (이미지 바이트)")
+                return cached
+
         try:
             # multipart/form-data로 전송
             request_json = {
@@ -126,10 +331,10 @@ class ClovaOCR:
                 'timestamp': int(round(time.time() * 1000))
             }
 
-            # 파일 데이터 준비
+            # 파일 데이터 준비 (재시도 시 다시 읽을 수 있도록 스트림 대신 bytes 그대로 전달)
             files = {
-                'message': (None, json.dumps(request_json), 'application/json'),
-                'file': ('image.' + image_format, BytesIO(image_bytes), 'image/' + image_format)
+                'message': (None, _json_dumps(request_json), 'application/json'),
+                'file': ('image.' + image_format, image_bytes, 'image/' + image_format)
             }
 
             headers = {
@@ -138,17 +343,14 @@ class ClovaOCR:
 
             # API 호출
             logger.info("Clova OCR 호출 (이미지 바이트)")
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                files=files,
-                timeout=30
-            )
+            response = self._post(headers=headers, files=files)
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 text = self._parse_response(result)
                 logger.info(f"Clova OCR 성공: {len(text)}자 추출")
+                if self.cache and text:
+                    self.cache.put(cache_key, text)
                 return text
             else:
                 logger.error(f"Clova OCR 실패: {response.status_code}")
@@ -159,6 +361,53 @@ class ClovaOCR:
             logger.error(f"Clova OCR 오류: {str(e)}")
             return None
 
+    def extract_text_from_images(self, images: List[bytes], preprocess=None,
+                                 concurrency: int = None, preprocess_workers: int = None) -> List[Optional[str]]:
+        """
+        여러 이미지 바이트에서 텍스트 동시 추출
+
+        preprocess 지정 시 전처리(CPU, 프로세스 풀)와 OCR 호출(네트워크, 스레드 풀)을 파이프라인으로 겹쳐 실행
+        - 전처리가 끝난 이미지부터 바로 OCR 요청
+
+        Args:
+            images: 이미지 바이트 리스트
+            preprocess: 이미지 바이트 → 바이트 전처리 함수 (프로세스 풀로 보내므로 모듈 수준 함수,
+                        예: image_preprocessor.preprocess_for_korean_ocr)
+            concurrency: 동시 OCR 요청 수 (None이면 DEFAULT_OCR_CONCURRENCY)
+            preprocess_workers: 전처리 프로세스 수 (None이면 CPU 코어 수)
+
+        Returns:
+            입력 순서대로 추출된 텍스트 리스트 (실패한 항목은 None)
+        """
+        if not images:
+            return []
+
+        def ocr(image_bytes):
+            return self.extract_text_from_bytes(image_bytes, image_format=_sniff_image_format(image_bytes))
+
+        workers = max(1, min(concurrency or DEFAULT_OCR_CONCURRENCY, len(images)))
+        with ThreadPoolExecutor(max_workers=workers) as ocr_executor:
+            if preprocess is None:
+                return list(ocr_executor.map(ocr, images))
+
+            results = [None] * len(images)
+            ocr_futures = {}
+            prep_workers = max(1, min(preprocess_workers or os.cpu_count() or 1, len(images)))
+            with ProcessPoolExecutor(max_workers=prep_workers) as prep_executor:
+                prep_futures = {prep_executor.submit(preprocess, image): idx for idx, image in enumerate(images)}
+                for future in as_completed(prep_futures):
+                    idx = prep_futures[future]
+                    try:
+                        processed = future.result()
+                    except Exception as e:
+                        logger.warning(f"OCR 전처리 실패 (이미지 {idx}): {str(e)}")
+                        continue
+                    ocr_futures[ocr_executor.submit(ocr, processed)] = idx
+
+            for future, idx in ocr_futures.items():
+                results[idx] = future.result()
+            return results
+
     def _parse_response(self, response_json: Dict) -> str:
         """
         Clova OCR 응답 파싱
@@ -177,19 +426,9 @@ class ClovaOCR:
             # 첫 번째 이미지 결과
             fields = images[0].get('fields', [])
 
-            # 각 필드의 텍스트를 줄바꿈으로 연결
-            # fields는 이미 좌표 순서대로 정렬되어 있음
-            texts = []
-
-            for field in fields:
-                infer_text = field.get('inferText', '')
-                if infer_text:
-                    texts.append(infer_text)
-
-            # 줄바꿈으로 연결 (성분 리스트는 보통 한 줄에 하나씩)
-            full_text = '\n'.join(texts)
-
-            return full_text
+            # 각 필드의 텍스트를 줄바꿈으로 연결 (빈 텍스트 제외)
+            # fields는 이미 좌표 순서대로 정렬되어 있음, 성분 리스트는 보통 한 줄에 하나씩
+            return '\n'.join([text for text in (field.get('inferText', '') for field in fields) if text])
 
         except Exception as e:
             logger.error(f"Clova OCR 응답 파싱 오류: {str(e)}")
@@ -215,33 +454,17 @@ class ClovaOCR:
             return None
 
         try:
-            request_json = {
-                'images': [
-                    {
-                        'format': 'jpg',
-                        'name': 'ingredient_image',
-                        'url': image_url
-                    }
-                ],
-                'requestId': str(uuid.uuid4()),
-                'version': 'V2',
-                'timestamp': int(round(time.time() * 1000))
-            }
+            request_json = self._build_url_request(image_url)
 
             headers = {
                 'X-OCR-SECRET': self.secret_key,
                 'Content-Type': 'application/json'
             }
 
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=request_json,
-                timeout=30
-            )
+            response = self._post(headers=headers, data=_json_dumps(request_json))
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 images = result.get('images', [])
 
                 if not images:
@@ -249,27 +472,19 @@ class ClovaOCR:
 
                 fields_data = images[0].get('fields', [])
 
-                # 구조화된 데이터 추출
-                structured_fields = []
-                all_texts = []
-
-                for field in fields_data:
-                    text = field.get('inferText', '')
-                    confidence = field.get('inferConfidence', 0)
-
-                    # bounding box 정보
-                    vertices = field.get('boundingPoly', {}).get('vertices', [])
-
-                    if text:
-                        all_texts.append(text)
-                        structured_fields.append({
-                            'text': text,
-                            'confidence': confidence,
-                            'bounding_box': vertices
-                        })
+                # 구조화된 데이터 추출 (텍스트가 있는 필드만, bounding box 정보 포함)
+                structured_fields = [
+                    {
+                        'text': field['inferText'],
+                        'confidence': field.get('inferConfidence', 0),
+                        'bounding_box': field.get('boundingPoly', {}).get('vertices', [])
+                    }
+                    for field in fields_data
+                    if field.get('inferText')
+                ]
 
                 return {
-                    'full_text': '\n'.join(all_texts),
+                    'full_text': '\n'.join([field['text'] for field in structured_fields]),
                     'fields': structured_fields,
                     'field_count': len(structured_fields)
                 }
@@ -1,21 +1,35 @@
 """
 Selenium 드라이버 설정
 """
-import undetected_chromedriver as uc
 from selenium.webdriver.chrome.options import Options
 from config import CRAWLING_CONFIG, USER_AGENTS
+from contextlib import contextmanager
+import queue
 import random
 
-def create_driver(headless=None):
+# 선택 모듈: undetected-chromedriver (create_driver에서만 사용, DriverPool은 다른 factory로도 사용 가능)
+try:
+    import undetected_chromedriver as uc
+    UC_AVAILABLE = True
+except ImportError:
+    UC_AVAILABLE = False
+
+def create_driver(headless=None, load_images=True):
     """
     봇 탐지 회피가 적용된 Chrome 드라이버 생성
 
     Args:
         headless: 헤드리스 모드 여부 (None일 경우 config 사용)
+        load_images: False면 이미지 로딩 차단 (이미지 OCR이 필요 없을 때)
 
     Returns:
         undetected_chromedriver 인스턴스
+
+    Raises:
+        ImportError: undetected-chromedriver가 설치되지 않은 경우
     """
+    if not UC_AVAILABLE:
+        raise ImportError("undetected-chromedriver가 설치되지 않았습니다")
 
     if headless is None:
         headless = CRAWLING_CONFIG['headless']
@@ -31,6 +45,11 @@ def create_driver(headless=None):
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+
+    # DOMContentLoaded 시점에 driver.get() 반환 (이미지/광고 등 load 이벤트 대기 생략)
+    options.page_load_strategy = 'eager'
 
     # User-Agent 랜덤 설정
     user_agent = random.choice(USER_AGENTS)
@@ -51,6 +70,10 @@ def create_driver(headless=None):
         "profile.default_content_setting_values.notifications": 2,
         "profile.default_content_settings.popups": 0,
     }
+    # 이미지 로딩 차단 (DOM의 img 요소/속성은 유지)
+    if not load_images:
+        prefs["profile.managed_default_content_settings.images"] = 2
+        options.add_argument('--blink-settings=imagesEnabled=false')
     options.add_experimental_option("prefs", prefs)
 
     try:
@@ -86,3 +109,62 @@ def quit_driver(driver):
             driver.quit()
         except:
             pass
+
+
+class DriverPool:
+    """
+    미리 띄워 둔 드라이버를 워커끼리 돌려 쓰는 풀 (Chrome 기동 비용을 크롤링 전체에 한 번만 지불)
+
+    사용 예:
+        pool = DriverPool(size=4, load_images=False)
+        with pool.acquire() as driver:
+            driver.get(url)
+        pool.close()
+    """
+
+    def __init__(self, size=4, factory=None, reset=True, **driver_kwargs):
+        """
+        Args:
+            size: 드라이버 수
+            factory: 드라이버 생성 함수 (None이면 create_driver)
+            reset: 반납 시 쿠키/페이지 초기화 여부
+            **driver_kwargs: factory에 전달할 인자 (headless, load_images 등)
+        """
+        factory = factory or create_driver
+        self._reset_on_release = reset
+        self._drivers = []
+        self._queue = queue.LifoQueue()
+        try:
+            for _ in range(size):
+                driver = factory(**driver_kwargs)
+                self._drivers.append(driver)
+                self._queue.put(driver)
+        except Exception:
+            self.close()
+            raise
+
+    @contextmanager
+    def acquire(self):
+        """드라이버를 빌려 쓰고 반납 (reset=True면 반납 시 쿠키/페이지 초기화)"""
+        driver = self._queue.get()
+        try:
+            yield driver
+        finally:
+            if self._reset_on_release:
+                self._reset(driver)
+            self._queue.put(driver)
+
+    @staticmethod
+    def _reset(driver):
+        """다음 작업에 이전 세션 상태가 남지 않도록 초기화"""
+        try:
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except:
+            pass
+
+    def close(self):
+        """모든 드라이버 종료"""
+        for driver in self._drivers:
+            quit_driver(driver)
+        self._drivers = []
@@ -7,11 +7,26 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict
 
+from modules.halal_vegan_checker import (
+    ANIMAL_DERIVED_INGREDIENTS,
+    HARAM_INGREDIENTS,
+    VEGAN_SAFE_INGREDIENTS,
+    ingredient_keyword_groups,
+)
+
+# 식약처 API 동시 조회 수
+MFDS_CONCURRENCY = 8
+
 
 class HalalVeganChecker:
     """할랄/비건 성분 검증 클래스"""
@@ -19,28 +34,66 @@ class HalalVeganChecker:
     def __init__(self, cache_dir: str = "cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
-        self.cache_file = self.cache_dir / "halal_vegan_cache.json"
+        self.cache_file = self.cache_dir / "halal_vegan_cache.json"  # 이전 버전 캐시 (마이그레이션용)
 
-        # 캐시 로드
-        self.cache = self._load_cache()
+        # 캐시 DB (조회 결과를 한 행씩 upsert, 자주 쓰는 키는 메모리 캐시에서 반환)
+        self.db = sqlite3.connect(str(self.cache_dir / "halal.db"), check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS mfds (k TEXT PRIMARY KEY, v TEXT)')
+        self._db_lock = threading.Lock()
+        self.cache = {}
+        self._migrate_json_cache()
 
         # API 설정 (필요시 환경변수로 관리)
         self.mfds_api_key = os.getenv('MFDS_API_KEY', '')  # 식약처 API 키
 
-    def _load_cache(self) -> dict:
-        """캐시 파일 로드"""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
-
-    def _save_cache(self):
-        """캐시 파일 저장"""
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        # HTTP 세션 (성분마다 TCP/TLS 연결을 새로 맺지 않도록 커넥션 재사용, 일시 오류는 재시도)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _migrate_json_cache(self):
+        """이전 JSON 캐시가 있고 DB가 비어 있으면 DB로 옮김"""
+        if not self.cache_file.exists():
+            return
+        if self.db.execute('SELECT 1 FROM mfds LIMIT 1').fetchone():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                old_cache = json.load(f)
+        except:
+            return
+        with self.db:
+            self.db.executemany(
+                'INSERT OR REPLACE INTO mfds VALUES (?, ?)',
+                ((k, json.dumps(v, ensure_ascii=False)) for k, v in old_cache.items())
+            )
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 (메모리 → DB 순, 없으면 None)"""
+        if key in self.cache:
+            return self.cache[key]
+        with self._db_lock:
+            row = self.db.execute('SELECT v FROM mfds WHERE k = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        value = json.loads(row[0])
+        self.cache[key] = value
+        return value
+
+    def _cache_put(self, key: str, value: Dict):
+        """캐시 저장 (해당 키 한 행만 기록)"""
+        self.cache[key] = value
+        with self._db_lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO mfds VALUES (?, ?)',
+                (key, json.dumps(value, ensure_ascii=False))
+            )
 
     def check_ingredient_mfds(self, ingredient: str) -> Optional[Dict]:
         """
@@ -51,8 +104,9 @@ class HalalVeganChecker:
         """
         # 캐시 확인
         cache_key = f"mfds_{ingredient}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         if not self.mfds_api_key:
             return None
@@ -69,7 +123,7 @@ class HalalVeganChecker:
                 'type': 'json'
             }
 
-            response = requests.get(url, params=params, timeout=5)
+            response = self.session.get(url, params=params, timeout=5)
 
             if response.status_code == 200:
                 data = response.json()
@@ -87,8 +141,7 @@ class HalalVeganChecker:
                     }
 
                     # 캐시 저장
-                    self.cache[cache_key] = result
-                    self._save_cache()
+                    self._cache_put(cache_key, result)
 
                     return result
 
@@ -97,6 +150,24 @@ class HalalVeganChecker:
 
         return None
 
+    def _prefetch_mfds(self, ingredients):
+        """
+        식약처 조회가 필요한 성분들을 병렬로 미리 조회 (결과는 캐시에 저장)
+
+        Args:
+            ingredients: 중복 없는 성분 목록
+        """
+        if not self.mfds_api_key:
+            return
+
+        pending = [ing for ing in ingredients if self._cache_get(f"mfds_{ing}") is None]
+        if len(pending) < 2:
+            return
+
+        workers = min(MFDS_CONCURRENCY, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self.check_ingredient_mfds, pending))
+
     def check_vegan_status(self, ingredient: str) -> str:
         """
         비건 적합성 확인
@@ -105,11 +176,6 @@ class HalalVeganChecker:
             'Yes', 'No', 'Unknown', 'Questionable'
         """
         # 1. 로컬 데이터베이스 체크
-        from daiso_beauty_crawler import (
-            VEGAN_SAFE_INGREDIENTS,
-            ANIMAL_DERIVED_INGREDIENTS
-        )
-
         if ingredient in VEGAN_SAFE_INGREDIENTS:
             return 'Yes'
 
@@ -145,14 +211,11 @@ class HalalVeganChecker:
             'Yes', 'No', 'Unknown', 'Questionable'
         """
         # 1. 로컬 데이터베이스 체크
-        from daiso_beauty_crawler import HARAM_INGREDIENTS, ANIMAL_DERIVED_INGREDIENTS
-
         if ingredient in HARAM_INGREDIENTS:
             return 'No'
 
         # 돼지 유래 성분 체크
-        pig_keywords = ['돼지', '포신', 'porcine']
-        if any(kw in ingredient.lower() for kw in pig_keywords):
+        if 'porcine' in ingredient_keyword_groups(ingredient):
             return 'No'
 
         # 동물성 성분은 원료 확인 필요
@@ -191,26 +254,46 @@ class HalalVeganChecker:
                 'summary': str
             }
         """
+        # 로컬 DB 판정은 중복 제거한 성분 집합의 교집합으로 한 번에 처리
+        unique = dict.fromkeys(ingredients).keys()
+        vegan_safe = unique & VEGAN_SAFE_INGREDIENTS
+        animal = unique & ANIMAL_DERIVED_INGREDIENTS
+        haram = unique & HARAM_INGREDIENTS
+        haram |= {ing for ing in unique - haram if 'porcine' in ingredient_keyword_groups(ing)}
+
+        vegan_status = dict.fromkeys(animal - vegan_safe, 'No')
+        vegan_status.update(dict.fromkeys(vegan_safe, 'Yes'))
+        halal_status = dict.fromkeys(animal - haram, 'Questionable')
+        halal_status.update(dict.fromkeys(haram, 'No'))
+
+        # 나머지 성분만 식약처 조회로 판정
+        vegan_rest = [ing for ing in unique if ing not in vegan_status]
+        halal_rest = [ing for ing in unique if ing not in halal_status]
+        self._prefetch_mfds(dict.fromkeys(vegan_rest + halal_rest))
+        for ing in vegan_rest:
+            vegan_status[ing] = self.check_vegan_status(ing)
+        for ing in halal_rest:
+            halal_status[ing] = self.check_halal_status(ing)
+
+        # 이슈 목록은 입력 순서대로
         vegan_issues = []
         halal_issues = []
+        is_halal = True
 
         for ing in ingredients:
-            vegan_status = self.check_vegan_status(ing)
-            halal_status = self.check_halal_status(ing)
-
-            if vegan_status == 'No':
+            if vegan_status[ing] == 'No':
                 vegan_issues.append(f"{ing} (동물성)")
-            elif vegan_status == 'Questionable':
+            elif vegan_status[ing] == 'Questionable':
                 vegan_issues.append(f"{ing} (의심)")
 
-            if halal_status == 'No':
+            if halal_status[ing] == 'No':
                 halal_issues.append(f"{ing} (부적합)")
-            elif halal_status == 'Questionable':
+                is_halal = False
+            elif halal_status[ing] == 'Questionable':
                 halal_issues.append(f"{ing} (원료확인필요)")
 
         # 최종 판정
         is_vegan = len(vegan_issues) == 0
-        is_halal = len([x for x in halal_issues if '부적합' in x]) == 0
 
         summary = f"비건: {'적합' if is_vegan else '부적합'}, 할랄: {'적합' if is_halal else '부적합 또는 의심'}"
 
@@ -1,9 +1,18 @@
 """
 할랄/비건 성분 검증 모듈 (로컬 데이터베이스)
 """
+import re
+import unicodedata
+from functools import lru_cache
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # 동물성 성분 데이터베이스 (비건/할랄 부적합)
-ANIMAL_DERIVED_INGREDIENTS = {
+ANIMAL_DERIVED_INGREDIENTS = frozenset({
     # 확실한 동물 유래 성분 (비건 불가)
     '라놀린', 'Lanolin', '양모지',
     '콜라겐', 'Collagen', '가수분해콜라겐', '마린콜라겐', '어류콜라겐',
@@ -29,10 +38,10 @@ ANIMAL_DERIVED_INGREDIENTS = {
     '알부민', 'Albumin',
     '레티놀', 'Retinol',  # 동물성 비타민A
     '오메가3', '피쉬오일', 'FishOil',
-}
+})
 
 # 할랄 부적합 성분 (알코올, 돼지 유래 등)
-HARAM_INGREDIENTS = {
+HARAM_INGREDIENTS = frozenset({
     # 알코올류 (할랄 금지)
     '에탄올', 'Ethanol',
     '알코올', 'Alcohol',
@@ -61,11 +70,11 @@ HARAM_INGREDIENTS = {
 
     # 기타 의심 성분
     '젤라틴',  # 출처 불명 시 돼지 가능성
-}
+})
 
 # 애매한 성분 (식물성/동물성 혼재 - 원료 확인 필요)
 # 이 성분들은 원료 출처에 따라 비건/할랄 여부가 달라질 수 있음
-AMBIGUOUS_INGREDIENTS = {
+AMBIGUOUS_INGREDIENTS = frozenset({
     # === 원료 출처 확인 필요 (식물성/동물성 혼재) ===
     '글리세린', 'Glycerin', 'Glycerol',
     '부틸렌글라이콜', 'ButyleneGlycol', '1,3-부틸렌글라이콜',
@@ -122,10 +131,10 @@ AMBIGUOUS_INGREDIENTS = {
     # 기타
     '구아닌', 'Guanine',
     '키틴', 'Chitin',
-}
+})
 
 # 비건 인증 가능 성분 (식물성 확정)
-VEGAN_SAFE_INGREDIENTS = {
+VEGAN_SAFE_INGREDIENTS = frozenset({
     # 식물 추출물
     '알로에베라잎추출물', 'AloeVeraLeafExtract', '녹차추출물', 'GreenTeaExtract',
     '병풀추출물', 'CentellAAssiaticaExtract', '감초추출물', 'LicoriceExtract',
@@ -196,63 +205,115 @@ VEGAN_SAFE_INGREDIENTS = {
     '소듐시트레이트',
     '다이소듐이디티에이',
     '프로필렌카보네이트',
+})
+
+
+def normalize_ingredient_key(ingredient: str) -> str:
+    """판정용 성분명 키 (NFKC + 앞뒤 공백 제거 + 소문자) - OCR 전각/대소문자 변형을 같은 키로 (내부 공백은 유지)"""
+    return unicodedata.normalize('NFKC', ingredient).strip().lower()
+
+
+# 판정용 정규화 집합 (모듈 로드 시 한 번만 계산)
+_HARAM_NORMALIZED = frozenset(map(normalize_ingredient_key, HARAM_INGREDIENTS))
+_ANIMAL_NORMALIZED = frozenset(map(normalize_ingredient_key, ANIMAL_DERIVED_INGREDIENTS))
+_VEGAN_SAFE_NORMALIZED = frozenset(map(normalize_ingredient_key, VEGAN_SAFE_INGREDIENTS))
+_AMBIGUOUS_NORMALIZED = frozenset(map(normalize_ingredient_key, AMBIGUOUS_INGREDIENTS))
+
+# 성분명 부분 문자열 키워드 (그룹명 → 소문자 키워드)
+INGREDIENT_KEYWORD_GROUPS = {
+    'alcohol': ('알코올', 'alcohol'),
+    'pork': ('돼지', 'pork'),
+    'porcine': ('돼지', '포신', 'porcine'),  # 돼지 유래 의심 (API 할랄 판정용)
 }
 
 
-def check_halal_vegan_status(ingredient: str) -> dict:
-    """
-    성분의 할랄/비건 적합성 판정
+def _build_keyword_matcher(groups):
+    """키워드 그룹 전체를 한 번에 스캔하는 매처 생성 (pyahocorasick 없으면 정규식 alternation)"""
+    keyword_groups = {}
+    for group, keywords in groups.items():
+        for kw in keywords:
+            keyword_groups.setdefault(kw, set()).add(group)
 
-    Args:
-        ingredient: 성분명
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for kw, kw_groups in keyword_groups.items():
+            automaton.add_word(kw, frozenset(kw_groups))
+        automaton.make_automaton()
+        return lambda text: [g for _, g in automaton.iter(text)]
 
-    Returns:
-        dict: {
-            'is_vegan': 'Yes'|'No'|'Unknown',
-            'is_halal': 'Yes'|'No'|'Questionable'|'Unknown',
-            'warning': str
-        }
+    pattern = re.compile('|'.join(
+        re.escape(kw) for kw in sorted(keyword_groups, key=len, reverse=True)
+    ))
+    # 겹치는 키워드가 없으므로 비중첩 스캔으로 충분
+    return lambda text: [keyword_groups[m.group()] for m in pattern.finditer(text)]
+
+
+_match_keywords = _build_keyword_matcher(INGREDIENT_KEYWORD_GROUPS)
+
+
+@lru_cache(maxsize=8192)
+def ingredient_keyword_groups(ingredient: str) -> frozenset:
+    """성분명(대소문자 무시)에 포함된 키워드 그룹 집합 (한 번의 스캔, 캐시됨)"""
+    found = set()
+    for groups in _match_keywords(ingredient.lower()):
+        found.update(groups)
+    return frozenset(found)
+
+
+@lru_cache(maxsize=8192)
+def _classify_ingredient(key: str) -> tuple:
     """
-    result = {
-        'is_vegan': 'Unknown',
-        'is_halal': 'Unknown',
-        'warning': ''
-    }
+    성분 판정 결과를 (is_vegan, is_halal, warning) 튜플로 반환 (캐시됨)
+
+    같은 성분이 여러 제품에 반복 등장하므로 정규화된 성분명 단위로 결과를 재사용
 
+    Args:
+        key: normalize_ingredient_key()로 정규화된 성분명
+    """
     # 1단계: 할랄 부적합 성분 체크 (최우선)
-    if ingredient in HARAM_INGREDIENTS:
-        result['is_halal'] = 'No'
-        result['warning'] = '할랄 부적합 (알코올 또는 돼지 유래)'
+    if key in _HARAM_NORMALIZED:
+        warning = '할랄 부적합 (알코올 또는 돼지 유래)'
+        groups = ingredient_keyword_groups(key)
         # 알코올은 비건이지만 할랄 부적합
-        if '알코올' in ingredient.lower() or 'alcohol' in ingredient.lower():
-            result['is_vegan'] = 'Yes'
-        elif '돼지' in ingredient or 'pork' in ingredient.lower():
-            result['is_vegan'] = 'No'
-        return result
+        if 'alcohol' in groups:
+            return 'Yes', 'No', warning
+        elif 'pork' in groups:
+            return 'No', 'No', warning
+        return 'Unknown', 'No', warning
 
     # 2단계: 확실한 동물성 성분 체크
-    if ingredient in ANIMAL_DERIVED_INGREDIENTS:
-        result['is_vegan'] = 'No'
-        result['is_halal'] = 'Questionable'
-        result['warning'] = '동물성 유래 성분'
-        return result
+    if key in _ANIMAL_NORMALIZED:
+        return 'No', 'Questionable', '동물성 유래 성분'
 
     # 3단계: 비건 안전 성분 체크
-    if ingredient in VEGAN_SAFE_INGREDIENTS:
-        result['is_vegan'] = 'Yes'
-        result['is_halal'] = 'Yes'
-        return result
+    if key in _VEGAN_SAFE_NORMALIZED:
+        return 'Yes', 'Yes', ''
 
     # 4단계: 애매한 성분 (원료 출처에 따라 달라짐)
-    if ingredient in AMBIGUOUS_INGREDIENTS:
-        result['is_vegan'] = 'Unknown'
-        result['is_halal'] = 'Unknown'
-        result['warning'] = '원료 출처 확인 필요 (식물성/동물성 혼재 가능)'
-        return result
+    if key in _AMBIGUOUS_NORMALIZED:
+        return 'Unknown', 'Unknown', '원료 출처 확인 필요 (식물성/동물성 혼재 가능)'
 
     # 5단계: 알 수 없는 성분 - 기본적으로 합성/식물성으로 간주
-    result['is_vegan'] = 'Yes'
-    result['is_halal'] = 'Yes'
-    result['warning'] = '합성/식물성 추정 (검증 필요)'
+    return 'Yes', 'Yes', '합성/식물성 추정 (검증 필요)'
+
+
+def check_halal_vegan_status(ingredient: str) -> dict:
+    """
+    성분의 할랄/비건 적합성 판정 (대소문자/전각/앞뒤 공백 무시)
 
-    return result
+    Args:
+        ingredient: 성분명
+
+    Returns:
+        dict: {
+            'is_vegan': 'Yes'|'No'|'Unknown',
+            'is_halal': 'Yes'|'No'|'Questionable'|'Unknown',
+            'warning': str
+        }
+    """
+    is_vegan, is_halal, warning = _classify_ingredient(normalize_ingredient_key(ingredient))
+    return {
+        'is_vegan': is_vegan,
+        'is_halal': is_halal,
+        'warning': warning
+    }
@@ -3,8 +3,103 @@
 """
 import cv2
 import numpy as np
-from PIL import Image, ImageEnhance
+from PIL import Image
 import io
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# OCR 전송용 인코딩 설정 (PNG optimize는 deflate를 여러 번 돌려 느림)
+JPEG_QUALITY = 92
+JPEG_SUBSAMPLING = 2  # 4:2:0
+
+# 이 너비 이상이고 밝기 표준편차(대비)가 충분하면 한국어 OCR 전처리 생략
+SKIP_PREPROCESS_MIN_WIDTH = 1500
+SKIP_PREPROCESS_MIN_CONTRAST = 55
+
+# 인코딩용 BytesIO 재사용 풀
+_BUF_POOL = queue.LifoQueue()
+
+# CLAHE 객체 (내부 버퍼를 가지므로 스레드별로 하나씩 재사용)
+_thread_local = threading.local()
+
+
+def _get_clahe():
+    """현재 스레드의 CLAHE 객체 (첫 호출 시 생성)"""
+    clahe = getattr(_thread_local, 'clahe', None)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        _thread_local.clahe = clahe
+    return clahe
+
+# PIL ImageFilter.SMOOTH 커널 (ImageEnhance.Sharpness의 기준 이미지)
+_SMOOTH_KERNEL = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+_IDENTITY_KERNEL = np.zeros((3, 3), dtype=np.float32)
+_IDENTITY_KERNEL[1, 1] = 1.0
+
+
+def _encode_image(img, format='JPEG', **params):
+    """
+    풀에서 꺼낸 BytesIO에 이미지를 인코딩해 바이트로 반환
+
+    Args:
+        img: PIL 이미지
+        format: 저장 포맷 ('JPEG' 기본, 이진화 이미지는 'PNG')
+        **params: PIL save 옵션 (미지정 시 JPEG 품질/서브샘플링 기본값)
+
+    Returns:
+        인코딩된 이미지 바이트
+    """
+    if format == 'JPEG':
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        params.setdefault('quality', JPEG_QUALITY)
+        params.setdefault('subsampling', JPEG_SUBSAMPLING)
+
+    try:
+        buf = _BUF_POOL.get_nowait()
+    except queue.Empty:
+        buf = io.BytesIO()
+
+    try:
+        img.save(buf, format=format, **params)
+        return buf.getvalue()
+    finally:
+        buf.seek(0)
+        buf.truncate()
+        _BUF_POOL.put(buf)
+
+
+def _enhance_array(arr, contrast=1.0, sharpness=1.0, brightness=1.0):
+    """
+    대비 → 선명도 → 밝기 보정을 filter2D 한 번으로 처리
+
+    세 단계 모두 선형이라 커널 하나(선명도)와 배율/오프셋(대비, 밝기)으로 합칠 수 있음
+    (PIL ImageEnhance 체인과 달리 중간 이미지를 만들지 않음, 중간 클리핑만 생략)
+
+    Args:
+        arr: RGB 또는 그레이스케일 uint8 배열
+        contrast: 대비 배율 (ImageEnhance.Contrast와 동일, 평균 밝기 기준)
+        sharpness: 선명도 배율 (ImageEnhance.Sharpness와 동일)
+        brightness: 밝기 배율 (ImageEnhance.Brightness와 동일)
+
+    Returns:
+        보정된 uint8 배열
+    """
+    gray = arr if arr.ndim == 2 else cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+    mean = int(gray.mean() + 0.5)
+
+    gain = contrast * brightness
+    kernel = (sharpness * _IDENTITY_KERNEL + (1 - sharpness) * _SMOOTH_KERNEL) * gain
+    # +0.5: astype 절사를 반올림으로
+    delta = mean * (1 - contrast) * brightness + 0.5
+
+    out = cv2.filter2D(arr.astype(np.float32), -1, kernel,
+                       delta=delta, borderType=cv2.BORDER_REPLICATE)
+    np.clip(out, 0, 255, out=out)
+    return out.astype(np.uint8)
 
 
 def preprocess_image_for_ocr(image_bytes, method='enhanced'):
@@ -34,72 +129,90 @@ def preprocess_image_for_ocr(image_bytes, method='enhanced'):
 
     elif method == 'enhanced':
         # 향상: 대비 + 샤프닝
-        # 1. 대비 향상 (1.5배)
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(1.5)
+        # 그레이스케일도 선형 변환이므로 먼저 변환해 채널 1개만 필터링
+        gray = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2GRAY)
 
-        # 2. 선명도 향상
-        enhancer = ImageEnhance.Sharpness(img)
-        img = enhancer.enhance(1.3)
-
-        # 3. 그레이스케일
-        img = img.convert('L')
+        # 대비 1.5배 + 선명도 1.3배
+        img = Image.fromarray(_enhance_array(gray, contrast=1.5, sharpness=1.3))
 
     elif method == 'aggressive':
         # 공격적: 이진화 + 노이즈 제거
-        # 1. 그레이스케일 변환
-        img = img.convert('L')
+        # 1. 그레이스케일 변환 (RGB 배열에서 바로 변환)
+        img_array = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2GRAY)
+        buf = np.empty_like(img_array)
 
-        # 2. NumPy 배열로 변환
-        img_array = np.array(img)
+        # 2. 대비 향상 (CLAHE - Contrast Limited Adaptive Histogram Equalization)
+        _get_clahe().apply(img_array, dst=buf)
 
-        # 3. 대비 향상 (CLAHE - Contrast Limited Adaptive Histogram Equalization)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        img_array = clahe.apply(img_array)
+        # 3. 노이즈 제거 (가우시안 블러)
+        cv2.GaussianBlur(buf, (3, 3), 0, dst=img_array)
 
-        # 4. 노이즈 제거 (가우시안 블러)
-        img_array = cv2.GaussianBlur(img_array, (3, 3), 0)
-
-        # 5. 적응형 이진화 (Adaptive Thresholding)
-        img_array = cv2.adaptiveThreshold(
+        # 4. 적응형 이진화 (Adaptive Thresholding)
+        cv2.adaptiveThreshold(
             img_array, 255,
             cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY, 11, 2
+            cv2.THRESH_BINARY, 11, 2,
+            dst=buf
         )
 
-        # 6. PIL 이미지로 다시 변환
-        img = Image.fromarray(img_array)
+        # 이진화 이미지는 JPEG 아티팩트가 생기므로 PNG 유지 (압축 레벨 1 - 빠른 인코딩)
+        ok, encoded = cv2.imencode('.png', buf, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            raise ValueError("이미지 인코딩 실패")
+        return encoded.tobytes()
 
     # 바이트로 변환
-    output = io.BytesIO()
-    img.save(output, format='PNG', optimize=True)
-    return output.getvalue()
+    return _encode_image(img)
 
 
 def upscale_image(image_bytes, scale_factor=2.0):
     """
-    이미지 해상도 향상
+    이미지 해상도 향상 (cv2 LANCZOS4 - GIL을 놓으므로 스레드로 병렬 처리 가능)
 
     Args:
         image_bytes: 원본 이미지 바이트
         scale_factor: 확대 비율 (기본 2배)
 
     Returns:
-        확대된 이미지 바이트
+        확대된 이미지 바이트 (JPEG)
     """
-    img = Image.open(io.BytesIO(image_bytes))
+    img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("이미지 디코딩 실패")
 
     # 새 크기 계산
-    new_width = int(img.width * scale_factor)
-    new_height = int(img.height * scale_factor)
+    height, width = img.shape[:2]
+    new_width = int(width * scale_factor)
+    new_height = int(height * scale_factor)
 
     # 고품질 리샘플링으로 확대
-    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    img = cv2.resize(img, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
 
     # 바이트로 변환
-    output = io.BytesIO()
-    img.save(output, format='PNG', optimize=True)
-    return output.getvalue()
+    ok, buf = cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+    if not ok:
+        raise ValueError("이미지 인코딩 실패")
+    return buf.tobytes()
+
+
+def upscale_images(images, scale_factor=2.0, max_workers=None):
+    """
+    여러 이미지를 병렬로 확대
+
+    Args:
+        images: 원본 이미지 바이트 리스트
+        scale_factor: 확대 비율 (기본 2배)
+        max_workers: 스레드 수 (기본 CPU 코어 수)
+
+    Returns:
+        확대된 이미지 바이트 리스트 (입력 순서 유지)
+    """
+    if not images:
+        return []
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(images)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda b: upscale_image(b, scale_factor), images))
 
 
 def preprocess_for_korean_ocr(image_bytes):
@@ -108,33 +221,46 @@ def preprocess_for_korean_ocr(image_bytes):
     - 대비 향상
     - 선명도 향상
     - 약간의 확대
+
+    이미 충분히 크고 대비가 높은 이미지는 원본 바이트를 그대로 반환
+    같은 이미지(반복되는 썸네일 등)는 최근 결과를 재사용
     """
+    return _preprocess_for_korean_ocr(bytes(image_bytes))
+
+
+@lru_cache(maxsize=32)
+def _preprocess_for_korean_ocr(image_bytes):
     img = Image.open(io.BytesIO(image_bytes))
+    # 원본 포맷 (RGB 변환 후에는 None이 되므로 먼저 기록)
+    source_format = img.format
 
     # RGB 변환
     if img.mode != 'RGB':
         img = img.convert('RGB')
 
+    # 0. 전처리가 필요 없는 이미지면 재인코딩 없이 원본 반환
+    # OCR API가 받는 JPEG/PNG만 그대로 보내고 WebP/GIF 등은 아래에서 재인코딩
+    if img.width >= SKIP_PREPROCESS_MIN_WIDTH and source_format in ('JPEG', 'PNG'):
+        gray = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2GRAY)
+        if gray.std() >= SKIP_PREPROCESS_MIN_CONTRAST:
+            return image_bytes
+
     # 1. 약간 확대 (1.5배) - 작은 글자 개선
     if img.width < 1500:
         scale = 1.5
         new_width = int(img.width * scale)
         new_height = int(img.height * scale)
-        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        img = cv2.resize(np.asarray(img), (new_width, new_height),
+                         interpolation=cv2.INTER_LANCZOS4)
+    else:
+        img = np.asarray(img)
 
     # 2. 대비 향상 (한국어는 대비가 중요)
-    enhancer = ImageEnhance.Contrast(img)
-    img = enhancer.enhance(1.6)
-
     # 3. 선명도 향상
-    enhancer = ImageEnhance.Sharpness(img)
-    img = enhancer.enhance(1.4)
-
     # 4. 밝기 약간 조정 (너무 어두운 이미지 개선)
-    enhancer = ImageEnhance.Brightness(img)
-    img = enhancer.enhance(1.1)
+    img = Image.fromarray(
+        _enhance_array(img, contrast=1.6, sharpness=1.4, brightness=1.1)
+    )
 
     # 바이트로 변환
-    output = io.BytesIO()
-    img.save(output, format='PNG', optimize=True, quality=95)
-    return output.getvalue()
+    return _encode_image(img)
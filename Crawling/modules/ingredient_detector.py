@@ -9,10 +9,78 @@ import numpy as np
 from PIL import Image
 import io
 import logging
+import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# 텍스트 영역 감지 시 긴 변이 이 값을 넘으면 축소한 이미지에서 모폴로지/컨투어 수행
+REGION_DOWNSCALE_MIN_SIDE = 3000
+REGION_DOWNSCALE_FACTOR = 0.25
+
+# OpenCL 사용 가능 여부 (가능하면 팽창 연산을 UMat으로 GPU에 넘기고 CPU는 OCR에 사용)
+OPENCL_AVAILABLE = cv2.ocl.haveOpenCL()
+
+# 키워드 탐색 OCR에서 한 번에 인식할 텍스트 박스 수 (키워드가 나오면 나머지 박스 인식 생략)
+RECOGNIZE_CHUNK_SIZE = 8
+
+def _get_reader():
+    """
+    EasyOCR Reader 인스턴스 반환 (ocr_utils_split의 싱글톤을 공유해 프로세스당 모델 한 벌만 로드)
+
+    Raises:
+        ImportError: EasyOCR이 설치되지 않은 경우
+    """
+    from .ocr_utils_split import get_ocr_reader
+    return get_ocr_reader()
+
+
+@lru_cache(maxsize=16)
+def _keyword_pattern(keywords: tuple):
+    """키워드 리터럴 alternation (텍스트를 한 번만 스캔해 키워드 포함 여부 확인)"""
+    if not keywords:
+        return re.compile(r'(?!)')  # 키워드가 없으면 아무것도 매칭하지 않음
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def _readtext_until_keyword(reader, image: np.ndarray, pattern,
+                            chunk_size: int = RECOGNIZE_CHUNK_SIZE):
+    """
+    위에서부터 텍스트 박스를 묶음 단위로 인식하다가 키워드가 나오면 중단
+
+    readtext는 검출된 박스를 모두 인식한 뒤에 반환하므로, 검출(detect)은 한 번만 하고
+    인식(recognize)은 chunk_size개씩 나눠 수행 (키워드가 위쪽에 있으면 아래쪽 인식 생략)
+
+    Args:
+        reader: EasyOCR Reader
+        image: 영역 이미지 배열
+        pattern: 키워드 정규식 (_keyword_pattern)
+        chunk_size: 한 번에 인식할 박스 수
+
+    Returns:
+        (texts, match): 지금까지 인식한 텍스트 리스트, 키워드 매치 (없으면 None)
+    """
+    from easyocr.utils import reformat_input
+
+    img, img_grey = reformat_input(image)
+    horizontal_list, free_list = reader.detect(img)
+    boxes = sorted(horizontal_list[0], key=lambda b: (b[2], b[0]))  # (y_min, x_min) 순
+    free_boxes = free_list[0]
+
+    texts = []
+    for start in range(0, len(boxes), chunk_size):
+        texts.extend(reader.recognize(img_grey, horizontal_list=boxes[start:start + chunk_size],
+                                      free_list=[], detail=0))
+        match = pattern.search(' '.join(texts))
+        if match:
+            return texts, match
+
+    # 기울어진 박스는 마지막에 한 번에 인식
+    if free_boxes:
+        texts.extend(reader.recognize(img_grey, horizontal_list=[], free_list=free_boxes, detail=0))
+    return texts, pattern.search(' '.join(texts))
+
 
 def detect_text_regions(image_array: np.ndarray,
                         min_area: int = 5000,
@@ -35,31 +103,50 @@ def detect_text_regions(image_array: np.ndarray,
         else:
             gray = image_array
 
+        # 큰 이미지는 축소해서 처리 (팽창 비용이 픽셀 수에 비례, 박스는 마지막에 원래 좌표로 환산)
+        scale = REGION_DOWNSCALE_FACTOR if max(gray.shape[:2]) > REGION_DOWNSCALE_MIN_SIDE else 1.0
+        if scale != 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
         # 이진화 (Otsu's method)
         _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
 
-        # 모폴로지 연산 (텍스트 영역 확장)
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (30, 5))  # 가로로 긴 커널
-        dilated = cv2.dilate(binary, kernel, iterations=3)
+        # 모폴로지 연산 (텍스트 영역 확장) - 커널도 축소 비율에 맞춤
+        kernel_size = (max(1, round(30 * scale)), max(1, round(5 * scale)))
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)  # 가로로 긴 커널
+        if OPENCL_AVAILABLE:
+            dilated = cv2.dilate(cv2.UMat(binary), kernel, iterations=3).get()
+        else:
+            dilated = cv2.dilate(binary, kernel, iterations=3)
 
         # 컨투어 찾기
         contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-        # 텍스트 영역 필터링
-        text_regions = []
-
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
-            area = w * h
-            aspect_ratio = w / h if h > 0 else 0
-
-            # 필터 조건
-            if (area > min_area and
-                aspect_ratio_range[0] < aspect_ratio < aspect_ratio_range[1]):
-                text_regions.append((x, y, w, h))
-
-        # 면적 기준 정렬 (큰 것부터)
-        text_regions.sort(key=lambda r: r[2] * r[3], reverse=True)
+        if not contours:
+            logger.info("텍스트 영역 0개 감지")
+            return []
+
+        # 바운딩 박스를 (N, 4) 배열로 모아 면적/비율 필터를 한 번에 적용
+        rects = np.array([cv2.boundingRect(c) for c in contours], dtype=np.int64).reshape(-1, 4)
+        if scale != 1.0:
+            rects = (rects / scale).astype(np.int64)
+            # 축소 크기 반올림으로 원본 경계를 벗어나지 않도록 자름
+            img_h, img_w = image_array.shape[:2]
+            rects[:, 2] = np.minimum(rects[:, 2], img_w - rects[:, 0])
+            rects[:, 3] = np.minimum(rects[:, 3], img_h - rects[:, 1])
+        widths = rects[:, 2]
+        heights = rects[:, 3]
+        areas = widths * heights
+        aspect_ratios = np.divide(widths, heights, out=np.zeros(len(rects)), where=heights > 0)
+
+        # 필터 조건
+        mask = ((areas > min_area) &
+                (aspect_ratios > aspect_ratio_range[0]) &
+                (aspect_ratios < aspect_ratio_range[1]))
+
+        # 면적 기준 정렬 (큰 것부터, 같은 면적은 원래 순서 유지)
+        order = np.argsort(-areas[mask], kind='stable')
+        text_regions = [tuple(r) for r in rects[mask][order].tolist()]
 
         logger.info(f"텍스트 영역 {len(text_regions)}개 감지")
 
@@ -84,8 +171,7 @@ def _scan_bottom_for_keywords(image_array: np.ndarray, keywords: List[str],
         (x, y, w, h) 성분표 영역 또는 None
     """
     try:
-        import easyocr
-        reader = easyocr.Reader(['ko', 'en'], gpu=False, verbose=False)
+        reader = _get_reader()
     except ImportError:
         return None
 
@@ -99,15 +185,12 @@ def _scan_bottom_for_keywords(image_array: np.ndarray, keywords: List[str],
     logger.info(f"긴 이미지 하단 직접 스캔: y={start_y}~{image_height} ({scan_height}px)")
 
     try:
-        result = reader.readtext(bottom_section, detail=0, paragraph=True)
-        text = ' '.join(result)
-
-        # 키워드 탐색
-        for keyword in keywords:
-            if keyword in text:
-                logger.info(f"하단 직접 스캔에서 키워드 발견: '{keyword}'")
-                # 전체 하단 영역을 성분표 영역으로 반환
-                return (0, start_y, image_width, scan_height)
+        # 키워드 탐색 (키워드가 나오면 나머지 인식 생략)
+        _, match = _readtext_until_keyword(reader, bottom_section, _keyword_pattern(tuple(keywords)))
+        if match:
+            logger.info(f"하단 직접 스캔에서 키워드 발견: '{match.group()}'")
+            # 전체 하단 영역을 성분표 영역으로 반환
+            return (0, start_y, image_width, scan_height)
 
     except Exception as e:
         logger.debug(f"하단 직접 스캔 실패: {str(e)}")
@@ -202,13 +285,16 @@ def detect_ingredient_region(image_array: np.ndarray,
 
         # EasyOCR로 각 영역 빠르게 스캔
         try:
-            import easyocr
-            reader = easyocr.Reader(['ko', 'en'], gpu=False, verbose=False)
+            reader = _get_reader()
         except ImportError:
             logger.warning("EasyOCR을 사용할 수 없습니다. 전체 영역을 반환합니다.")
             # EasyOCR 없으면 가장 큰 영역 반환
             return text_regions[0] if text_regions else None
 
+        # 영역별 OCR 결과 (키워드 탐색에서 읽은 영역은 밀도 기반 폴백에서 다시 읽지 않음)
+        region_texts = {}
+        keyword_pattern = _keyword_pattern(tuple(keywords))
+
         # 각 영역을 스캔하여 키워드 찾기
         for region in text_regions[:10]:  # 상위 10개 영역 검사
             x, y, w, h = region
@@ -216,31 +302,29 @@ def detect_ingredient_region(image_array: np.ndarray,
             # 영역 크롭
             cropped = image_array[y:y+h, x:x+w]
 
-            # OCR 수행 (빠른 모드)
+            # OCR 수행 + 키워드 체크 (키워드가 나오면 나머지 인식 생략)
             try:
-                result = reader.readtext(cropped, detail=0, paragraph=True)
-                text = ' '.join(result)
-
-                logger.debug(f"영역 ({x}, {y}, {w}, {h}): {text[:50]}")
-
-                # 키워드 체크
-                for keyword in keywords:
-                    if keyword in text:
-                        logger.info(f"성분표 키워드 발견: '{keyword}' at ({x}, {y}, {w}, {h})")
-
-                        # 영역이 너무 작으면 (키워드만 감지된 경우) 위아래로 확장
-                        if w * h < 50000:  # 약 200x250 이하면 확장
-                            image_height = image_array.shape[0]
-                            image_width = image_array.shape[1]
-                            # 키워드 위치 기준 위로 500px, 아래로 이미지 끝까지
-                            expand_up = min(500, y)  # 위로 최대 500px
-                            new_y = y - expand_up
-                            new_h = image_height - new_y
-                            expanded_region = (0, new_y, image_width, new_h)
-                            logger.info(f"영역 확장 (작은 영역): {region} -> {expanded_region}")
-                            return expanded_region
-
-                        return region
+                result, match = _readtext_until_keyword(reader, cropped, keyword_pattern)
+                region_texts[region] = result
+
+                logger.debug(f"영역 ({x}, {y}, {w}, {h}): {' '.join(result)[:50]}")
+
+                if match:
+                    logger.info(f"성분표 키워드 발견: '{match.group()}' at ({x}, {y}, {w}, {h})")
+
+                    # 영역이 너무 작으면 (키워드만 감지된 경우) 위아래로 확장
+                    if w * h < 50000:  # 약 200x250 이하면 확장
+                        image_height = image_array.shape[0]
+                        image_width = image_array.shape[1]
+                        # 키워드 위치 기준 위로 500px, 아래로 이미지 끝까지
+                        expand_up = min(500, y)  # 위로 최대 500px
+                        new_y = y - expand_up
+                        new_h = image_height - new_y
+                        expanded_region = (0, new_y, image_width, new_h)
+                        logger.info(f"영역 확장 (작은 영역): {region} -> {expanded_region}")
+                        return expanded_region
+
+                    return region
 
             except Exception as e:
                 logger.debug(f"영역 OCR 실패: {str(e)}")
@@ -260,10 +344,14 @@ def detect_ingredient_region(image_array: np.ndarray,
 
             for region in bottom_regions[:3]:  # 상위 3개만 검사
                 x, y, w, h = region
-                cropped = image_array[y:y+h, x:x+w]
                 try:
-                    result = reader.readtext(cropped, detail=0, paragraph=True)
-                    text_len = sum(len(t) for t in result)
+                    result = region_texts.get(region)
+                    if result is None:
+                        # 키워드 탐색 결과와 같은 박스 단위 텍스트로 읽음
+                        cropped = image_array[y:y+h, x:x+w]
+                        result = reader.readtext(cropped, detail=0, paragraph=False)
+                    # 공백은 세지 않음 (읽은 방식에 따라 박스 사이 공백 수가 달라지지 않도록)
+                    text_len = sum(len(t) - t.count(' ') for t in result)
                     if text_len > best_text_len:
                         best_text_len = text_len
                         best_region = region
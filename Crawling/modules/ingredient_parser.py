@@ -3,6 +3,8 @@
 """
 import re
 import logging
+from functools import lru_cache
+from itertools import islice
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -315,6 +317,8 @@ _INGREDIENT_PATTERN_STRS = [
     r'^C\d+-\d+.+$',  # 탄화수소 계열 (C11-13아이소알케인 등)
 ]
 INGREDIENT_PATTERNS = [re.compile(p) for p in _INGREDIENT_PATTERN_STRS]
+# 전체 패턴을 하나의 alternation으로 결합 (패턴별 반복 매칭 대신 1회 매칭)
+INGREDIENT_PATTERN = re.compile('|'.join(f'(?:{p})' for p in _INGREDIENT_PATTERN_STRS))
 
 # 영문 성분 키워드 (CamelCase 등 복합 패턴용)
 ENGLISH_INGREDIENT_KEYWORDS = frozenset([
@@ -358,6 +362,7 @@ _NOISE_PATTERN_STRS = [
     r'^[A-Z]{2,6}\d*$',  # 순수 대문자 약어 (SPF50 제외, 위에서 처리)
 ]
 NOISE_PATTERNS = [re.compile(p) for p in _NOISE_PATTERN_STRS]
+NOISE_PATTERN = re.compile('|'.join(f'(?:{p})' for p in _NOISE_PATTERN_STRS))
 
 # 성분 키워드 (실제 성분 리스트를 나타내는 키워드)
 INGREDIENT_KEYWORDS = [
@@ -396,6 +401,12 @@ INGREDIENT_STOP_KEYWORDS = [
     '(INCI)', 'INCI:', 'INCI Name',
 ]
 
+# 키워드 목록 포함 여부를 한 번의 스캔으로 확인하는 리터럴 alternation
+# (any(kw in line for kw in ...)와 동일, 키워드마다 줄을 다시 훑지 않음)
+_RE_EXCLUDE_SECTION = re.compile('|'.join(map(re.escape, INGREDIENT_EXCLUDE_SECTIONS)))
+_RE_INGREDIENT_KEYWORD = re.compile('|'.join(map(re.escape, INGREDIENT_KEYWORDS)))
+_RE_STOP_KEYWORD = re.compile('|'.join(map(re.escape, INGREDIENT_STOP_KEYWORDS)))
+
 # 메타데이터 키워드 (성분이 아닌 제품 정보)
 METADATA_KEYWORDS = [
     '제조업자', '책임판매업자', '판매업자', '제조국', '원산지',
@@ -463,8 +474,12 @@ INGREDIENT_STOPWORDS = [
     '트라이',  # 트라이~ 분리
 ]
 
+# 불용어 조회용: 완전 일치는 set, 포함 체크는 4자 이상 불용어만 미리 추려둠
+_STOPWORD_SET = frozenset(INGREDIENT_STOPWORDS)
+_LONG_STOPWORDS = tuple(sw for sw in INGREDIENT_STOPWORDS if len(sw) >= 4)
+
 # 알려진 화장품 성분 데이터베이스
-KNOWN_INGREDIENTS = {
+KNOWN_INGREDIENTS = frozenset({
     # 물/용매
     '정제수', '물', 'Water', 'Aqua',
 
@@ -766,7 +781,75 @@ KNOWN_INGREDIENTS = {
     '적색102호', '적색201호', '적색202호',
     '청색1호', 'Blue1', 'CI42090',
     '청색2호', 'Blue2', 'CI73015',
+})
+
+
+# 성분명 정규화 정규식 - 컴파일하여 성능 최적화 (성분 토큰마다 호출되는 경로)
+_RE_HANGUL_START = re.compile(r'^[가-힣]')
+_RE_WHITESPACE = re.compile(r'\s+')
+# OCR 오인식 키가 하나라도 있는지 한 번에 검사 (없으면 순차 치환 생략)
+_RE_OCR_WRONG = re.compile('|'.join(map(re.escape, OCR_CORRECTIONS)))
+# ±, ·, 깨진 문자(�) 삭제 테이블
+_NAME_DELETE_TABLE = str.maketrans('', '', '±·�')
+_RE_CHEM_NUMBER_PREFIX = re.compile(r'^\d,\d-')
+_RE_LEADING_NOISE = re.compile(r'^[0-9=|!@#$%^&*<>]+')
+_RE_CONCENTRATION_PAREN = re.compile(
+    r'\(\s*[\d,\.]+\s*(ppb|ppm|%|mg/kg|µg/kg|mg/L|µg/L|g/L|w/w|w/v|v/v|mg|g|ml|L|kg)?\s*\)',
+    re.IGNORECASE,
+)
+_RE_CI_CODE_PAREN = re.compile(r'^CI\s*\d+$', re.IGNORECASE)
+_RE_CARBON_CHAIN = re.compile(r'^C\d+[-]?\d*')
+_RE_NUMBER_RANGE = re.compile(r'^\d+[-]\d+')
+_RE_PAREN = re.compile(r'\(([^)]*)\)')
+_RE_BRACKET = re.compile(r'\[[^\]]*\]')
+_DECORATION_DELETE_TABLE = str.maketrans('', '', '*★☆※')
+_RE_EDGE_SYMBOLS = re.compile(r'^[^\w가-힣()]+|[^\w가-힣()]+$', re.UNICODE)
+
+
+# 성분 구분 쉼표 (숫자,숫자- 형태의 화학 번호 쉼표는 제외: 1,2- 2,3- 등)
+_RE_LIST_COMMA = re.compile(r',(?!\d-)')  # 화학 번호(1,2-) 쉼표를 제외한 목록 구분 쉼표
+SPACE_SEPARATED_COMMA_LIMIT = 5  # 목록 쉼표가 이보다 적으면 공백 구분자 텍스트로 판단
+_RE_INGREDIENT_SEPARATOR = re.compile(r',(?!\d-)|(?<!\d),')
+
+
+# 마지막 단계 OCR 오타 (키끼리 겹치지 않고 치환 결과가 다른 키를 만들지 않아 한 번의 스캔으로 처리)
+_OCR_TYPO_FIXES = {
+    '에칠': '에틸',
+    '애씨드': '애시드',
+    '다이메i콘': '다이메티콘',
+    '피이지': 'PEG',
+    '비에이치티': 'BHT',
 }
+_RE_OCR_TYPO = re.compile('|'.join(map(re.escape, _OCR_TYPO_FIXES)))
+
+
+def apply_ocr_corrections(name: str) -> str:
+    """
+    OCR_CORRECTIONS 순차 치환 (치환 순서에 의존하므로 순서 유지)
+
+    오인식 키가 하나도 없으면 치환이 일어날 수 없으므로 정규식 한 번으로 판정하고 반환
+    """
+    if not _RE_OCR_WRONG.search(name):
+        return name
+    for wrong, correct in OCR_CORRECTIONS.items():
+        name = name.replace(wrong, correct)
+    return name
+
+
+def _keep_chemical_paren(match) -> str:
+    """괄호 치환 콜백: 화학명 괄호는 보존, 그 외(농도, 설명 등)는 제거"""
+    content = match.group(1)
+    # CI + 숫자 패턴 (색소): CI77891, CI 77007 등
+    if _RE_CI_CODE_PAREN.match(content):
+        return match.group(0)
+    # 탄소 사슬 패턴: C6-14, C12-15 등 (+ 한글/영문 가능)
+    if _RE_CARBON_CHAIN.match(content):
+        return match.group(0)
+    # 숫자-숫자 패턴: 6-14, 12-15 등
+    if _RE_NUMBER_RANGE.match(content):
+        return match.group(0)
+    # 그 외는 제거 (농도, 설명 등)
+    return ''
 
 
 def normalize_ingredient_name(name: str) -> str:
@@ -779,6 +862,9 @@ def normalize_ingredient_name(name: str) -> str:
     Returns:
         str: 정규화된 성분명
     """
+    if not name:
+        return ''
+
     # 0. 성분 앞에 붙은 키워드 제거 (전성분변성알코올 → 변성알코올, 주성분옥틸도데칸올 → 옥틸도데칸올)
     prefix_keywords = [
         '전성분', '[전성분]', '(전성분)', '성분:', '성분',
@@ -808,7 +894,7 @@ def normalize_ingredient_name(name: str) -> str:
         if name.startswith(prefix) and len(name) > len(prefix):
             # 접두사 뒤에 한글이 오는 경우만 제거
             rest = name[len(prefix):]
-            if rest and re.match(r'^[가-힣]', rest):
+            if rest and _RE_HANGUL_START.match(rest):
                 name = rest
 
     # 0-3. 한글 노이즈 접두사 제거 (슈퍼9콤플렉스아보카도 → 아보카도)
@@ -823,59 +909,43 @@ def normalize_ingredient_name(name: str) -> str:
                 name = rest
 
     # 1. 공백 제거
-    name = re.sub(r'\s+', '', name)
+    name = _RE_WHITESPACE.sub('', name)
+    if not name:
+        return ''
 
     # 2. OCR 오류 수정
-    for wrong, correct in OCR_CORRECTIONS.items():
-        name = name.replace(wrong, correct)
+    name = apply_ocr_corrections(name)
 
-    # 3. 특수문자 정규화
-    name = name.replace('±', '')
-    name = name.replace('·', '')
-    name = re.sub(r'[�]', '', name)  # 깨진 문자 제거
+    # 3. 특수문자 정규화 (±, ·, 깨진 문자 제거)
+    name = name.translate(_NAME_DELETE_TABLE)
 
     # 3.5 앞부분 OCR 잡음 제거 (숫자, 특수문자로 시작하는 경우)
     # 예: "10|하이드록사이드" → "하이드록사이드", "=10|드로사이드" → "드로사이드"
     # 주의: 1,2-헥산다이올 같은 화학 번호 접두사는 보존
-    if not re.match(r'^\d,\d-', name):  # 화학 번호 패턴이 아닌 경우만 제거
-        name = re.sub(r'^[0-9=|!@#$%^&*<>]+', '', name)
+    # 대부분의 성분명은 한글로 시작하므로 첫 글자 비교로 정규식 호출 자체를 생략
+    if name and not ('가' <= name[0] <= '힣') and not _RE_CHEM_NUMBER_PREFIX.match(name):  # 화학 번호 패턴이 아닌 경우만 제거
+        name = _RE_LEADING_NOISE.sub('', name)
 
     # 4. 괄호 내용 제거 (Phase 1-2: 농도/함량 괄호 우선 처리)
     # 농도/함량 괄호 먼저 제거 (숫자+단위): 솔비톨(44.79%), 니코틴산아마이드(10ppm) 등
     # 지원 단위: %, ppb, ppm, mg/kg, µg/kg, mg/L, µg/L, g/L, w/w, w/v, v/v, mg, g, ml, L, kg
-    concentration_pattern = r'\(\s*[\d,\.]+\s*(ppb|ppm|%|mg/kg|µg/kg|mg/L|µg/L|g/L|w/w|w/v|v/v|mg|g|ml|L|kg)?\s*\)'
-    name = re.sub(concentration_pattern, '', name, flags=re.IGNORECASE)
-
-    # 화학명 괄호는 보존 (C6-14올레핀, CI77891 등)
-    def should_keep_paren(match):
-        content = match.group(1)
-        # CI + 숫자 패턴 (색소): CI77891, CI 77007 등
-        if re.match(r'^CI\s*\d+$', content, re.IGNORECASE):
-            return match.group(0)
-        # 탄소 사슬 패턴: C6-14, C12-15 등 (+ 한글/영문 가능)
-        if re.match(r'^C\d+[-]?\d*', content):
-            return match.group(0)
-        # 숫자-숫자 패턴: 6-14, 12-15 등
-        if re.match(r'^\d+[-]\d+', content):
-            return match.group(0)
-        # 그 외는 제거 (농도, 설명 등)
-        return ''
-
-    name = re.sub(r'\(([^)]*)\)', should_keep_paren, name)
-    name = re.sub(r'\[[^\]]*\]', '', name)
+    # 괄호가 없으면 괄호 관련 정규식은 매치될 수 없으므로 생략
+    if '(' in name:
+        name = _RE_CONCENTRATION_PAREN.sub('', name)
+        # 화학명 괄호는 보존 (C6-14올레핀, CI77891 등)
+        name = _RE_PAREN.sub(_keep_chemical_paren, name)
+    if '[' in name:
+        name = _RE_BRACKET.sub('', name)
 
     # 5. 기타 특수문자 제거
-    name = re.sub(r'[*★☆※]', '', name)
+    name = name.translate(_DECORATION_DELETE_TABLE)
 
-    # 6. 앞뒤 특수문자 제거 (괄호는 보존)
-    name = re.sub(r'^[^\w가-힣()]+|[^\w가-힣()]+$', '', name, flags=re.UNICODE)
+    # 6. 앞뒤 특수문자 제거 (괄호는 보존) - 양 끝이 이미 글자/숫자/괄호면 생략
+    if name and not ((name[0].isalnum() or name[0] in '()') and (name[-1].isalnum() or name[-1] in '()')):
+        name = _RE_EDGE_SYMBOLS.sub('', name)
 
     # 7. OCR 오타 수정
-    name = name.replace('에칠', '에틸')
-    name = name.replace('애씨드', '애시드')
-    name = name.replace('다이메i콘', '다이메티콘')
-    name = name.replace('피이지', 'PEG')
-    name = name.replace('비에이치티', 'BHT')
+    name = _RE_OCR_TYPO.sub(lambda m: _OCR_TYPO_FIXES[m.group(0)], name)
 
     return name.strip()
 
@@ -933,6 +1003,38 @@ CHEMICAL_ENDING_EXCEPTIONS = frozenset([
 ])
 
 
+# 성분 유효성 검증 정규식 - 컴파일하여 성능 최적화
+_RE_PURE_NUMBER = re.compile(r'^[\d\.\-/]+$')
+_RE_PHONE_NUMBER = re.compile(r'^\d{2,4}-\d{3,4}-\d{4}$')
+_RE_DIMENSION = re.compile(r'^\d+(\.\d+)?(cm|mm|g|mg|ml|L|kg)$')
+_RE_PRODUCT_DESCRIPTION = re.compile(r'^(POINT|STEP|TIP|NOTE|PDRN)\d*$', re.IGNORECASE)
+_RE_KOREAN_2CHAR = re.compile(r'^[가-힣]{2}$')
+_RE_VERB_ENDING = re.compile(r'(할|된|한|는|을|를|가|이|에|로|의|과|와|도|만|서|라|다)$')
+_RE_PURE_ENGLISH = re.compile(r'^[A-Za-z]+$')
+# 영문 화학 접미사/접두사 (두 패턴을 하나의 alternation으로 묶어 한 번만 검사)
+# - 화학 접미사: .*(ol|ate|ide|ine|one|ene|ose|ase|ane|yl|ic|in)$
+# - 접두사 패턴: ^(Hydrogenated|Hydrolyzed|PEG|PPG|CI)\d*.*$
+_RE_ENGLISH_AFFIX = re.compile(
+    r'.*(?:ol|ate|ide|ine|one|ene|ose|ase|ane|yl|ic|in)$'
+    r'|^(?:Hydrogenated|Hydrolyzed|PEG|PPG|CI)\d*.*$',
+    re.IGNORECASE
+)
+_RE_CI_CODE = re.compile(r'^CI\s*\d+$')
+_RE_PEG_PPG = re.compile(r'^(PEG|PPG|폴리에틸렌글라이콜|폴리프로필렌글라이콜)[-\s]?\d+')
+_RE_ETHOXYLATE = re.compile(r'^(라우레스|세테스|올레스|스테아레스|세테아레스|폴리소르베이트|솔비탄)[-\s]?\d+')
+_RE_ETHOXYLATE_EXTENDED = re.compile(r'^(글리세레스|폴리글리세릴|세테스|올레스|스테아레스|트라이데세스)[-]?\d+.*$')
+_RE_ENZYME_CANDIDATE = re.compile(r'^.{2,}(아제|라아제|인)$')
+_RE_VERB_MODIFIER = re.compile(r'(하는|되는|있는|없는)$')
+_RE_KOREAN_IN_ENDING = re.compile(r'^[가-힣]{2,}인$')
+_RE_AMINO_ACID_SALT = re.compile(r'.+(에이치씨엘|하이드로클로라이드|염산염|황산염|질산염)$')
+_RE_PLANT_DERIVED = re.compile(r'^[가-힣]{2,}(오일|전분|버터)$')
+_RE_CELLULOSE = re.compile(r'^.+(셀룰로오스|셀룰로스)$')
+_RE_ENGLISH_CHEMICAL = re.compile(r'^[A-Z][a-z]{3,}(yl|ol|in|ate|ide|ene|one|ose|ine|ane|ene)$')
+_RE_ALNUM_COMPOUND = re.compile(r'^[A-Za-z]+[-]?\d+[A-Za-z]*$')
+_RE_LONG_DIGITS = re.compile(r'^\d{5,}$')
+_RE_SPEC_MARKETING = re.compile(r'^(SPF|PA|UV|LED|SUPER|STEP|POINT|TIP|EXTRA|PLUS)\d+', re.IGNORECASE)
+
+
 def _check_fast_rejection(text: str) -> tuple:
     """
     빠른 거부 필터 (성능 최적화)
@@ -941,19 +1043,19 @@ def _check_fast_rejection(text: str) -> tuple:
         tuple: (is_rejected: bool, reason: str) - 거부 시 (True, reason), 아니면 (False, "")
     """
     # 순수 숫자 또는 숫자+단위 거부
-    if re.match(r'^[\d\.\-/]+$', text):
+    if _RE_PURE_NUMBER.match(text):
         return True, "pure_number"
 
     # 전화번호 패턴 거부
-    if re.match(r'^\d{2,4}-\d{3,4}-\d{4}$', text):
+    if _RE_PHONE_NUMBER.match(text):
         return True, "phone_number"
 
     # 치수/용량 패턴 거부 (예: 18.5cm, 5.3cm, 8.8g)
-    if re.match(r'^\d+(\.\d+)?(cm|mm|g|mg|ml|L|kg)$', text):
+    if _RE_DIMENSION.match(text):
         return True, "dimension"
 
     # 제품 설명 텍스트 거부 (POINT01, STEP1, PDRN5 등)
-    if re.match(r'^(POINT|STEP|TIP|NOTE|PDRN)\d*$', text, re.IGNORECASE):
+    if _RE_PRODUCT_DESCRIPTION.match(text):
         return True, "product_description"
 
     # 2글자 한글 단어 중 성분이 아닌 것 거부
@@ -965,11 +1067,11 @@ def _check_fast_rejection(text: str) -> tuple:
         # 추가: 잘못 파싱된 2글자 단어들
         '중산', '감염', '아가', '초유', '소듐', '트리', '오일', '부탄', '프로', '메틸',
     }
-    if len(text) == 2 and re.match(r'^[가-힣]{2}$', text) and text in INVALID_2CHAR_KOREAN:
+    if len(text) == 2 and _RE_KOREAN_2CHAR.match(text) and text in INVALID_2CHAR_KOREAN:
         return True, "invalid_2char"
 
     # 한글 동사형 어미로 끝나는 단어 거부
-    if re.search(r'(할|된|한|는|을|를|가|이|에|로|의|과|와|도|만|서|라|다)$', text):
+    if _RE_VERB_ENDING.search(text):
         # 화학 성분명 어미 예외 체크
         if not any(text.endswith(suffix) for suffix in CHEMICAL_ENDING_EXCEPTIONS):
             return True, "verb_ending"
@@ -984,18 +1086,17 @@ def _is_noise_or_stopword(text: str) -> tuple:
     Returns:
         tuple: (is_invalid: bool, reason: str)
     """
-    # 노이즈 패턴 매칭
-    for pattern in NOISE_PATTERNS:
-        if pattern.match(text):  # 컴파일된 패턴 사용
-            return True, "noise"
+    # 노이즈 패턴 매칭 (결합된 단일 패턴)
+    if NOISE_PATTERN.match(text):
+        return True, "noise"
 
     # 완전 일치 불용어
-    if text in INGREDIENT_STOPWORDS:
+    if text in _STOPWORD_SET:
         return True, "stopword"
 
     # === 영문 노이즈 필터링 ===
     # 순수 영문 단어 중 화학 성분이 아닌 것 거부
-    if re.match(r'^[A-Za-z]+$', text):
+    if _RE_PURE_ENGLISH.match(text):
         # 허용되는 영문 성분 패턴
         VALID_ENGLISH_INGREDIENTS = {
             'Water', 'Aqua', 'Glycerin', 'Niacinamide', 'Panthenol', 'Retinol',
@@ -1004,14 +1105,9 @@ def _is_noise_or_stopword(text: str) -> tuple:
             'Dimethicone', 'Silicone', 'Paraben', 'BHT', 'BHA', 'PEG', 'PPG',
             'MEA', 'TEA', 'DEA', 'EDTA', 'CI', 'UV',
         }
-        # 영문 성분 접미사 패턴
-        ENGLISH_SUFFIX_PATTERNS = [
-            r'.*(ol|ate|ide|ine|one|ene|ose|ase|ane|yl|ic|in)$',  # 화학 접미사
-            r'^(Hydrogenated|Hydrolyzed|PEG|PPG|CI)\d*.*$',  # 접두사 패턴
-        ]
-
         is_valid_english = text in VALID_ENGLISH_INGREDIENTS
-        has_chemical_suffix = any(re.match(p, text, re.IGNORECASE) for p in ENGLISH_SUFFIX_PATTERNS)
+        # 영문 성분 접미사/접두사 패턴
+        has_chemical_suffix = bool(_RE_ENGLISH_AFFIX.match(text))
 
         if not is_valid_english and not has_chemical_suffix:
             # 일반 영문 단어 (노이즈)
@@ -1020,10 +1116,8 @@ def _is_noise_or_stopword(text: str) -> tuple:
 
     # 불용어 포함 체크: 긴 텍스트(12자 이상)에만 적용
     # 짧은 성분명에서 오탐 방지
-    if len(text) >= 12:
-        for stopword in INGREDIENT_STOPWORDS:
-            if len(stopword) >= 4 and stopword in text:
-                return True, "contains_stopword"
+    if len(text) >= 12 and any(sw in text for sw in _LONG_STOPWORDS):
+        return True, "contains_stopword"
 
     return False, ""
 
@@ -1035,49 +1129,48 @@ def _check_chemical_patterns(text: str) -> tuple:
     Returns:
         tuple: (is_valid: bool, confidence: float, reason: str) 또는 None
     """
-    # 기본 화학 패턴 (INGREDIENT_PATTERNS - 컴파일된 패턴)
-    for pattern in INGREDIENT_PATTERNS:
-        if pattern.match(text):  # 컴파일된 패턴 사용
-            return True, 0.9, "pattern_match"
+    # 기본 화학 패턴 (INGREDIENT_PATTERNS를 결합한 단일 패턴)
+    if INGREDIENT_PATTERN.match(text):
+        return True, 0.9, "pattern_match"
 
     # CI 코드 (색소)
-    if re.match(r'^CI\s*\d+$', text):
+    if _RE_CI_CODE.match(text):
         return True, 0.95, "ci_colorant"
 
     # PEG/PPG 계열
-    if re.match(r'^(PEG|PPG|폴리에틸렌글라이콜|폴리프로필렌글라이콜)[-\s]?\d+', text):
+    if _RE_PEG_PPG.match(text):
         return True, 0.9, "peg_ppg"
 
     # 에톡실레이트 계열 (라우레스-9, 세테스-20 등)
-    if re.match(r'^(라우레스|세테스|올레스|스테아레스|세테아레스|폴리소르베이트|솔비탄)[-\s]?\d+', text):
+    if _RE_ETHOXYLATE.match(text):
         return True, 0.9, "ethoxylate"
 
     # === Phase 2 추가: 확장 패턴 ===
 
     # 에톡실레이트 확장 (하이픈+숫자 복합형): 글리세레스-26, 폴리글리세릴-10미리스테이트 등
-    if re.match(r'^(글리세레스|폴리글리세릴|세테스|올레스|스테아레스|트라이데세스)[-]?\d+.*$', text):
+    if _RE_ETHOXYLATE_EXTENDED.match(text):
         return True, 0.9, "ethoxylate_extended"
 
     # 효소 패턴: ~아제, ~라아제 (단, 동사 어미 제외)
     # 파파인, 브로멜라인, 리파아제, 프로테아제 등
-    if re.match(r'^.{2,}(아제|라아제|인)$', text):
+    if _RE_ENZYME_CANDIDATE.match(text):
         # '~하는', '~되는' 등 동사형이 아닌지 확인
-        if not re.search(r'(하는|되는|있는|없는)$', text):
+        if not _RE_VERB_MODIFIER.search(text):
             # '인'으로 끝나는 경우 더 엄격하게 검증 (효소명 패턴)
             if text.endswith('인') and len(text) >= 3:
                 # 파파인, 브로멜라인, 트립신, 펩신 등 효소/단백질명
-                if re.match(r'^[가-힣]{2,}인$', text):
+                if _RE_KOREAN_IN_ENDING.match(text):
                     return True, 0.85, "enzyme"
             elif text.endswith('아제') or text.endswith('라아제'):
                 return True, 0.85, "enzyme"
 
     # 아미노산+염 패턴: ~에이치씨엘, ~하이드로클로라이드, ~염산염
-    if re.match(r'.+(에이치씨엘|하이드로클로라이드|염산염|황산염|질산염)$', text):
+    if _RE_AMINO_ACID_SALT.match(text):
         return True, 0.85, "amino_acid_salt"
 
     # 식물 유래 패턴: ~오일, ~전분, ~버터 (4자 이상)
     if len(text) >= 4:
-        if re.match(r'^[가-힣]{2,}(오일|전분|버터)$', text):
+        if _RE_PLANT_DERIVED.match(text):
             return True, 0.85, "plant_derived"
 
     # 글루코사이드 패턴: ~글루코사이드
@@ -1085,7 +1178,7 @@ def _check_chemical_patterns(text: str) -> tuple:
         return True, 0.85, "glucoside"
 
     # 셀룰로오스 유도체: ~셀룰로오스, ~셀룰로스
-    if re.match(r'^.+(셀룰로오스|셀룰로스)$', text) and len(text) >= 6:
+    if _RE_CELLULOSE.match(text) and len(text) >= 6:
         return True, 0.85, "cellulose_derivative"
 
     # === 영문 노이즈 블랙리스트 체크 (화학 패턴 매칭 전) ===
@@ -1106,15 +1199,15 @@ def _check_chemical_patterns(text: str) -> tuple:
 
     # 영문 화학명 패턴 (예: Glycerin, Tocopherol)
     # 반드시 화학 접미사가 있어야 함
-    if re.match(r'^[A-Z][a-z]{3,}(yl|ol|in|ate|ide|ene|one|ose|ine|ane|ene)$', text):
+    if _RE_ENGLISH_CHEMICAL.match(text):
         return True, 0.8, "english_chemical"
 
     # 복합 성분명 (영문+숫자, 예: PEG-14M, CI77891)
     # SPF, PA 등 제품 규격은 제외
-    if re.match(r'^[A-Za-z]+[-]?\d+[A-Za-z]*$', text) and len(text) >= 4:
-        if not re.match(r'^\d{5,}$', text):
+    if _RE_ALNUM_COMPOUND.match(text) and len(text) >= 4:
+        if not _RE_LONG_DIGITS.match(text):
             # SPF, PA, SUPER, STEP, POINT 등 규격/마케팅 패턴 제외
-            if not re.match(r'^(SPF|PA|UV|LED|SUPER|STEP|POINT|TIP|EXTRA|PLUS)\d+', text, re.IGNORECASE):
+            if not _RE_SPEC_MARKETING.match(text):
                 return True, 0.75, "alphanumeric_compound"
 
     return None
@@ -1132,6 +1225,20 @@ def _is_korean_chemical(text: str) -> bool:
     return has_prefix or has_suffix
 
 
+# 알려진 성분 DB의 정규화 표기 (casefold 키 → 정규화된 DB 표기, import 시 한 번만 계산)
+# 정규화된 성분명이 DB와 대소문자만 다를 때 DB 표기로 통일 (AQUA → Aqua)
+KNOWN_INGREDIENTS_CANONICAL = {
+    normalize_ingredient_name(k).casefold(): normalize_ingredient_name(k)
+    for k in sorted(KNOWN_INGREDIENTS)
+}
+KNOWN_INGREDIENTS_NORM = frozenset(KNOWN_INGREDIENTS_CANONICAL)
+
+
+def _canonical_known_name(name: str) -> str:
+    """알려진 성분이면 DB 표기로, 아니면 그대로 반환"""
+    return KNOWN_INGREDIENTS_CANONICAL.get(name.casefold(), name)
+
+
 def is_valid_ingredient(text: str, known_db: set = KNOWN_INGREDIENTS) -> tuple:
     """
     성분명 유효성 검증 (리팩토링 버전 - Early Return 패턴)
@@ -1151,7 +1258,11 @@ def is_valid_ingredient(text: str, known_db: set = KNOWN_INGREDIENTS) -> tuple:
 
     # 1. 알려진 성분 DB 매칭 (최고 우선순위)
     # known_db에 있으면 다른 필터 무시하고 바로 승인
-    if text in known_db:
+    # 기본 DB는 casefold 키로도 조회 (정규화된 성분명이 대소문자만 다른 경우)
+    # 원문 그대로의 텍스트('향료*' 등)는 정규화하지 않으므로 기존처럼 아래 필터를 거침
+    if text in known_db or (
+        known_db is KNOWN_INGREDIENTS and text.casefold() in KNOWN_INGREDIENTS_NORM
+    ):
         return True, 1.0, "known_ingredient"
 
     # 2. 빠른 거부 필터
@@ -1179,6 +1290,37 @@ def is_valid_ingredient(text: str, known_db: set = KNOWN_INGREDIENTS) -> tuple:
     return False, 0.0, "no_pattern_match"
 
 
+# 실제 성분명 패턴 (성분 시작 검증용) - 확장
+REAL_INGREDIENT_PATTERNS = [
+    '정제수', '티타늄', '글리세린', '부틸렌', '나이아신', '다이메티콘',
+    '사이클로', '에칠헥실', '소듐', '토코페롤', '히알루론', '알란토인',
+    '판테놀', '아데노신', '세라마이드', '콜라겐', '레티놀', '비타민',
+    '프로판다이올', '카보머', '페녹시에탄올', '향료', '시트릭', '스쿠알란',
+    '세틸알코올', '헥산다이올', '알지닌', '세린', '폴리소르베이트',
+    '아이소도데케인', '헥실렌글라이콜', '리모넨', '리날룰',
+]
+_RE_REAL_INGREDIENT = re.compile('|'.join(map(re.escape, REAL_INGREDIENT_PATTERNS)))
+
+# extract_from_text 전처리용 패턴 (호출마다 re 캐시 조회하지 않도록 미리 컴파일)
+_RE_HEADER_TAIL = re.compile(
+    r'(?:법에\s*따라|하여야\s*하는|모든\s*성분|전성분|성분은|성분:|\[성분명\]|성분명\]|INGREDIENTS?)\s*(.+)',
+    re.IGNORECASE
+)
+_RE_JOIN_HANGUL = re.compile(r'([가-힣])\s+([가-힣])')
+_RE_JOIN_IDE = re.compile(r'([가-힣])\s+(이드-?\d+)')
+_RE_JOIN_RATE = re.compile(r'([가-힣])\s+(레이트)')
+_RE_JOIN_NUMBER_HANGUL = re.compile(r'(-\d+)\s+([가-힣])')
+_RE_JOIN_HANGUL_NUMBER = re.compile(r'([가-힣])\s+(-\d+)')
+_RE_JOIN_ALNUM_HANGUL = re.compile(r'([A-Za-z0-9-]+)\s+([가-힣])')
+_RE_JOIN_HYPHEN_DIGIT = re.compile(r'([가-힣])-\s+(\d)')
+_RE_THOUSANDS_COMMA = re.compile(r'(\d),(\d{3})(?!\d)')
+_RE_CONCENTRATION_VALUE = re.compile(r'\(\s*[\d\.]+\s*(ppm|ppb|PPM|PPB)?\s*\)')
+_RE_NUMBER_ONLY_PAREN = re.compile(r'\(\s*[\d\.]+\s*\)')
+_RE_PPM_WORD = re.compile(r'\bppm\b', re.IGNORECASE)
+_RE_PPB_WORD = re.compile(r'\bppb\b', re.IGNORECASE)
+_RE_ATTACHED_CONCENTRATION = re.compile(r'(\D)\d+\s*(ppm|ppb)', re.IGNORECASE)
+
+
 def extract_from_text(text: str, source: str, threshold: float = None, force_mode: bool = False, use_v2: bool = True) -> list:
     """
     텍스트에서 성분 추출
@@ -1222,22 +1364,13 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
         else:
             threshold = 0.85
 
-    # 실제 성분명 패턴 (성분 시작 검증용) - 확장
-    REAL_INGREDIENT_PATTERNS = [
-        '정제수', '티타늄', '글리세린', '부틸렌', '나이아신', '다이메티콘',
-        '사이클로', '에칠헥실', '소듐', '토코페롤', '히알루론', '알란토인',
-        '판테놀', '아데노신', '세라마이드', '콜라겐', '레티놀', '비타민',
-        '프로판다이올', '카보머', '페녹시에탄올', '향료', '시트릭', '스쿠알란',
-        '세틸알코올', '헥산다이올', '알지닌', '세린', '폴리소르베이트',
-        '아이소도데케인', '헥실렌글라이콜', '리모넨', '리날룰',
-    ]
-
     # === 구분자 유형 판단 ===
     # 쉼표가 거의 없으면 공백 구분자로 판단
     text_flat_check = text.replace('\n', ' ')
     # 화학 번호 쉼표 제외 (1,2-헥산다이올 등)
-    comma_count_check = len(re.findall(r',(?!\d-)', text_flat_check))
-    is_space_separated = comma_count_check < 5
+    # 기준(5개)만 판단하면 되므로 매치 리스트를 만들지 않고 5개까지만 센다
+    comma_count_check = sum(1 for _ in islice(_RE_LIST_COMMA.finditer(text_flat_check), SPACE_SEPARATED_COMMA_LIMIT))
+    is_space_separated = comma_count_check < SPACE_SEPARATED_COMMA_LIMIT
 
     if is_space_separated:
         logger.debug(f"공백 구분자 모드 감지 (쉼표 {comma_count_check}개)")
@@ -1269,7 +1402,7 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
             if kw_pos > 10:  # 키워드가 텍스트 시작이 아닌 중간에 있음
                 before_keyword = text_flat[:kw_pos]
                 # 키워드 앞에 실제 성분명이 있는지 확인
-                if any(ing in before_keyword for ing in REAL_INGREDIENT_PATTERNS):
+                if _RE_REAL_INGREDIENT.search(before_keyword):
                     # 키워드를 쉼표로 대체하여 전체를 성분으로 처리
                     text = text_flat.replace(kw, ',')
                     break
@@ -1299,7 +1432,7 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
     # 첫 줄에 실제 성분명이 있으면 바로 성분 섹션으로 판단 (Clova OCR 결과 대응)
     # 단, force_mode=True일 때만 (force_mode=False면 키워드 기반으로 동작)
     first_line = lines[0].strip() if lines else ''
-    if force_mode and first_line and any(ing in first_line for ing in REAL_INGREDIENT_PATTERNS):
+    if force_mode and first_line and _RE_REAL_INGREDIENT.search(first_line):
         in_ingredients = True
         ingredient_text.append(first_line)
         lines = lines[1:]  # 첫 줄은 이미 추가했으므로 제외
@@ -1308,24 +1441,24 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
         line = line.strip()
 
         # 제외 섹션
-        if any(exclude in line for exclude in INGREDIENT_EXCLUDE_SECTIONS):
+        if _RE_EXCLUDE_SECTION.search(line):
             in_ingredients = False
             continue
 
         # 성분 섹션 시작 (키워드 확인)
-        if any(kw in line for kw in INGREDIENT_KEYWORDS):
+        if _RE_INGREDIENT_KEYWORD.search(line):
             # 정확한 키워드가 있으면 바로 성분 섹션으로 인식
             exact_keyword = '전성분' in line or '성분은' in line or '성분:' in line or '[성분명]' in line or '성분명]' in line
 
             # 같은 줄 또는 다음 줄에 실제 성분명이 있는지 확인
-            has_real_ingredient = any(ing in line for ing in REAL_INGREDIENT_PATTERNS)
+            has_real_ingredient = _RE_REAL_INGREDIENT.search(line) is not None
 
             # 다음 5줄까지 확인 (성분이 키워드 다음 줄에 있을 수 있음)
             if not has_real_ingredient:
                 for look_ahead in range(1, 6):
                     if idx + look_ahead < len(lines):
                         next_line = lines[idx + look_ahead].strip()
-                        if any(ing in next_line for ing in REAL_INGREDIENT_PATTERNS):
+                        if _RE_REAL_INGREDIENT.search(next_line):
                             has_real_ingredient = True
                             break
 
@@ -1343,7 +1476,7 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
                         if kw_pos > 0:  # 키워드가 라인 시작이 아닌 중간에 있음
                             before_keyword = line[:kw_pos]
                             # 키워드 앞에 실제 성분명이 있는지 확인
-                            if any(ing in before_keyword for ing in REAL_INGREDIENT_PATTERNS):
+                            if _RE_REAL_INGREDIENT.search(before_keyword):
                                 keyword_in_middle = True
                                 # 키워드를 쉼표로 대체하여 전체 라인을 성분으로 처리
                                 cleaned_line = line.replace(kw, ',').strip()
@@ -1353,8 +1486,7 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
 
                 if not keyword_in_middle:
                     # 기존 로직: 키워드 뒤의 텍스트만 추출
-                    pattern = r'(?:법에\s*따라|하여야\s*하는|모든\s*성분|전성분|성분은|성분:|\[성분명\]|성분명\]|INGREDIENTS?)\s*(.+)'
-                    match = re.search(pattern, line, re.IGNORECASE)
+                    match = _RE_HEADER_TAIL.search(line)
 
                     if match:
                         remaining = match.group(1).strip()
@@ -1377,7 +1509,7 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
 
         # 성분 섹션 종료
         if in_ingredients:
-            if any(stop in line for stop in INGREDIENT_STOP_KEYWORDS):
+            if _RE_STOP_KEYWORD.search(line):
                 break
 
             if line:
@@ -1389,41 +1521,36 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
     # 전처리 0: 줄바꿈으로 분리된 성분명 합치기
     # 예: "엑사펩타 이드-9" → "엑사펩타이드-9"
     # 한글 + 공백 + 한글(또는 하이픈+숫자)이면 공백 제거
-    full_text = re.sub(r'([가-힣])\s+([가-힣])', r'\1\2', full_text)
-    full_text = re.sub(r'([가-힣])\s+(이드-?\d+)', r'\1\2', full_text)  # ~펩타 이드-9
-    full_text = re.sub(r'([가-힣])\s+(레이트)', r'\1\2', full_text)  # ~카프릴 레이트
-    full_text = re.sub(r'(-\d+)\s+([가-힣])', r'\1\2', full_text)  # 폴리글리세릴-10 스테아레이트
-    full_text = re.sub(r'([가-힣])\s+(-\d+)', r'\1\2', full_text)  # 폴리글리세릴 -10미리스테이트
+    full_text = _RE_JOIN_HANGUL.sub(r'\1\2', full_text)
+    full_text = _RE_JOIN_IDE.sub(r'\1\2', full_text)  # ~펩타 이드-9
+    full_text = _RE_JOIN_RATE.sub(r'\1\2', full_text)  # ~카프릴 레이트
+    full_text = _RE_JOIN_NUMBER_HANGUL.sub(r'\1\2', full_text)  # 폴리글리세릴-10 스테아레이트
+    full_text = _RE_JOIN_HANGUL_NUMBER.sub(r'\1\2', full_text)  # 폴리글리세릴 -10미리스테이트
 
     # 전처리 0-1: 영어/숫자 + 공백 + 한글 패턴 합치기
     # 예: "PEG-100 스테아레이트" → "PEG-100스테아레이트"
     # 예: "C12-14 파레스-12" → "C12-14파레스-12"
-    full_text = re.sub(r'([A-Za-z0-9-]+)\s+([가-힣])', r'\1\2', full_text)
+    full_text = _RE_JOIN_ALNUM_HANGUL.sub(r'\1\2', full_text)
     # 예: "피이지- 100스테아레이트" → "피이지-100스테아레이트"
-    full_text = re.sub(r'([가-힣])-\s+(\d)', r'\1-\2', full_text)
+    full_text = _RE_JOIN_HYPHEN_DIGIT.sub(r'\1-\2', full_text)
 
     # 전처리 1: 천 단위 구분자 쉼표 제거 (30,000 → 30000)
     # 주의: 1,2-헥산다이올 같은 화학명은 보존해야 함
     # 천 단위는 쉼표 뒤에 3자리 숫자가 오는 경우만 처리
-    full_text = re.sub(r'(\d),(\d{3})(?!\d)', r'\1\2', full_text)
+    full_text = _RE_THOUSANDS_COMMA.sub(r'\1\2', full_text)
 
     # 전처리 2: ppm/ppb 농도 패턴 제거 (OCR 줄바꿈 오류 대응)
     # 주의: 쉼표는 제거하지 않음 (성분 구분자 보존)
     # 예: "(30000ppm)," → ","  (쉼표 보존)
-    full_text = re.sub(r'\(\s*[\d\.]+\s*(ppm|ppb|PPM|PPB)?\s*\)', '', full_text)
-    full_text = re.sub(r'\(\s*[\d\.]+\s*\)', '', full_text)  # 숫자만 있는 괄호도 제거
-    full_text = re.sub(r'\bppm\b', '', full_text, flags=re.IGNORECASE)  # 단독 ppm 제거
-    full_text = re.sub(r'\bppb\b', '', full_text, flags=re.IGNORECASE)  # 단독 ppb 제거
+    full_text = _RE_CONCENTRATION_VALUE.sub('', full_text)
+    full_text = _RE_NUMBER_ONLY_PAREN.sub('', full_text)  # 숫자만 있는 괄호도 제거
+    full_text = _RE_PPM_WORD.sub('', full_text)  # 단독 ppm 제거
+    full_text = _RE_PPB_WORD.sub('', full_text)  # 단독 ppb 제거
     # OCR 오류: 괄호 없이 숫자+ppb 붙은 경우 (소듐아스코빌포스페이트500 ppb → 소듐아스코빌포스페이트)
-    full_text = re.sub(r'(\D)\d+\s*(ppm|ppb)', r'\1', full_text, flags=re.IGNORECASE)
+    full_text = _RE_ATTACHED_CONCENTRATION.sub(r'\1', full_text)
 
-    # 1차: 쉼표로 분리
-    # 주의: 1,2-헥산다이올 같은 화학 번호의 쉼표는 보호
-    # 패턴: 숫자,숫자- (예: 1,2- 2,3- 등)
-    full_text = re.sub(r'(\d),(\d-)', r'\1@COMMA@\2', full_text)
-    parts = full_text.split(',')
-    # 보호된 쉼표 복원
-    parts = [p.replace('@COMMA@', ',') for p in parts]
+    # 1차: 쉼표로 분리 (1,2-헥산다이올 같은 화학 번호의 쉼표는 분리하지 않음)
+    parts = _RE_INGREDIENT_SEPARATOR.split(full_text)
 
     seen = set()  # 중복 방지
 
@@ -1433,33 +1560,46 @@ def extract_from_text(text: str, source: str, threshold: float = None, force_mod
         if not part:
             continue
 
-        # 핵심 수정: 공백이 있으면 여러 성분일 가능성 → sub_parts 먼저 처리
+        # 핵심 수정: 공백이 있으면 여러 성분일 가능성 → 공백 단위 후보로 처리
         # normalize_ingredient_name()이 공백을 제거하므로, 공백 분리를 먼저 수행
-        if ' ' in part:
-            sub_parts = part.split()
-            for sub in sub_parts:
-                if len(sub) >= 2:
-                    normalized_sub = normalize_ingredient_name(sub)
-                    if normalized_sub and len(normalized_sub) >= 2 and normalized_sub not in seen:
-                        is_valid, confidence, reason = is_valid_ingredient(normalized_sub)
-                        # Phase 3: 소스별 threshold 적용
-                        if is_valid and confidence >= threshold:
-                            ingredients.append({'ingredient': normalized_sub, 'source': source})
-                            seen.add(normalized_sub)
-        else:
-            # 단일 단어인 경우 전체를 하나의 성분으로 시도
-            if len(part) >= 2:
-                normalized = normalize_ingredient_name(part)
-                if normalized and len(normalized) >= 2:
-                    is_valid, confidence, reason = is_valid_ingredient(normalized)
-                    # Phase 3: 소스별 threshold 적용
-                    if is_valid and confidence >= threshold and normalized not in seen:
-                        ingredients.append({'ingredient': normalized, 'source': source})
-                        seen.add(normalized)
+        # 단일 단어인 경우 전체를 하나의 성분으로 시도
+        candidates = part.split() if ' ' in part else (part,)
+        for candidate in candidates:
+            if len(candidate) < 2:
+                continue
+            normalized = normalize_ingredient_name(candidate)
+            if normalized and len(normalized) >= 2 and normalized not in seen:
+                is_valid, confidence, reason = is_valid_ingredient(normalized)
+                # Phase 3: 소스별 threshold 적용
+                if is_valid and confidence >= threshold:
+                    # 대소문자만 다른 알려진 성분은 DB 표기로 통일해 중복 제거
+                    name = _canonical_known_name(normalized)
+                    if name not in seen:
+                        ingredients.append({'ingredient': name, 'source': source})
+                    seen.add(normalized)
+                    seen.add(name)
 
     return ingredients
 
 
+# 공백 구분자 텍스트의 줄/토큰 병합용 패턴
+_RE_SPACE_CONCENTRATION = re.compile(r'\(\s*\d+\s*(ppm|ppb|%)\s*\)', re.IGNORECASE)
+_RE_MANDATORY_INGREDIENTS_TAIL = re.compile(r'기재해야\s*하는\s*모든\s*성분\s*')
+_RE_ALNUM_START = re.compile(r'^[가-힣0-9A-Za-z]')
+# 성분명 사이에 섞인 법정 문구 (순서대로 제거 - 앞 치환 결과에 뒤 패턴이 다시 걸릴 수 있음)
+_RE_LEGAL_PHRASES = [
+    re.compile(r'화장품법에\s*따라'),
+    re.compile(r'기재해야\s*하는\s*모든\s*성분'),
+    re.compile(r'기재해야\s*하는'),
+    re.compile(r'모든\s*성분'),
+]
+_RE_HYPHEN_SPACE = re.compile(r'-\s+([가-힣0-9A-Za-z])')
+_RE_PAREN_BLOCK = re.compile(r'\([^)]+\)')
+_RE_SPLIT_SUFFIX = re.compile(r'^(이트|에이트|레이트|라이드|올|린|드|릴|놀|롤|산|염|논|넨|닌|눌|넬)\b')
+_RE_INCOMPLETE_PREFIX = re.compile(r'-[가-힣]{1,2}$')
+_RE_SUFFIX_START = re.compile(r'^(프릴|릴레이트|레이트|라이드|글루코|글라이콜|에이트|아마이드|올레|스테아|미리스|팔미)')
+
+
 def _extract_space_separated(text: str, source: str, threshold: float,
                              real_patterns: list, logger) -> list:
     """
@@ -1475,13 +1615,11 @@ def _extract_space_separated(text: str, source: str, threshold: float,
     Returns:
         list: [{'ingredient': str, 'source': str}, ...]
     """
-    import re
-
     ingredients = []
     seen = set()
 
     # 1. 농도 패턴 제거 (290ppm), (10ppm) 등
-    text = re.sub(r'\(\s*\d+\s*(ppm|ppb|%)\s*\)', '', text, flags=re.IGNORECASE)
+    text = _RE_SPACE_CONCENTRATION.sub('', text)
 
     # 2. 메타데이터 키워드가 있는 줄 제거 (성분 시작 전)
     lines = text.split('\n')
@@ -1541,7 +1679,7 @@ def _extract_space_separated(text: str, source: str, threshold: float,
                 remaining = next_line[paren_pos + 1:].strip()
 
                 # 키워드 제거 후 합치기
-                paren_content = re.sub(r'기재해야\s*하는\s*모든\s*성분\s*', '', paren_content)
+                paren_content = _RE_MANDATORY_INGREDIENTS_TAIL.sub('', paren_content)
                 merged_lines.append(line + paren_content)
 
                 # 나머지가 있으면 별도 줄로 추가
@@ -1554,7 +1692,7 @@ def _extract_space_separated(text: str, source: str, threshold: float,
         if line.endswith('-') and i + 1 < len(filtered_lines):
             next_line = filtered_lines[i + 1]
             # 다음 줄 시작이 한글, 숫자, 영어면 합침
-            if next_line and re.match(r'^[가-힣0-9A-Za-z]', next_line):
+            if next_line and _RE_ALNUM_START.match(next_line):
                 merged_lines.append(line + next_line)
                 i += 2
                 continue
@@ -1565,7 +1703,7 @@ def _extract_space_separated(text: str, source: str, threshold: float,
     # 5. 줄 끝 한글 + 다음 줄 접미사 합치기
     # 예: '다이포타슘포스페\n  이트' → '다이포타슘포스페이트'
     final_lines = []
-    suffix_pattern = r'^(이트|에이트|레이트|라이드|올|린|드|릴|놀|롤|산|염|논|넨|닌|눌|넬)\b'
+    # 접미사 패턴: _RE_SPLIT_SUFFIX
 
     i = 0
     while i < len(merged_lines):
@@ -1574,7 +1712,7 @@ def _extract_space_separated(text: str, source: str, threshold: float,
         # 다음 줄이 접미사로 시작하면 합치기
         if i + 1 < len(merged_lines):
             next_line = merged_lines[i + 1]
-            if re.match(suffix_pattern, next_line):
+            if _RE_SPLIT_SUFFIX.match(next_line):
                 # 현재 줄과 다음 줄 합치기
                 final_lines.append(line + ' ' + next_line)
                 i += 2
@@ -1587,23 +1725,21 @@ def _extract_space_separated(text: str, source: str, threshold: float,
     text = ' '.join(final_lines)
 
     # 7. 성분 키워드 제거 (성분명 사이에 섞인 키워드)
-    text = re.sub(r'화장품법에\s*따라', ' ', text)
-    text = re.sub(r'기재해야\s*하는\s*모든\s*성분', ' ', text)
-    text = re.sub(r'기재해야\s*하는', ' ', text)
-    text = re.sub(r'모든\s*성분', ' ', text)
+    for pattern in _RE_LEGAL_PHRASES:
+        text = pattern.sub(' ', text)
 
     # 8. 하이픈 뒤 공백 제거
     # 예: '코코-카 프릴레이트' → '코코-카프릴레이트'
-    text = re.sub(r'-\s+([가-힣0-9A-Za-z])', r'-\1', text)
+    text = _RE_HYPHEN_SPACE.sub(r'-\1', text)
 
     # 9. 괄호 안의 공백 제거
     # 예: '(C6- 14올레핀)' → '(C6-14올레핀)'
     def remove_space_in_parens(m):
         return m.group(0).replace(' ', '')
-    text = re.sub(r'\([^)]+\)', remove_space_in_parens, text)
+    text = _RE_PAREN_BLOCK.sub(remove_space_in_parens, text)
 
-    # 10. 여러 공백을 하나로
-    text = re.sub(r'\s+', ' ', text).strip()
+    # 10. 여러 공백을 하나로 (split/join이 정규식 치환 + strip보다 빠름)
+    text = ' '.join(text.split())
 
     logger.debug(f"공백구분자 전처리 결과: {text[:200]}...")
 
@@ -1624,12 +1760,9 @@ def _extract_space_separated(text: str, source: str, threshold: float,
     # 예: '코코-카' + '프릴레이트/카프레이트' → '코코-카프릴레이트/카프레이트'
     merged_tokens = []
 
-    # 불완전 접두사 패턴 (하이픈+한글로 끝나는 불완전한 성분명)
+    # 불완전 접두사 패턴 (하이픈+한글로 끝나는 불완전한 성분명): _RE_INCOMPLETE_PREFIX
     # 예: 코코-카, 라우릴-글, 세틸-피 등
-    incomplete_prefix_pattern = r'-[가-힣]{1,2}$'
-
-    # 접미사 시작 패턴 (성분명 접미사로 시작하는 토큰)
-    suffix_start_pattern = r'^(프릴|릴레이트|레이트|라이드|글루코|글라이콜|에이트|아마이드|올레|스테아|미리스|팔미)'
+    # 접미사 시작 패턴 (성분명 접미사로 시작하는 토큰): _RE_SUFFIX_START
 
     i = 0
     while i < len(tokens):
@@ -1642,18 +1775,18 @@ def _extract_space_separated(text: str, source: str, threshold: float,
             i += 2
         # 불완전 접두사 패턴 (-한글1~2자로 끝남) + 다음 토큰이 접미사로 시작
         # 예: '코코-카' + '프릴레이트' → '코코-카프릴레이트'
-        elif re.search(incomplete_prefix_pattern, token) and i + 1 < len(tokens):
+        elif '-' in token and _RE_INCOMPLETE_PREFIX.search(token) and i + 1 < len(tokens):
             next_token = tokens[i + 1]
-            if re.match(suffix_start_pattern, next_token):
+            if _RE_SUFFIX_START.match(next_token):
                 merged_tokens.append(token + next_token)
                 i += 2
             else:
                 merged_tokens.append(token)
                 i += 1
-        # 한글로 끝나고 다음 토큰이 접미사면 합치기
-        elif re.search(r'[가-힣]$', token) and i + 1 < len(tokens):
+        # 한글로 끝나고 다음 토큰이 접미사면 합치기 (마지막 글자 범위 비교 - 정규식 불필요)
+        elif '가' <= token[-1] <= '힣' and i + 1 < len(tokens):
             next_token = tokens[i + 1]
-            if re.match(suffix_pattern, next_token):
+            if _RE_SPLIT_SUFFIX.match(next_token):
                 merged_tokens.append(token + next_token)
                 i += 2
             else:
@@ -1682,13 +1815,44 @@ def _extract_space_separated(text: str, source: str, threshold: float,
 
             is_valid, conf, reason = is_valid_ingredient(normalized)
             if is_valid and conf >= threshold:
-                ingredients.append({'ingredient': normalized, 'source': source})
+                # 대소문자만 다른 알려진 성분은 DB 표기로 통일해 중복 제거
+                name = _canonical_known_name(normalized)
+                if name not in seen:
+                    ingredients.append({'ingredient': name, 'source': source})
                 seen.add(normalized)
+                seen.add(name)
 
     logger.debug(f"공백구분자 추출 결과: {len(ingredients)}개 성분")
     return ingredients
 
 
+# 멀티 옵션 텍스트 섹션 구분용 패턴
+_RE_OPTION_TAG = re.compile(r'\[(\d+)\s*([^\]]*)\]')      # 제품명 속 옵션 번호 ([52 인더다크])
+_RE_OPTION_BOUNDARY = re.compile(r'\[(\d+)\s+')            # 텍스트 속 옵션 섹션 시작 위치
+_RE_OPTION_BRACKET = re.compile(r'\[\d+[^\]]*\]')          # 키워드 추출 시 옵션 부분 제거
+_RE_VOLUME_UNIT = re.compile(r'\d+\s*(ml|g|mg|매|개입|P)\b', re.IGNORECASE)  # 용량/단위 제거
+
+
+def _find_option_section(text: str, option_num: str) -> str:
+    """
+    텍스트를 옵션 섹션 경계([숫자 ...)로 한 번만 훑어서 해당 옵션 번호의 본문 반환 (없으면 None)
+
+    섹션 본문은 헤더의 닫는 ']' 다음부터 다음 경계(또는 텍스트 끝)까지
+    """
+    # 같은 iterator를 이어서 소비하므로 경계 목록을 리스트로 만들지 않음
+    boundaries = _RE_OPTION_BOUNDARY.finditer(text)
+    for m in boundaries:
+        if m.group(1) != option_num:
+            continue
+        close = text.find(']', m.end())
+        if close < 0:
+            return None
+        start = close + 1
+        end = next((b.start() for b in boundaries if b.start() >= start), len(text))
+        return text[start:end]
+    return None
+
+
 def extract_product_section(text: str, product_name: str) -> str:
     """
     멀티 제품/옵션이 포함된 텍스트에서 특정 제품의 성분 섹션만 추출
@@ -1708,14 +1872,13 @@ def extract_product_section(text: str, product_name: str) -> str:
         return text
 
     # === 케이스 1: 옵션 번호 기반 ([52 인더다크] 등) ===
-    option_match = re.search(r'\[(\d+)\s*([^\]]*)\]', product_name)
+    option_match = _RE_OPTION_TAG.search(product_name)
     if option_match:
         option_num = option_match.group(1)
-        # [숫자 ...] 패턴으로 섹션 분리
-        pattern = rf'\[{option_num}\s+[^\]]*\]\s*(.*?)(?=\[\d+\s+|\Z)'
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            section = match.group(1).strip()
+        # [숫자 ...] 경계로 섹션 분리 (옵션 번호마다 패턴을 새로 만들지 않고 한 번의 스캔으로)
+        section = _find_option_section(text, option_num)
+        if section is not None:
+            section = section.strip()
             if len(section) > 20:  # 충분한 내용이 있는 경우만
                 logger.debug(f"옵션 [{option_num}] 섹션 추출: {len(section)}자")
                 return section
@@ -1725,6 +1888,11 @@ def extract_product_section(text: str, product_name: str) -> str:
     keywords = _extract_product_keywords(product_name)
 
     if keywords:
+        # 빠른 경로: 키워드 중 하나라도 텍스트 전체에 없으면 섹션 탐색 불필요
+        text_normalized = text.replace(' ', '').lower()
+        if any(kw.replace(' ', '').lower() not in text_normalized for kw in keywords):
+            return text
+
         # 텍스트에서 해당 제품 섹션 찾기
         section = _find_product_section(text, keywords)
         if section and len(section) > 20:
@@ -1735,15 +1903,16 @@ def extract_product_section(text: str, product_name: str) -> str:
     return text
 
 
-def _extract_product_keywords(product_name: str) -> list:
+@lru_cache(maxsize=256)
+def _extract_product_keywords(product_name: str) -> tuple:
     """
-    제품명에서 핵심 키워드 추출
+    제품명에서 핵심 키워드 추출 (같은 제품의 ALT/OCR 섹션마다 재사용되므로 캐시)
 
     예: "화산송이 캡슐팩" → ["화산송이", "캡슐팩"]
         "본셉 젤 아이라이너 [01 젤블랙]" → ["젤", "아이라이너"]
     """
     # 옵션 부분 제거
-    name = re.sub(r'\[\d+[^\]]*\]', '', product_name).strip()
+    name = _RE_OPTION_BRACKET.sub('', product_name).strip()
 
     # 브랜드명 제거 (앞쪽 2-4글자 단어가 브랜드인 경우가 많음)
     # 흔한 브랜드: 다이소, 본셉, 머지, 프릴루드 딘토, 더봄, 베리썸 등
@@ -1751,14 +1920,16 @@ def _extract_product_keywords(product_name: str) -> list:
               '파넬', '에뛰드', '플레이', '태그', '펠트', '밀크터치', '꽁래쉬',
               'VT', '메디필', '제이엠솔루션', '린제이', '채비공간', '비프루브']
 
+    # 고정 문자열 접두사이므로 정규식 대신 문자열 비교로 제거 (대소문자 무시)
     for brand in brands:
-        name = re.sub(rf'^{re.escape(brand)}\s*', '', name, flags=re.IGNORECASE)
+        if name[:len(brand)].lower() == brand.lower():
+            name = name[len(brand):].lstrip()
 
     # 용량/단위 제거
-    name = re.sub(r'\d+\s*(ml|g|mg|매|개입|P)\b', '', name, flags=re.IGNORECASE)
+    name = _RE_VOLUME_UNIT.sub('', name)
 
     # 괄호 내용 제거
-    name = re.sub(r'\([^)]*\)', '', name)
+    name = _RE_PAREN.sub('', name)
 
     # 공백 정규화
     name = ' '.join(name.split())
@@ -1770,7 +1941,11 @@ def _extract_product_keywords(product_name: str) -> list:
     generic = {'슬림', '프로', '수퍼', '에어', '픽싱', '롱', '듀얼', '트리플'}
     keywords = [w for w in words if w not in generic]
 
-    return keywords[:3]  # 최대 3개 키워드
+    return tuple(keywords[:3])  # 최대 3개 키워드
+
+
+# 다음 제품명 패턴: 한글 2-10글자 + (캡슐팩|팩|라이너|섀도우|마스카라 등)
+_RE_NEXT_PRODUCT_NAME = re.compile(r'^[가-힣]{2,10}(캡슐팩|팩|라이너|섀도우|마스카라|브로우|세럼)\s*$')
 
 
 def _find_product_section(text: str, keywords: list) -> str:
@@ -1792,21 +1967,20 @@ def _find_product_section(text: str, keywords: list) -> str:
     lines = text.split('\n')
     target_line_idx = None
 
+    keywords_normalized = [kw.replace(' ', '').lower() for kw in keywords]
+    combined = ''.join(keywords_normalized)
+
     for i, line in enumerate(lines):
         line_normalized = line.replace(' ', '').lower()
 
         # 모든 키워드가 줄에 포함되어 있는지 확인
-        all_found = all(
-            kw.replace(' ', '').lower() in line_normalized
-            for kw in keywords
-        )
+        all_found = all(kw in line_normalized for kw in keywords_normalized)
 
         if all_found:
             target_line_idx = i
             break
 
         # 키워드가 연속으로 나타나는지 확인 (예: "화산송이캡슐팩")
-        combined = ''.join(keywords).replace(' ', '').lower()
         if combined in line_normalized:
             target_line_idx = i
             break
@@ -1814,16 +1988,13 @@ def _find_product_section(text: str, keywords: list) -> str:
     if target_line_idx is None:
         return text
 
-    # 해당 줄부터 다음 제품명까지 추출
-    # 다음 제품명 패턴: 한글 2-6글자 + (캡슐팩|팩|라이너|섀도우|마스카라 등)
-    product_name_pattern = r'^[가-힣]{2,10}(캡슐팩|팩|라이너|섀도우|마스카라|브로우|세럼)\s*$'
-
+    # 해당 줄부터 다음 제품명(_RE_NEXT_PRODUCT_NAME)까지 추출
     section_lines = []
     for j in range(target_line_idx + 1, len(lines)):
         line = lines[j].strip()
 
         # 다음 제품명이 나오면 중단
-        if re.match(product_name_pattern, line):
+        if _RE_NEXT_PRODUCT_NAME.match(line):
             break
 
         # 빈 줄이 연속 2개 이상이면 중단
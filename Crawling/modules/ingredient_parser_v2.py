@@ -14,6 +14,49 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 줄바꿈 병합 규칙 4가지를 한 번의 스캔으로 처리 (각 대안의 시작 문자가 서로 달라 순차 치환과 결과 동일)
+#   /\n → '/',  -\n숫자 → '-숫자',  한글\n한글 → '한글한글',  나머지 줄바꿈 → ', '
+_RE_LINE_BREAK_MERGE = re.compile(
+    r'(?P<slash>/)\s*[\r\n]+\s*'
+    r'|-\s*[\r\n]+\s*(?P<digit>\d)'
+    r'|(?P<h1>[가-힣])\s*[\r\n]+\s*(?P<h2>[가-힣])'
+    r'|[\r\n]+'
+)
+
+# 호출마다 re 캐시 조회하지 않도록 미리 컴파일한 패턴
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_DIGIT_COMMA = re.compile(r'(\d),(\d)')
+_RE_NEWLINES = re.compile(r'\n+')
+_RE_SEPARATOR = re.compile(r'[,，;；]')
+_RE_HANGUL_WIDE_GAP = re.compile(r'(?<=[가-힣])\s{2,}(?=[가-힣])')
+_RE_EMPTY_PAREN = re.compile(r'\(\s*\)')
+_RE_EMPTY_BRACKET = re.compile(r'\[\s*\]')
+_RE_FUNCTIONAL_PAREN = re.compile(r'\([^)]*(?:식품의약품|심사|고시|기능성)[^)]*\)')
+_RE_CONCENTRATION = re.compile(r'\(([^)]*(?:ppm|ppb|%|mg|g|ml)[^)]*)\)', re.IGNORECASE)
+
+
+def _line_break_replacement(m: re.Match) -> str:
+    if m.group('slash'):
+        return '/'
+    if m.group('digit'):
+        return '-' + m.group('digit')
+    if m.group('h1'):
+        return m.group('h1') + m.group('h2')
+    return ', '
+
+
+def _merge_line_breaks(text: str) -> str:
+    """
+    줄바꿈으로 분리된 성분명 병합 후 나머지 줄바꿈을 콤마로 변환
+
+    예: "카프릴릭/카프릭/\n스테아릭" → "카프릴릭/카프릭/스테아릭"
+        "폴리글리세릴-\n10" → "폴리글리세릴-10"
+        "트라이글리서라\n이드" → "트라이글리서라이드"
+    """
+    if '\n' not in text and '\r' not in text:
+        return text
+    return _RE_LINE_BREAK_MERGE.sub(_line_break_replacement, text)
+
 # OCR 오인식 교정 딕셔너리 (ingredient_parser.py에서 정의)
 # 순환 import 방지를 위해 여기서 정의
 OCR_CORRECTIONS_V2 = {
@@ -125,6 +168,9 @@ class TextNormalizer:
         '\u3000': ' ',  # 전각 공백
     }
 
+    # 모두 한 글자 치환이므로 translate 한 번으로 처리
+    UNICODE_NORMALIZE_TABLE = str.maketrans(UNICODE_NORMALIZE_MAP)
+
     @classmethod
     def normalize(cls, text: str) -> str:
         """텍스트 정규화"""
@@ -135,8 +181,7 @@ class TextNormalizer:
         text = unicodedata.normalize('NFC', text)
 
         # 2. 특수 유니코드 문자 정규화
-        for old, new in cls.UNICODE_NORMALIZE_MAP.items():
-            text = text.replace(old, new)
+        text = text.translate(cls.UNICODE_NORMALIZE_TABLE)
 
         # 3. OCR 오인식 문자 수정
         for old, new in cls.OCR_CHAR_MAP.items():
@@ -144,7 +189,7 @@ class TextNormalizer:
                 text = text.replace(old, new)
 
         # 4. 연속 공백 제거
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_WHITESPACE.sub(' ', text)
 
         # 5. 양끝 공백 제거
         text = text.strip()
@@ -168,7 +213,7 @@ class TextNormalizer:
         # 예: "소듐하이알루로네이트(50.1002ppm)" -> "소듐하이알루로네이트(50.1002ppm)"
 
         # 불필요한 공백 제거 (성분명 내부)
-        name = re.sub(r'\s+', '', name)
+        name = _RE_WHITESPACE.sub('', name)
 
         return name
 
@@ -277,20 +322,9 @@ class IngredientSplitter:
         if not text:
             return []
 
-        # 0. 슬래시(/)로 끝나는 줄바꿈 병합 (줄바꿈으로 분리된 성분명 병합)
-        # 예: "카프릴릭/카프릭/미리스틱/\n스테아릭" → "카프릴릭/카프릭/미리스틱/스테아릭"
-        text = re.sub(r'/\s*[\r\n]+\s*', '/', text)
-
-        # 0-1. 하이픈(-)으로 끝나는 줄바꿈 + 숫자 병합
-        # 예: "폴리글리세릴-\n10" → "폴리글리세릴-10"
-        text = re.sub(r'-\s*[\r\n]+\s*(\d)', r'-\1', text)
-
-        # 0-2. 한글 + 줄바꿈 + 한글 병합 (성분명이 줄바꿈으로 분리된 경우)
-        # 예: "트라이글리서라\n이드" → "트라이글리서라이드"
-        text = re.sub(r'([가-힣])\s*[\r\n]+\s*([가-힣])', r'\1\2', text)
-
-        # 0-3. 나머지 줄바꿈을 먼저 콤마로 변환 (정규화 전)
-        text = re.sub(r'[\r\n]+', ', ', text)
+        # 0. 줄바꿈으로 분리된 성분명 병합 (슬래시/하이픈+숫자/한글 사이)
+        #    나머지 줄바꿈은 먼저 콤마로 변환 (정규화 전)
+        text = _merge_line_breaks(text)
 
         # 1. 텍스트 정규화
         text = TextNormalizer.normalize(text)
@@ -320,24 +354,25 @@ class IngredientSplitter:
 
         return unique
 
+    # 키트 제품 구분 패턴 (우선순위 순, 캡처 그룹으로 제품명도 결과에 포함)
+    KIT_PRODUCT_PATTERNS = [
+        re.compile(r'([가-힣]+\s*:)'),       # "클렌저:", "토너:" 등
+        re.compile(r'(\[[가-힣]+\])'),       # "[클렌저]" 등
+        re.compile(r'(【[가-힣]+】)'),       # "【클렌저】" 등
+    ]
+
     @classmethod
     def _split_kit_products(cls, text: str) -> List[str]:
         """키트 제품의 개별 제품별 성분 분리"""
-        # 제품 구분 패턴
-        product_patterns = [
-            r'([가-힣]+\s*:)',       # "클렌저:", "토너:" 등
-            r'(\[[가-힣]+\])',       # "[클렌저]" 등
-            r'(【[가-힣]+】)',       # "【클렌저】" 등
-        ]
-
-        # 패턴이 발견되면 분리
-        for pattern in product_patterns:
-            if re.search(pattern, text):
-                parts = re.split(pattern, text)
-                # 빈 문자열 제거
-                parts = [p.strip() for p in parts if p.strip()]
-                if len(parts) > 1:
-                    return parts
+        # 패턴이 없으면 split 결과가 [text] 하나뿐이므로 사전 search 없이 바로 분리
+        for pattern in cls.KIT_PRODUCT_PATTERNS:
+            parts = pattern.split(text)
+            if len(parts) == 1:
+                continue
+            # 빈 문자열 제거
+            parts = [p for p in map(str.strip, parts) if p]
+            if len(parts) > 1:
+                return parts
 
         return [text]
 
@@ -346,13 +381,13 @@ class IngredientSplitter:
         """구분자로 성분 분리"""
         # 1. 화학식의 콤마 보호 (1,2-헥산다이올 → 1@2-헥산다이올)
         # 숫자,숫자 패턴을 임시로 치환
-        text = re.sub(r'(\d),(\d)', r'\1@COMMA@\2', text)
+        text = _RE_DIGIT_COMMA.sub(r'\1@COMMA@\2', text)
 
         # 2. 줄바꿈을 콤마로 변환
-        text = re.sub(r'\n+', ',', text)
+        text = _RE_NEWLINES.sub(',', text)
 
         # 3. 콤마로 분리
-        parts = re.split(r'[,，;；]', text)
+        parts = _RE_SEPARATOR.split(text)
 
         result = []
         for part in parts:
@@ -372,7 +407,7 @@ class IngredientSplitter:
         # 너무 긴 텍스트는 분리 시도
         if len(text) > 50:
             # 한글 사이의 큰 공백으로 분리
-            parts = re.split(r'(?<=[가-힣])\s{2,}(?=[가-힣])', text)
+            parts = _RE_HANGUL_WIDE_GAP.split(text)
             if len(parts) > 1:
                 return [p.strip() for p in parts if p.strip()]
 
@@ -388,8 +423,8 @@ class IngredientSplitter:
         text = text.strip(' \t\n\r·•-')
 
         # 빈 괄호 제거
-        text = re.sub(r'\(\s*\)', '', text)
-        text = re.sub(r'\[\s*\]', '', text)
+        text = _RE_EMPTY_PAREN.sub('', text)
+        text = _RE_EMPTY_BRACKET.sub('', text)
 
         # 앞뒤 따옴표 제거
         text = text.strip('"\'""''')
@@ -553,7 +588,7 @@ class IngredientFilter:
         r'^(POINT|STEP|TIP|NOTE|HOW|WHAT|WHY|KEY|BEST|NEW|SPECIAL)\d*$',
         r'^(Book|Marine|Complex|Extra|Super|Care|Solution|Recipe)$',
     ]
-    NOISE_REGEX = [re.compile(p, re.IGNORECASE) for p in NOISE_PATTERNS]
+    NOISE_REGEX = re.compile('|'.join(f'(?:{p})' for p in NOISE_PATTERNS), re.IGNORECASE)
 
     # 최소/최대 길이
     MIN_LENGTH = 2
@@ -584,13 +619,13 @@ class IngredientFilter:
     def _remove_functional_text(cls, text: str) -> str:
         """기능성 문구 제거"""
         # 1. 괄호 안 기능성 문구 제거 (예: "(식품의약품안전처 심사)")
-        text = re.sub(r'\([^)]*(?:식품의약품|심사|고시|기능성)[^)]*\)', '', text)
+        text = _RE_FUNCTIONAL_PAREN.sub('', text)
 
         # 2. 기능성 문구 제거
         text = cls.FUNCTIONAL_REGEX.sub('', text)
 
         # 3. 빈 괄호 제거
-        text = re.sub(r'\(\s*\)', '', text)
+        text = _RE_EMPTY_PAREN.sub('', text)
 
         # 4. 정리
         text = text.strip(' ,;:()')
@@ -607,10 +642,9 @@ class IngredientFilter:
         if len(text) < cls.MIN_LENGTH or len(text) > cls.MAX_LENGTH:
             return False
 
-        # 노이즈 패턴 검사
-        for pattern in cls.NOISE_REGEX:
-            if pattern.match(text):
-                return False
+        # 노이즈 패턴 검사 (결합된 단일 패턴)
+        if cls.NOISE_REGEX.match(text):
+            return False
 
         # 한글이 없고 허용된 영문도 아닌 경우
         if not LanguageDetector.HANGUL_PATTERN.search(text):
@@ -631,13 +665,10 @@ class IngredientDeduplicator:
 
     # 동일 성분 변형 패턴
     EQUIVALENT_PATTERNS = [
-        # 공백 유무
-        (r'\s+', ''),
-        # 하이픈 유무
-        (r'-', ''),
-        # 애시드/애씨드
-        (r'애씨드', '애시드'),
-        (r'에씨드', '애시드'),
+        # 공백/하이픈 유무
+        (re.compile(r'[\s-]+'), ''),
+        # 애시드/애씨드/에씨드
+        (re.compile(r'[애에]씨드'), '애시드'),
     ]
 
     @classmethod
@@ -668,7 +699,7 @@ class IngredientDeduplicator:
         normalized = text.lower()
 
         for pattern, replacement in cls.EQUIVALENT_PATTERNS:
-            normalized = re.sub(pattern, replacement, normalized)
+            normalized = pattern.sub(replacement, normalized)
 
         return normalized
 
@@ -697,21 +728,8 @@ class IngredientParserV2:
 
         logger.debug(f"원본 텍스트 길이: {len(raw_text)}")
 
-        # 0. 줄바꿈으로 분리된 성분명 병합 (콤마 변환 전에!)
-        # 0-1. 슬래시(/)로 끝나는 줄바꿈 병합
-        # 예: "카프릴릭/카프릭/미리스틱/\n스테아릭" → "카프릴릭/카프릭/미리스틱/스테아릭"
-        raw_text = re.sub(r'/\s*[\r\n]+\s*', '/', raw_text)
-
-        # 0-2. 하이픈(-)으로 끝나는 줄바꿈 + 숫자 병합
-        # 예: "폴리글리세릴-\n10" → "폴리글리세릴-10"
-        raw_text = re.sub(r'-\s*[\r\n]+\s*(\d)', r'-\1', raw_text)
-
-        # 0-3. 한글 + 줄바꿈 + 한글 병합 (성분명이 줄바꿈으로 분리된 경우)
-        # 예: "트라이글리서라\n이드" → "트라이글리서라이드"
-        raw_text = re.sub(r'([가-힣])\s*[\r\n]+\s*([가-힣])', r'\1\2', raw_text)
-
-        # 0-4. 나머지 줄바꿈을 콤마로 변환 (정규화 전에!)
-        raw_text = re.sub(r'[\r\n]+', ', ', raw_text)
+        # 0. 줄바꿈으로 분리된 성분명 병합 후 나머지 줄바꿈을 콤마로 변환 (정규화 전에!)
+        raw_text = _merge_line_breaks(raw_text)
 
         # 1. 텍스트 정규화
         normalized = TextNormalizer.normalize(raw_text)
@@ -763,8 +781,7 @@ class IngredientParserV2:
     def _extract_concentration(cls, text: str) -> Tuple[str, Optional[str]]:
         """성분에서 함량 정보 추출"""
         # 괄호 안 함량 패턴
-        pattern = r'\(([^)]*(?:ppm|ppb|%|mg|g|ml)[^)]*)\)'
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _RE_CONCENTRATION.search(text)
 
         if match:
             concentration = match.group(1).strip()
@@ -30,6 +30,19 @@ REMOVE_PATTERNS = [
     r'보관방법.*',
 ]
 
+# 제거 패턴 (미리 컴파일, 앞 패턴 제거 결과에 뒤 패턴이 걸릴 수 있으므로 순서대로 적용)
+REMOVE_REGEXES = [re.compile(p, re.IGNORECASE) for p in REMOVE_PATTERNS]
+
+# normalize_ingredient 정규화용 (미리 컴파일)
+_RE_PAREN_CONTENT = re.compile(r'\([^)]*\)')
+_RE_BRACKET_CONTENT = re.compile(r'\[[^\]]*\]')
+_RE_CI_CODE = re.compile(r'^CI\d+')
+_RE_TRAILING_DIGITS = re.compile(r'\d+$')
+_RE_EDGE_NON_WORD = re.compile(r'^[^\w가-힣]+|[^\w가-힣]+$')
+
+# 제거할 특수문자 (문자 단위 삭제는 정규식 대신 str.translate 테이블로 처리)
+SYMBOL_DELETE_TABLE = str.maketrans('', '', '±*★☆※')
+
 # 성분이 아닌 문구 (완전 제거)
 NOISE_PHRASES = [
     '기재·표시하여야하는',
@@ -100,8 +113,8 @@ def remove_noise_patterns(text: str) -> str:
     cleaned = text
 
     # 패턴 기반 제거
-    for pattern in REMOVE_PATTERNS:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    for pattern in REMOVE_REGEXES:
+        cleaned = pattern.sub('', cleaned)
 
     # 노이즈 문구 제거
     for phrase in NOISE_PHRASES:
@@ -157,24 +170,25 @@ def normalize_ingredient(ingredient: str) -> str:
     normalized = ingredient.strip()
 
     # 2. OCR 오류 수정 (기존 OCR_CORRECTIONS 활용)
-    from daiso_beauty_crawler import OCR_CORRECTIONS
-    for wrong, correct in OCR_CORRECTIONS.items():
-        normalized = normalized.replace(wrong, correct)
+    from modules.ingredient_parser import apply_ocr_corrections
+    normalized = apply_ocr_corrections(normalized)
 
-    # 3. 괄호 내용 제거 (예: "글리세린(보습제)" → "글리세린")
-    normalized = re.sub(r'\([^)]*\)', '', normalized)
-    normalized = re.sub(r'\[[^\]]*\]', '', normalized)
+    # 3. 괄호 내용 제거 (예: "글리세린(보습제)" → "글리세린") - 괄호가 없으면 정규식 생략
+    if '(' in normalized:
+        normalized = _RE_PAREN_CONTENT.sub('', normalized)
+    if '[' in normalized:
+        normalized = _RE_BRACKET_CONTENT.sub('', normalized)
 
     # 4. 특수문자 제거 (±, *, ★ 등)
-    normalized = re.sub(r'[±*★☆※]', '', normalized)
+    normalized = normalized.translate(SYMBOL_DELETE_TABLE)
 
     # 5. 숫자 제거 (성분명에는 보통 숫자 없음, 단 CI77891 같은 색소 코드는 유지)
-    if not re.match(r'^CI\d+', normalized):
+    if not _RE_CI_CODE.match(normalized):
         # CI 코드가 아니면 끝의 숫자 제거
-        normalized = re.sub(r'\d+$', '', normalized)
+        normalized = _RE_TRAILING_DIGITS.sub('', normalized)
 
     # 6. 앞뒤 특수문자 제거
-    normalized = re.sub(r'^[^\w가-힣]+|[^\w가-힣]+$', '', normalized, flags=re.UNICODE)
+    normalized = _RE_EDGE_NON_WORD.sub('', normalized)
 
     # 7. 내부 공백 제거 (성분명은 보통 붙여쓰기)
     normalized = normalized.replace(' ', '')
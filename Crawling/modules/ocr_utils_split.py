@@ -8,6 +8,7 @@ import numpy as np
 from PIL import Image, ImageEnhance
 from io import BytesIO
 import logging
+import threading
 import cv2
 try:
     import pytesseract
@@ -19,15 +20,18 @@ logger = logging.getLogger(__name__)
 
 # EasyOCR Reader 싱글톤
 _reader = None
+_reader_lock = threading.Lock()
 
 
 def get_ocr_reader():
-    """EasyOCR Reader 인스턴스 반환 (싱글톤)"""
+    """EasyOCR Reader 인스턴스 반환 (싱글톤, 동시 첫 호출에도 한 번만 생성)"""
     global _reader
     if _reader is None:
-        logger.info("EasyOCR Reader 초기화 중 (한국어, 영어)")
-        _reader = easyocr.Reader(['ko', 'en'], gpu=False)
-        logger.info("EasyOCR Reader 초기화 완료")
+        with _reader_lock:
+            if _reader is None:
+                logger.info("EasyOCR Reader 초기화 중 (한국어, 영어)")
+                _reader = easyocr.Reader(['ko', 'en'], gpu=False)
+                logger.info("EasyOCR Reader 초기화 완료")
     return _reader
 
 
@@ -95,7 +99,16 @@ def split_image_vertically(image, num_sections=3):
     return sections
 
 
-def extract_text_bottom_up_3920(url, use_clova=True):
+def _load_image_bytes(url, image_bytes=None):
+    """이미지 바이트 반환 (브라우저가 이미 받은 바이트가 있으면 재사용, 없으면 다운로드)"""
+    if image_bytes:
+        return image_bytes
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def extract_text_bottom_up_3920(url, use_clova=True, image_bytes=None):
     """
     하단에서 위로 3920px씩 OCR (긴 단일 이미지용)
 
@@ -107,6 +120,7 @@ def extract_text_bottom_up_3920(url, use_clova=True):
     Args:
         url: 이미지 URL
         use_clova: Naver Clova OCR 사용 여부
+        image_bytes: 이미 받아둔 이미지 바이트 (있으면 다운로드 생략)
 
     Returns:
         list: OCR 결과 리스트 [{'section': 1, 'text': '...', 'method': 'clova_bottom_up'}, ...]
@@ -125,9 +139,7 @@ def extract_text_bottom_up_3920(url, use_clova=True):
 
     try:
         # 이미지 다운로드
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        original_image = Image.open(BytesIO(response.content))
+        original_image = Image.open(BytesIO(_load_image_bytes(url, image_bytes)))
         height = original_image.size[1]
         width = original_image.size[0]
         logger.info(f"[Bottom-Up OCR] 이미지 다운로드: {width}x{height}")
@@ -201,7 +213,7 @@ def extract_text_bottom_up_3920(url, use_clova=True):
         return []
 
 
-def extract_text_from_image_url_split(url, num_sections=3, use_clova=True, auto_crop=True):
+def extract_text_from_image_url_split(url, num_sections=3, use_clova=True, auto_crop=True, image_bytes=None):
     """
     이미지 URL에서 텍스트 추출 (분할 방식 + Clova OCR + 자동 크롭)
 
@@ -210,6 +222,7 @@ def extract_text_from_image_url_split(url, num_sections=3, use_clova=True, auto_
         num_sections: 분할할 섹션 수 (기본 3)
         use_clova: Naver Clova OCR 사용 여부
         auto_crop: 성분표 영역 자동 크롭 여부
+        image_bytes: 이미 받아둔 이미지 바이트 (있으면 다운로드 생략)
 
     Returns:
         list: 각 섹션의 OCR 텍스트 딕셔너리 리스트
@@ -217,11 +230,10 @@ def extract_text_from_image_url_split(url, num_sections=3, use_clova=True, auto_
     """
     try:
         # 이미지 다운로드
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        image_data = _load_image_bytes(url, image_bytes)
 
         # PIL Image로 변환
-        image = Image.open(BytesIO(response.content))
+        image = Image.open(BytesIO(image_data))
         logger.info(f"이미지 다운로드 완료: {image.size[0]}x{image.size[1]}")
 
         # 1. 성분표 영역 자동 크롭 (선택적)
@@ -330,10 +342,11 @@ def extract_text_from_image_url_split(url, num_sections=3, use_clova=True, auto_
                     # 실제 성분 개수 (공백 포함 텍스트에서)
                     ingredient_count = sum(1 for ing in ACTUAL_INGREDIENTS if ing in clova_text_flat) if clova_text_flat else 0
 
-                    # 디버깅 로그 (첫 100자 미리보기 추가)
-                    preview = clova_text_flat[:100].replace('\n', ' ') if clova_text_flat else ''
+                    # 디버깅 로그 (첫 100자 미리보기는 DEBUG 레벨일 때만 생성)
                     logger.info(f"Clova 검증: has_header={has_header}, ingredient_count={ingredient_count}, text_len={len(clova_text_flat)}")
-                    logger.debug(f"Clova 텍스트 미리보기: {preview}...")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        preview = clova_text_flat[:100].replace('\n', ' ') if clova_text_flat else ''
+                        logger.debug(f"Clova 텍스트 미리보기: {preview}...")
 
                     # Clova 결과 검증 (완화됨):
                     # 1) 헤더 + 1개 이상 성분, 또는
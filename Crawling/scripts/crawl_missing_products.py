@@ -7,14 +7,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from daiso_beauty_crawler import crawl_product_detail
-from utils import setup_logger, get_date_string
-import time
+from daiso_beauty_crawler import crawl_product_detail, create_chrome_driver, get_driver_path, PRODUCT_FIELDS
+from config import CRAWLING_CONFIG
+from modules.driver_setup import DriverPool
+from utils import setup_logger, get_date_string, write_csv
 
 # BigQuery 모듈
 try:
@@ -45,28 +44,32 @@ print("=" * 100)
 # 자동 시작
 print("\n크롤링을 시작합니다")
 
-# Chrome 옵션
-chrome_options = Options()
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-
-# 드라이버 초기화
-driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
-    options=chrome_options
+# 드라이버 풀 초기화 (워커마다 독립 브라우저 1개)
+# 성분을 수집하지 않으므로 이미지 로딩 차단, 헤드리스 여부는 config 설정 사용
+max_workers = max(1, min(CRAWLING_CONFIG['max_workers'], len(missing_codes)))
+driver_pool = DriverPool(
+    size=max_workers, factory=create_chrome_driver, reset=False,
+    driver_path=get_driver_path(), load_images=False
 )
 
-all_products = []
+# 제품 정보는 수집 즉시 CSV에 추가 (전체를 메모리에 모으지 않음, 중단 시에도 수집분 보존)
+timestamp = get_date_string()
+products_path = f'/Users/yu_seok/Documents/workspace/nbCamp/Project/Why-pi/data/missing_products_{timestamp}.csv'
+products_f = open(products_path, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20)
+product_writer = csv.DictWriter(products_f, fieldnames=PRODUCT_FIELDS)
+product_writer.writeheader()
+
+success_count = 0
 failed_products = []
 
-# 제품별 크롤링
-for idx, product_code in enumerate(missing_codes, 1):
-    url = f"https://www.daisomall.co.kr/pd/pdr/SCR_PDR_0001?pdNo={product_code}&recmYn=N"
 
-    print(f"\n[{idx}/{len(missing_codes)}] 제품 {product_code}", end=" ")
+def crawl_missing_product(product_code):
+    """드라이버 풀에서 브라우저를 빌려 제품 정보 1개 크롤링 (워커 스레드용)"""
+    url = f"https://www.daisomall.co.kr/pd/pdr/SCR_PDR_0001?pdNo={product_code}&recmYn=N"
     logger.info(f"제품 {product_code} 크롤링 시작")
 
-    try:
+    # 크롤링 후 별도 지연 없이 반납 (crawl_product_detail의 페이지 로딩 대기가 워커별 요청 간격 역할)
+    with driver_pool.acquire() as driver:
         # 제품 정보만 크롤링 (리뷰, 성분 제외)
         product, reviews, ingredients = crawl_product_detail(
             driver, url,
@@ -76,39 +79,48 @@ for idx, product_code in enumerate(missing_codes, 1):
             crawl_reviews=False,  # 리뷰는 이미 있음
             crawl_ingredients=False  # 성분 제외
         )
+        return product
 
-        if product:
-            all_products.append(product)
-            print(f"성공")
-            logger.info(f"  → 성공: 제품 정보")
-        else:
-            print(f"실패")
-            logger.warning(f"  → 제품 정보 추출 실패")
-            failed_products.append(product_code)
 
-    except Exception as e:
-        print(f"오류")
-        logger.error(f"  → 오류: {str(e)}")
-        failed_products.append(product_code)
-
-    time.sleep(2)
-
-driver.quit()
+# 제품별 크롤링 (워커가 병렬로 크롤링, CSV 쓰기는 메인 스레드에서만)
+try:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(crawl_missing_product, code): code for code in missing_codes}
+
+        for idx, future in enumerate(as_completed(futures), 1):
+            product_code = futures[future]
+            print(f"\n[{idx}/{len(missing_codes)}] 제품 {product_code}", end=" ")
+
+            try:
+                product = future.result()
+
+                if product:
+                    product_writer.writerow(product)
+                    success_count += 1
+                    print(f"성공")
+                    logger.info(f"  → 성공: 제품 정보 ({product_code})")
+                else:
+                    print(f"실패")
+                    logger.warning(f"  → 제품 정보 추출 실패 ({product_code})")
+                    failed_products.append(product_code)
+
+            except Exception as e:
+                print(f"오류")
+                logger.error(f"  → 오류 ({product_code}): {str(e)}")
+                failed_products.append(product_code)
+finally:
+    driver_pool.close()
+    products_f.close()
 
 # 결과 저장
 print("\n" + "=" * 100)
 print("크롤링 완료 - 결과 저장")
 print("=" * 100)
 
-timestamp = get_date_string()
-
 # 제품 데이터
-if all_products:
-    products_df = pd.DataFrame(all_products)
-    products_path = f'/Users/yu_seok/Documents/workspace/nbCamp/Project/Why-pi/data/missing_products_{timestamp}.csv'
-    products_df.to_csv(products_path, index=False, encoding='utf-8-sig')
+if success_count:
     print(f"\n제품 데이터: {products_path}")
-    print(f"   총 {len(products_df)}개 제품")
+    print(f"   총 {success_count}개 제품")
 else:
     print("\n제품 데이터 없음")
 
@@ -122,11 +134,10 @@ if failed_products:
     # 실패 목록 저장
     failed_df = pd.DataFrame({'product_code': failed_products})
     failed_path = f'/Users/yu_seok/Documents/workspace/nbCamp/Project/Why-pi/data/failed_products_{timestamp}.csv'
-    failed_df.to_csv(failed_path, index=False, encoding='utf-8-sig')
+    write_csv(failed_df, failed_path)
     print(f"   저장: {failed_path}")
 
 # 통계
-success_count = len(all_products)
 total_count = len(missing_codes)
 success_rate = success_count / total_count * 100 if total_count > 0 else 0
 
@@ -136,7 +147,7 @@ print(f"   - 성공: {success_count}개 ({success_rate:.1f}%)")
 print(f"   - 실패: {len(failed_products)}개 ({100-success_rate:.1f}%)")
 
 # BigQuery 적재
-if BIGQUERY_AVAILABLE and all_products:
+if BIGQUERY_AVAILABLE and success_count:
     print("\n" + "=" * 100)
     bq_confirm = input("BigQuery에 적재하시겠습니까? (y/n): ").strip().lower()
     if bq_confirm == 'y':
@@ -7,14 +7,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from daiso_beauty_crawler import crawl_product_detail
+import csv
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from daiso_beauty_crawler import crawl_product_detail, create_chrome_driver, get_driver_path
+from config import CRAWLING_CONFIG
+from modules.driver_setup import DriverPool
 from utils import setup_logger, get_date_string
-import time
 
 # BigQuery 모듈
 try:
@@ -45,28 +44,34 @@ print("=" * 100)
 # 자동 시작
 print("\n크롤링을 시작합니다")
 
-# Chrome 옵션
-chrome_options = Options()
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-
-# 드라이버 초기화
-driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
-    options=chrome_options
+# 드라이버 풀 초기화 (워커마다 독립 브라우저 1개)
+# 성분을 수집하지 않으므로 이미지 로딩 차단, 헤드리스 여부는 config 설정 사용
+max_workers = max(1, min(CRAWLING_CONFIG['max_workers'], len(missing_codes)))
+driver_pool = DriverPool(
+    size=max_workers, factory=create_chrome_driver, reset=False,
+    driver_path=get_driver_path(), load_images=False
 )
 
-all_reviews = []
+# 리뷰는 제품마다 바로 CSV에 추가 (전체를 메모리에 모으지 않음)
+# mancare_reviews.csv와 동일한 컬럼만 저장: product_code, date, user_masked, rating, text, image_count
+columns_to_keep = ['product_code', 'date', 'user_masked', 'rating', 'text', 'image_count']
+timestamp = get_date_string()
+reviews_path = f'/Users/yu_seok/Documents/workspace/nbCamp/Project/Why-pi/data/missing_reviews_{timestamp}.csv'
+reviews_f = open(reviews_path, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20)
+review_writer = csv.DictWriter(reviews_f, fieldnames=columns_to_keep, extrasaction='ignore')
+review_writer.writeheader()
+
+review_counts = Counter()
 failed_products = []
 
-# 제품별 크롤링
-for idx, product_code in enumerate(missing_codes, 1):
-    url = f"https://www.daisomall.co.kr/pd/pdr/SCR_PDR_0001?pdNo={product_code}&recmYn=N"
 
-    print(f"[{idx}/{len(missing_codes)}] 제품 {product_code}", end=" ")
+def crawl_missing_reviews(product_code):
+    """드라이버 풀에서 브라우저를 빌려 제품 1개의 리뷰 크롤링 (워커 스레드용)"""
+    url = f"https://www.daisomall.co.kr/pd/pdr/SCR_PDR_0001?pdNo={product_code}&recmYn=N"
     logger.info(f"제품 {product_code} 리뷰 크롤링 시작")
 
-    try:
+    # 크롤링 후 별도 지연 없이 반납 (crawl_product_detail의 페이지 로딩 대기가 워커별 요청 간격 역할)
+    with driver_pool.acquire() as driver:
         # 리뷰만 크롤링
         product, reviews, ingredients = crawl_product_detail(
             driver, url,
@@ -76,50 +81,55 @@ for idx, product_code in enumerate(missing_codes, 1):
             crawl_reviews=True,   # 리뷰만 수집
             crawl_ingredients=False  # 성분 제외
         )
+        return reviews
 
-        if reviews:
-            all_reviews.extend(reviews)
-            print(f"{len(reviews)}개 리뷰")
-            logger.info(f"  → {len(reviews)}개 리뷰 수집")
-        else:
-            print(f"리뷰 없음")
-            logger.warning(f"  → 리뷰 없음")
-
-    except Exception as e:
-        print(f"X")
-        logger.error(f"  → 오류: {str(e)}")
-        failed_products.append(product_code)
 
-    time.sleep(1.5)
-
-driver.quit()
+# 제품별 크롤링 (워커가 병렬로 크롤링, CSV 쓰기는 메인 스레드에서만)
+try:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(crawl_missing_reviews, code): code for code in missing_codes}
+
+        for idx, future in enumerate(as_completed(futures), 1):
+            product_code = futures[future]
+            print(f"[{idx}/{len(missing_codes)}] 제품 {product_code}", end=" ")
+
+            try:
+                reviews = future.result()
+
+                if reviews:
+                    review_writer.writerows(reviews)
+                    review_counts[product_code] += len(reviews)
+                    print(f"{len(reviews)}개 리뷰")
+                    logger.info(f"  → {len(reviews)}개 리뷰 수집 ({product_code})")
+                else:
+                    print(f"리뷰 없음")
+                    logger.warning(f"  → 리뷰 없음 ({product_code})")
+
+            except Exception as e:
+                print(f"X")
+                logger.error(f"  → 오류 ({product_code}): {str(e)}")
+                failed_products.append(product_code)
+finally:
+    driver_pool.close()
+    reviews_f.close()
 
 # 결과 저장
 print("\n" + "=" * 100)
 print("크롤링 완료 - 결과 저장")
 print("=" * 100)
 
-timestamp = get_date_string()
+total_reviews = sum(review_counts.values())
 
 # 리뷰 데이터
-if all_reviews:
-    reviews_df = pd.DataFrame(all_reviews)
-
-    # mancare_reviews.csv와 동일한 컬럼만 선택: product_code, date, user_masked, rating, text, image_count
-    columns_to_keep = ['product_code', 'date', 'user_masked', 'rating', 'text', 'image_count']
-    reviews_df = reviews_df[columns_to_keep]
-
-    reviews_path = f'/Users/yu_seok/Documents/workspace/nbCamp/Project/Why-pi/data/missing_reviews_{timestamp}.csv'
-    reviews_df.to_csv(reviews_path, index=False, encoding='utf-8-sig')
+if total_reviews:
     print(f"\n 리뷰 데이터: {reviews_path}")
-    print(f"   총 {len(reviews_df):,}개 리뷰")
+    print(f"   총 {total_reviews:,}개 리뷰")
 
     # 제품별 리뷰 통계
-    review_counts = reviews_df.groupby('product_code').size().reset_index(name='review_count')
     print(f"\n 리뷰 수집 통계:")
     print(f"   - 리뷰 있음: {len(review_counts)}개 제품")
     print(f"   - 리뷰 없음: {len(missing_codes) - len(review_counts)}개 제품")
-    print(f"   - 평균 리뷰 수: {review_counts['review_count'].mean():.1f}개")
+    print(f"   - 평균 리뷰 수: {total_reviews / len(review_counts):.1f}개")
 else:
     print("\n  리뷰 데이터 없음")
 
@@ -141,7 +151,7 @@ print(f"   - 성공: {success_count}개 ({success_rate:.1f}%)")
 print(f"   - 실패: {len(failed_products)}개 ({100-success_rate:.1f}%)")
 
 # BigQuery 적재
-if BIGQUERY_AVAILABLE and all_reviews:
+if BIGQUERY_AVAILABLE and total_reviews:
     print("\n" + "=" * 100)
     bq_confirm = input("BigQuery에 적재하시겠습니까? (y/n): ").strip().lower()
     if bq_confirm == 'y':
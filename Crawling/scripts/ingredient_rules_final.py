@@ -105,13 +105,9 @@ def main():
     df = df[~delete_mask].copy()
     print(f"[삭제] {deleted:,}행 제거")
 
-    # 2) 수정 (여러 패스 - corrections 적용)
-    corr_count = 0
-    for old, new in corrections.items():
-        mask = df['ingredient'] == old
-        if mask.any():
-            df.loc[mask, 'ingredient'] = new
-            corr_count += mask.sum()
+    # 2) 수정 (corrections 일괄 적용 - 교정 결과가 다시 교정 대상이 되는 규칙은 없음)
+    corr_count = df['ingredient'].isin(corrections.keys()).sum()
+    df['ingredient'] = df['ingredient'].replace(corrections)
     print(f"[수정] {corr_count:,}건 교정")
 
     # 3) 마케팅 문구 제거 (정규식)
@@ -122,22 +118,16 @@ def main():
     ]:
         df['ingredient'] = df['ingredient'].str.replace(pattern, '', regex=True)
 
-    # 4) 분리
-    new_rows = []
-    drop_idx = []
-    for idx, row in df.iterrows():
-        ing = row['ingredient']
-        if ing in split_rules:
-            drop_idx.append(idx)
-            for new_ing in split_rules[ing]:
-                r = row.copy()
-                r['ingredient'] = new_ing.strip()
-                if r['ingredient']:
-                    new_rows.append(r)
-    if drop_idx:
-        df = df.drop(drop_idx)
-        df = pd.concat([df, pd.DataFrame(new_rows)], ignore_index=True)
-        print(f"[분리] {len(drop_idx)}행 → {len(new_rows)}행으로 분리")
+    # 4) 분리 (대상 행만 골라 explode로 한 번에 펼침)
+    split_mask = df['ingredient'].isin(split_rules.keys())
+    if split_mask.any():
+        split_df = df[split_mask].copy()
+        split_df['ingredient'] = split_df['ingredient'].map(split_rules)
+        split_df = split_df.explode('ingredient')
+        split_df['ingredient'] = split_df['ingredient'].str.strip()
+        split_df = split_df[split_df['ingredient'] != '']
+        df = pd.concat([df[~split_mask], split_df], ignore_index=True)
+        print(f"[분리] {split_mask.sum()}행 → {len(split_df)}행으로 분리")
 
     # 5) 정리
     df['ingredient'] = df['ingredient'].str.strip()
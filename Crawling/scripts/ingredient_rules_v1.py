@@ -1144,25 +1144,16 @@ split_rules = {
     '트i라이에톡시카프릴릴실레에틸헥실글리세린': ['트라이에톡시카프릴릭실레인', '에틸헥실글리세린'],
 }
 
-# 분리 적용
-new_rows = []
-rows_to_drop = []
-
-for idx, row in df.iterrows():
-    ingredient = row['ingredient']
-    if ingredient in split_rules:
-        rows_to_drop.append(idx)
-        for new_ingredient in split_rules[ingredient]:
-            new_row = row.copy()
-            new_row['ingredient'] = new_ingredient
-            new_rows.append(new_row)
-
-# 기존 행 삭제 후 새 행 추가
-df = df.drop(rows_to_drop)
-if new_rows:
-    new_df = pd.DataFrame(new_rows)
-    df = pd.concat([df, new_df], ignore_index=True)
-    print(f"분리 적용: {len(rows_to_drop)}개 행 → {len(new_rows)}개 행으로 분리됨")
+# 분리 적용 (대상 행만 골라 explode로 한 번에 펼침 - 행마다 Series 복사 없음)
+split_mask = df['ingredient'].isin(split_rules.keys())
+if split_mask.any():
+    split_df = df[split_mask].copy()
+    split_df['ingredient'] = split_df['ingredient'].map(split_rules)
+    split_df = split_df.explode('ingredient')
+
+    # 기존 행 삭제 후 새 행 추가
+    df = pd.concat([df[~split_mask], split_df], ignore_index=True)
+    print(f"분리 적용: {split_mask.sum()}개 행 → {len(split_df)}개 행으로 분리됨")
 
 # =====================================================
 # 5) 최종 정리
@@ -501,24 +501,14 @@ split_rules = {
     '흑색산화철아이소프로필미리스테이트': ['흑색산화철', '아이소프로필미리스테이트'],
 }
 
-# 분리 적용
-new_rows = []
-rows_to_drop = []
-
-for idx, row in df.iterrows():
-    ingredient = row['ingredient']
-    if ingredient in split_rules:
-        rows_to_drop.append(idx)
-        for new_ingredient in split_rules[ingredient]:
-            new_row = row.copy()
-            new_row['ingredient'] = new_ingredient
-            new_rows.append(new_row)
-
-df = df.drop(rows_to_drop)
-if new_rows:
-    new_df = pd.DataFrame(new_rows)
-    df = pd.concat([df, new_df], ignore_index=True)
-    print(f"분리 적용: {len(rows_to_drop)}개 행 → {len(new_rows)}개 행으로 분리됨")
+# 분리 적용 (대상 행만 골라 explode로 한 번에 펼침 - 행마다 Series 복사 없음)
+split_mask = df['ingredient'].isin(split_rules.keys())
+if split_mask.any():
+    split_df = df[split_mask].copy()
+    split_df['ingredient'] = split_df['ingredient'].map(split_rules)
+    split_df = split_df.explode('ingredient')
+    df = pd.concat([df[~split_mask], split_df], ignore_index=True)
+    print(f"분리 적용: {split_mask.sum()}개 행 → {len(split_df)}개 행으로 분리됨")
 
 # =====================================================
 # 4) 애씨드 → 애시드 통일 (추가)
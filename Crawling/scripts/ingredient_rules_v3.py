@@ -766,24 +766,18 @@ for old, new in corrections.items():
 
 print(f"수정 완료: {correction_count}개 수정")
 
-# 3. 분리 적용
-new_rows = []
-rows_to_remove = []
-
-for idx, row in df.iterrows():
-    if row['ingredient'] in split_rules:
-        rows_to_remove.append(idx)
-        for new_ingredient in split_rules[row['ingredient']]:
-            new_row = row.copy()
-            new_row['ingredient'] = new_ingredient
-            new_rows.append(new_row)
-
-df = df.drop(rows_to_remove)
-if new_rows:
-    new_df = pd.DataFrame(new_rows)
-    df = pd.concat([df, new_df], ignore_index=True)
-
-print(f"분리 완료: {len(rows_to_remove)}개 → {len(new_rows)}개")
+# 3. 분리 적용 (대상 행만 골라 explode로 한 번에 펼침 - 행마다 Series 복사 없음)
+split_mask = df['ingredient'].isin(split_rules.keys())
+split_count = split_mask.sum()
+split_rows = 0
+if split_count:
+    split_df = df[split_mask].copy()
+    split_df['ingredient'] = split_df['ingredient'].map(split_rules)
+    split_df = split_df.explode('ingredient')
+    split_rows = len(split_df)
+    df = pd.concat([df[~split_mask], split_df], ignore_index=True)
+
+print(f"분리 완료: {split_count}개 → {split_rows}개")
 
 # 4. 중복 제거
 before_dedup = len(df)
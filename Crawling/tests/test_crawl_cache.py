@@ -0,0 +1,81 @@
+"""
+제품 크롤링 결과 캐시 테스트 (저장/조회 왕복, TTL 만료)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+crawler = pytest.importorskip('daiso_beauty_crawler')
+
+URL = 'https://www.daisomall.co.kr/pd/pdr/SCR_PDR_0001?pdNo=1234567'
+
+
+def _sample_result():
+    product = dict(crawler.PRODUCT_TEMPLATE, product_code='1234567', category_1='스킨케어', category_2='토너', url=URL)
+    reviews = [
+        {'product_code': '1234567', 'date': '2025.01.01', 'user_masked': 'ab***', 'user': 'user_0001',
+         'rating': 5, 'text': '좋아요', 'image_count': 0},
+    ]
+    ingredients = [{'product_id': '1234567', 'name': '토너', 'ingredient': '정제수'}]
+    return product, reviews, ingredients
+
+
+def _fresh_user_id_map(monkeypatch):
+    """새 실행처럼 user id 매핑을 처음부터 시작"""
+    user_id_map = crawler.defaultdict(lambda: f"user_{len(user_id_map) + 1:04d}")
+    monkeypatch.setattr(crawler, 'user_id_map', user_id_map)
+    return user_id_map
+
+
+@pytest.fixture
+def crawl_cache(tmp_path, monkeypatch):
+    _fresh_user_id_map(monkeypatch)
+    crawler._open_crawl_cache(str(tmp_path / 'crawl_cache.db'))
+    yield
+    crawler._close_crawl_cache()
+
+
+def test_round_trip_remaps_user_ids(crawl_cache, monkeypatch):
+    crawler._put_cached_product(URL, '스킨케어', '토너', True, True, _sample_result())
+
+    # 다음 실행: user id 매핑이 새로 시작하고 다른 사용자가 먼저 id를 받음
+    user_id_map = _fresh_user_id_map(monkeypatch)
+    assert user_id_map['zz***'] == 'user_0001'
+
+    product, reviews, ingredients = crawler._get_cached_product(URL, '스킨케어', '토너', True, True)
+    assert product['product_code'] == '1234567'
+    assert ingredients == _sample_result()[2]
+    assert reviews[0]['user_masked'] == 'ab***'
+    assert reviews[0]['user'] == 'user_0002'
+
+
+def test_key_includes_categories_and_targets(crawl_cache):
+    crawler._put_cached_product(URL, '스킨케어', '토너', True, True, _sample_result())
+
+    assert crawler._get_cached_product(URL, '스킨케어', '에센스', True, True) is None
+    assert crawler._get_cached_product(URL, '스킨케어', '토너', False, True) is None
+
+
+def test_empty_ingredients_not_cached(crawl_cache):
+    product, reviews, _ = _sample_result()
+    crawler._put_cached_product(URL, '스킨케어', '토너', True, True, (product, reviews, []))
+
+    assert crawler._get_cached_product(URL, '스킨케어', '토너', True, True) is None
+
+
+def test_ttl_expiry(crawl_cache, monkeypatch):
+    crawler._put_cached_product(URL, '스킨케어', '토너', True, True, _sample_result())
+    assert crawler._get_cached_product(URL, '스킨케어', '토너', True, True) is not None
+
+    ttl = crawler.CRAWLING_CONFIG['crawl_cache_ttl_days'] * 86400
+    now = crawler.time.time()
+    monkeypatch.setattr(crawler.time, 'time', lambda: now + ttl + 1)
+    assert crawler._get_cached_product(URL, '스킨케어', '토너', True, True) is None
+
+
+def test_no_cache_when_closed():
+    crawler._close_crawl_cache()
+    crawler._put_cached_product(URL, '스킨케어', '토너', True, True, _sample_result())
+    assert crawler._get_cached_product(URL, '스킨케어', '토너', True, True) is None
@@ -0,0 +1,62 @@
+"""
+같은 날 CSV 이어쓰기 재실행 테스트 (이번 실행분 분리, 리뷰 작성자 id 복원)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import csv
+
+import pytest
+
+crawler = pytest.importorskip('daiso_beauty_crawler')
+
+
+def _write_reviews(path, rows):
+    f, writer = crawler._open_csv_writer(str(path), crawler.REVIEW_FIELDS)
+    with f:
+        writer.writerows(rows)
+
+
+def _review(code, masked, user):
+    return {'product_code': code, 'date': '2025.01.01', 'user_masked': masked, 'user': user,
+            'rating': 5, 'text': '좋아요', 'image_count': 0}
+
+
+def _read(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
+
+
+def test_run_delta_contains_only_appended_rows(tmp_path):
+    path = tmp_path / 'reviews.csv'
+    _write_reviews(path, [_review('1', 'ab***', 'user_0001')])
+
+    offset = crawler._csv_size(str(path))
+    _write_reviews(path, [_review('2', 'cd***', 'user_0002'), _review('3', 'ef***', 'user_0003')])
+
+    delta = crawler._write_run_delta(str(path), offset, '120000')
+    assert delta != str(path)
+    assert [row['product_code'] for row in _read(delta)] == ['2', '3']
+    assert len(_read(path)) == 3
+
+
+def test_run_delta_new_file_is_whole_file(tmp_path):
+    path = tmp_path / 'reviews.csv'
+    offset = crawler._csv_size(str(path))
+    _write_reviews(path, [_review('1', 'ab***', 'user_0001')])
+
+    assert crawler._write_run_delta(str(path), offset, '120000') == str(path)
+
+
+def test_restore_user_ids_continues_numbering(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawler, 'user_id_map', crawler.defaultdict(
+        lambda: f"user_{next(crawler._user_id_seq):04d}"))
+    monkeypatch.setattr(crawler, '_user_id_seq', crawler.count(1))
+
+    path = tmp_path / 'reviews.csv'
+    _write_reviews(path, [_review('1', 'ab***', 'user_0001'), _review('2', 'cd***', 'user_0002')])
+
+    crawler._restore_user_ids(str(path))
+    assert crawler.user_id_map['cd***'] == 'user_0002'
+    assert crawler.user_id_map['zz***'] == 'user_0003'
@@ -20,7 +20,6 @@ logger = logging.getLogger(__name__)
 
 # Selenium 설정
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -44,14 +43,11 @@ def get_product_images(url: str):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(2)
 
-        # 상세 이미지 찾기
-        images = driver.find_elements(By.CSS_SELECTOR, "div.editor-content picture img")
-
-        image_urls = []
-        for img in images:
-            src = img.get_attribute("src")
-            if src:
-                image_urls.append(src)
+        # 상세 이미지 src를 한 번의 스크립트 호출로 수집 (이미지마다 get_attribute 왕복 방지)
+        image_urls = driver.execute_script(
+            "return Array.from(document.querySelectorAll('div.editor-content picture img'), img => img.src)"
+            ".filter(src => src);"
+        ) or []
 
         logger.info(f"이미지 {len(image_urls)}개 발견")
 
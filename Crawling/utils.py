@@ -4,10 +4,16 @@
 import time
 import random
 import os
+import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 from config import CRAWLING_CONFIG
 
+# 숫자 추출용 정규식 (호출마다 re 캐시 조회하지 않도록 미리 컴파일)
+_NON_DIGIT_RE = re.compile(r'\D')
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+
 def setup_logger(name, log_file=None):
     """로거 설정"""
     logger = logging.getLogger(name)
@@ -91,10 +97,8 @@ def extract_price(price_text):
     if not price_text:
         return None
 
-    # 숫자와 콤마만 추출
-    import re
-    numbers = re.sub(r'[^\d,]', '', price_text)
-    numbers = numbers.replace(',', '')
+    # 숫자만 추출 (콤마 포함 비숫자 제거)
+    numbers = _NON_DIGIT_RE.sub('', price_text)
 
     try:
         return int(numbers)
@@ -106,8 +110,7 @@ def extract_rating(rating_text):
     if not rating_text:
         return None
 
-    import re
-    match = re.search(r'(\d+\.?\d*)', rating_text)
+    match = _RATING_RE.search(rating_text)
 
     try:
         return float(match.group(1)) if match else None
@@ -119,15 +122,57 @@ def extract_review_count(review_text):
     if not review_text:
         return 0
 
-    import re
-    numbers = re.sub(r'[^\d,]', '', review_text)
-    numbers = numbers.replace(',', '')
+    numbers = _NON_DIGIT_RE.sub('', review_text)
 
     try:
         return int(numbers)
     except:
         return 0
 
+def write_csv(df, filepath):
+    """DataFrame을 CSV로 저장 (pyarrow가 있으면 pyarrow CSV writer 사용, utf-8-sig BOM 유지)"""
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        return filepath
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException:
+        # 타입이 섞인 컬럼 등 변환 불가 시 pandas로 저장
+        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        return filepath
+
+    with open(filepath, 'wb') as f:
+        f.write(b'\xef\xbb\xbf')  # 엑셀 호환용 BOM
+        pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=True))
+
+    return filepath
+
+def csv_to_parquet(csv_path):
+    """
+    CSV를 같은 이름의 Parquet(snappy)로 변환 후 경로 반환 (pyarrow가 없거나 실패하면 None)
+
+    CSV 적재 경로(pd.read_csv)와 같은 DataFrame이 되도록 pandas로 읽어서 변환
+    (빈 칸은 NaN/NULL, 타입 추론도 pandas 기준)
+    """
+    import pandas as pd
+    try:
+        import pyarrow  # to_parquet 엔진
+    except ImportError:
+        return None
+
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    try:
+        pd.read_csv(csv_path, encoding='utf-8-sig').to_parquet(parquet_path, compression='snappy', index=False)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Parquet 변환 실패 ({csv_path}): {str(e)}")
+        return None
+
+    return parquet_path
+
 def save_to_csv(data, filename):
     """데이터를 CSV로 저장"""
     import pandas as pd
@@ -137,15 +182,13 @@ def save_to_csv(data, filename):
 
     filepath = os.path.join(data_dir, filename)
 
-    df = pd.DataFrame(data)
-    df.to_csv(filepath, index=False, encoding='utf-8-sig')
-
-    return filepath
+    return write_csv(pd.DataFrame(data), filepath)
 
 def get_timestamp():
-    """현재 타임스탬프"""
-    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    """현재 타임스탬프 (YYYY-MM-DD HH:MM:SS, strftime 포맷 파싱 없이 생성)"""
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
 
+@lru_cache(maxsize=1)
 def get_date_string():
-    """날짜 문자열"""
+    """날짜 문자열 (실행 단위로 고정 - 자정을 넘겨도 한 번의 크롤링 결과 파일명은 동일)"""
     return datetime.now().strftime('%Y%m%d')
@@ -124,7 +124,8 @@ def label_file(input_path, output_path):
     print(f"라벨링 시작: {len(df)}개 리뷰")
 
     results = []
-    for idx, row in df.iterrows():
+    # iterrows는 행마다 Series를 만들므로 컬럼 값을 dict 레코드로 한 번에 꺼내 순회
+    for idx, row in zip(df.index, df.to_dict('records')):
         label = label_single_review(row)
 
         for asp_label in label['aspect_labels']: